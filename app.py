@@ -4,6 +4,11 @@
 
 import streamlit as st
 import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from taxcore.eitc import PARAMS, calc_eitc, apply_property_adjustment, apply_late_filing_adjustment
+from taxcore.sweep import income_grid, sweep
 
 st.set_page_config(page_title="2024년 근로장려금 계산기", page_icon="💰", layout="centered")
 
@@ -19,16 +24,7 @@ with st.expander("ℹ️ 계산 기준 안내", expanded=False):
     """)
 
 # ------------------------------
-# 1️⃣ 기준 파라미터 (2024년 귀속)
-# ------------------------------
-PARAMS = {
-    "단독":   {"max": 1_650_000, "upper_income": 22_000_000, "phase_in_start": 4_000_000,  "peak_start": 9_000_000,  "peak_end": 14_000_000},
-    "홑벌이": {"max": 2_850_000, "upper_income": 32_000_000, "phase_in_start": 7_000_000,  "peak_start": 14_000_000, "peak_end": 21_000_000},
-    "맞벌이": {"max": 3_300_000, "upper_income": 44_000_000, "phase_in_start": 8_000_000,  "peak_start": 17_000_000, "peak_end": 26_000_000},
-}
-
-# ------------------------------
-# 2️⃣ 사용자 입력
+# 1️⃣ 사용자 입력
 # ------------------------------
 col1, col2 = st.columns(2)
 with col1:
@@ -42,45 +38,7 @@ late_filing = st.checkbox("기한 후 신고 여부", value=False, help="체크
 st.divider()
 
 # ------------------------------
-# 3️⃣ 근로장려금 계산 함수
-# ------------------------------
-def calc_eitc(income: int, params: dict) -> int:
-    """소득에 따른 근로장려금 계산 (선형 근사)"""
-    max_amt = params["max"]
-    s = params["phase_in_start"]
-    peak_start = params["peak_start"]
-    peak_end = params["peak_end"]
-    upper = params["upper_income"]
-
-    if income < s:
-        return 0
-    if s <= income < peak_start:
-        span = peak_start - s
-        return int(max_amt * (income - s) / span)
-    if peak_start <= income <= peak_end:
-        return int(max_amt)
-    if peak_end < income < upper:
-        span = upper - peak_end
-        return int(max_amt * (upper - income) / span)
-    return 0
-
-def apply_property_adjustment(amount: int, prop: int) -> tuple[int, str]:
-    """재산 기준 감액 또는 제외"""
-    if prop <= 140_000_000:
-        return amount, "정상 지급"
-    elif 140_000_000 < prop <= 240_000_000:
-        return int(amount * 0.5), "재산기준 감액(50%)"
-    else:
-        return 0, "재산기준 초과(미지급)"
-
-def apply_late_filing_adjustment(amount: int, is_late: bool) -> tuple[int, str]:
-    """기한 후 신고 감액"""
-    if not is_late:
-        return amount, ""
-    return int(amount * 0.9), "기한 후 신고 감액(10%)"
-
-# ------------------------------
-# 4️⃣ 계산 로직
+# 2️⃣ 계산 로직
 # ------------------------------
 params = PARAMS[hh_type]
 base_amount = calc_eitc(income, params)
@@ -88,7 +46,7 @@ prop_adjusted, prop_note = apply_property_adjustment(base_amount, property_value
 final_amount, late_note = apply_late_filing_adjustment(prop_adjusted, late_filing)
 
 # ------------------------------
-# 5️⃣ 팝업(알림) 표시 로직
+# 3️⃣ 팝업(알림) 표시 로직
 # ------------------------------
 if final_amount == 0:
     if prop_note == "재산기준 초과(미지급)":
@@ -101,7 +59,7 @@ else:
     st.success("✅ 정상지급 — 모든 조건 충족으로 정상 지급됩니다.")
 
 # ------------------------------
-# 6️⃣ 결과 표시
+# 4️⃣ 결과 표시
 # ------------------------------
 st.subheader("📊 계산 결과")
 st.metric(label="예상 근로장려금 지급액", value=f"{final_amount:,.0f} 원")
@@ -129,6 +87,29 @@ with st.expander("📋 계산 상세"):
         "지급 판정": " / ".join(notes),
     })
 
+# ------------------------------
+# 5️⃣ 소득별 지급액 곡선
+# ------------------------------
+# 재산·기한후신고 조건별로 전체 소득 격자를 한 번 계산해 캐시 → 소득만 바꾸면 재계산 없이 위치만 표시
+@st.cache_data
+def eitc_curves(property_value, late_filing):
+    return sweep(income_grid(50_000_000, 100_000), property_values=[property_value], late_filing=late_filing)
+
+with st.expander("📈 소득별 지급액 곡선", expanded=False):
+    curve = eitc_curves(property_value, late_filing).curve(hh_type, property_value)
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig.add_trace(go.Scatter(x=curve["income"], y=curve["eitc"], name="근로장려금", mode="lines"))
+    fig.add_trace(go.Scatter(x=curve["income"], y=curve["marginal_rate"] * 100, name="실효 한계세율(%)",
+                             mode="lines", line=dict(dash="dot")), secondary_y=True)
+    fig.add_trace(go.Scatter(x=[income], y=[final_amount], name="현재 입력", mode="markers",
+                             marker=dict(size=12, color="red")))
+    fig.update_layout(xaxis_title="연간 총소득(원)", legend=dict(orientation="h"))
+    fig.update_yaxes(title_text="지급액(원)", secondary_y=False)
+    fig.update_yaxes(title_text="실효 한계세율(%)", secondary_y=True)
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption("실효 한계세율 = 1 − (순소득 증가분 ÷ 소득 증가분), 순소득 = 소득 − 종합소득세·지방소득세 + 근로장려금 "
+               "(총소득을 과세표준으로 간주한 근사)")
+
 st.divider()
 st.markdown("""
 **참고 기준 (2024년 귀속)**  
@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+# 계산기 성능 측정 스크립트 모음 (실행: python -m benchmarks.<모듈명>)
@@ -0,0 +1,121 @@
+# benchmarks/bench_answers.py
+# 챗봇 로컬 계산 경로(taxdata.answers.local_answer) – 질문 템플릿 회귀 검사 + 질문당 지연
+# 실행: python -m benchmarks.bench_answers [--rows 100000] [--number 2000]
+#
+# CASES 의 질문마다 로컬 경로가 답하는지(템플릿 이름) 또는 모델에 넘기는지(None)를 확인하고,
+# 로컬로 답한 값은 pandas 로 직접 계산한 값과 비교한다. 하나라도 다르면 종료 코드 1.
+
+import argparse
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from taxdata.answers import local_answer, match_question
+from taxdata.dataset import TaxDataset
+from taxdata.query import DatasetIndex
+
+# (질문, 맞아야 하는 템플릿 – None 이면 로컬 경로가 답하면 안 됨)
+CASES = [
+    ("평균 세율?", "effective_rate"),
+    ("평균 세율이 얼마인가요?", "effective_rate"),
+    ("평균 소득은?", "income_mean"),
+    ("전체 평균 세금은 얼마예요", "tax_mean"),
+    ("가장 높은 소득자는 누구인가요?", "income_max"),
+    ("최저 소득자는?", "income_min"),
+    ("소득이 5000원 이상인 사람은 몇 명인가요?", "count_income"),
+    ("소득 1억원 이상인 사람 수는?", None),                     # 억 단위는 지원하지 않음
+    ("소득 1,500만원 이하인 사람은 몇 명?", "count_income"),
+    ("5000원 이상 소득자는 몇 명인가요?", "count_income"),      # tax_app.py 챗봇 예시 질문
+    ("1,000만원 초과인 소득자 수는?", "count_income"),
+    ("5000원 이상 소득자의 평균 세금은?", None),
+    ("소득 중앙값은?", "median_income"),
+    ("중위 소득이 얼마인가요", "median_income"),
+    ("소득 상위 5명은 누구인가요?", "top_k_income"),
+    ("소득 하위 3명", "top_k_income"),
+    ("총 인원은?", "total_count"),
+    ("몇 명인가요?", "total_count"),
+    # 조건·비교·다른 내용어가 붙은 질문은 모델에 넘긴다
+    ("소득 5000원 이상이면서 세금 500원 이하인 사람은 몇 명인가요?", None),
+    ("평균 소득보다 많이 버는 사람은 몇 명인가요?", None),
+    ("평균 세율이 가장 높은 사람은 누구인가요?", None),
+    ("최고 소득자의 세금은 얼마인가요?", None),
+    ("가장 높은 소득자와 가장 낮은 소득자의 소득 차이는?", None),
+    ("최고 소득 세율은?", None),
+    ("소득 상위 5명의 평균 세율은?", None),
+    ("세금이 가장 높은 사람은?", None),
+]
+
+
+def make_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    income = rng.integers(0, 100_000_000, rows)
+    return pd.DataFrame({"name": [f"사람{i % 5000}" for i in range(rows)],
+                         "income": income, "tax": income // rng.integers(5, 20, rows)})
+
+
+def expected_number(name: str, question: str, df: pd.DataFrame):
+    """템플릿별 답변의 핵심 숫자를 pandas 로 직접 계산 (답변 문자열에 그대로 들어 있어야 함)"""
+    if name == "effective_rate":
+        return f"{df['tax'].sum() / df['income'].sum() * 100:.2f}%"
+    if name == "income_mean":
+        return f"{df['income'].mean():,.0f}원"
+    if name == "tax_mean":
+        return f"{df['tax'].mean():,.0f}원"
+    if name == "income_max":
+        return f"{df['income'].max():,}원"
+    if name == "income_min":
+        return f"{df['income'].min():,}원"
+    if name == "median_income":
+        return f"{df['income'].median():,.0f}원"
+    if name == "total_count":
+        return f"{len(df):,}명"
+    _, match = match_question(question)
+    if name == "count_income":
+        amount = round(float(match.group(1).replace(",", "")) * (10_000 if match.group(2) else 1))
+        income = df["income"]
+        n = {"이상": income >= amount, "초과": income > amount,
+             "이하": income <= amount, "미만": income < amount}[match.group(3)].sum()
+        return f"**{n:,}명**"
+    k = int(match.group(2))
+    top = df["income"].nlargest(k) if match.group(1) == "상위" else df["income"].nsmallest(k)
+    return f"{top.iloc[-1]:,}원"
+
+
+def check_cases(df: pd.DataFrame, dataset, index) -> int:
+    failures = 0
+    for question, expected in CASES:
+        name, _ = match_question(question)
+        answer = local_answer(question, dataset, index)
+        ok = name == expected and (answer is None) == (expected is None)
+        if ok and expected is not None:
+            ok = expected_number(expected, question, df) in answer
+        if not ok:
+            failures += 1
+            print(f"❌ {question!r}: 템플릿 {name} (기대 {expected}) → {answer!r}")
+    return failures
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="챗봇 로컬 계산 경로 회귀 검사 + 지연")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--number", type=int, default=2_000)
+    args = parser.parse_args(argv)
+
+    df = make_frame(args.rows)
+    dataset = TaxDataset.from_frame(df)
+    index = DatasetIndex(dataset)
+
+    failures = check_cases(df, dataset, index)
+    print(f"cases     : {len(CASES)} (불일치 {failures}건)")
+    for question in ("평균 세율이 얼마인가요?", "소득 1,500만원 이하인 사람은 몇 명?",
+                     "최고 소득자의 세금은 얼마인가요?"):
+        us = min(timeit.repeat(lambda: local_answer(question, dataset, index),
+                               number=args.number, repeat=5)) / args.number * 1e6
+        print(f"{question:<30} {us:8.1f} µs")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
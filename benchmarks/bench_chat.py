@@ -0,0 +1,69 @@
+# benchmarks/bench_chat.py
+# 챗봇 응답 지연 비교 – 메시지마다 새 클라이언트 + 비스트리밍 호출(이전) vs 풀링된 스트리밍 백엔드
+# 실행: python -m benchmarks.bench_chat [--messages 30] [--first-token-delay 0.05] [--token-delay 0.01]
+#
+# 실제 API 대신 로컬 스텁 서버(taxdata.chat_stub)를 쓴다. 사용자가 답변을 처음 보는 시점은
+# 이전 방식에선 전체 응답 완료 시점이고, 스트리밍 방식에선 첫 토큰 도착 시점(TTFT)이다.
+
+import argparse
+import statistics
+import sys
+import time
+
+from taxdata.chat import ChatBackend
+from taxdata.chat_stub import StubChatServer
+
+MESSAGES = [{"role": "user", "content": "평균 세율이 얼마인가요?"}]
+
+
+def legacy_chat(api_key: str, base_url: str) -> str:
+    """이전 tax_app.chat_with_ai – 호출마다 OpenAI 클라이언트를 새로 만든다"""
+    from openai import OpenAI
+    client = OpenAI(api_key=api_key, base_url=base_url)
+    response = client.chat.completions.create(model="gpt-4o", messages=MESSAGES,
+                                              max_tokens=1000, temperature=0.7)
+    return response.choices[0].message.content
+
+
+def p50_ms(values) -> float:
+    return statistics.median(values) * 1000
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=30)
+    parser.add_argument("--first-token-delay", type=float, default=0.05)
+    parser.add_argument("--token-delay", type=float, default=0.01)
+    args = parser.parse_args(argv)
+
+    backend = ChatBackend()
+    with StubChatServer(first_token_delay=args.first_token_delay, token_delay=args.token_delay) as server:
+        legacy_chat("stub", server.base_url)            # import·워밍업
+        backend.complete(MESSAGES, api_key="stub", base_url=server.base_url)
+
+        legacy = []
+        for _ in range(args.messages):
+            t0 = time.perf_counter()
+            reply = legacy_chat("stub", server.base_url)
+            legacy.append(time.perf_counter() - t0)
+
+        ttft, total = [], []
+        for _ in range(args.messages):
+            stream = backend.stream(MESSAGES, api_key="stub", base_url=server.base_url)
+            text = stream.result()
+            if stream.error is not None or text != reply:
+                print(f"❌ 스트리밍 응답 불일치: {text!r}")
+                return 1
+            ttft.append(stream.ttft)
+            total.append(stream.elapsed)
+    backend.close()
+
+    print(f"messages               : {args.messages}")
+    print(f"이전 (새 클라이언트) p50 : 첫 글자 {p50_ms(legacy):7.1f} ms / 완료 {p50_ms(legacy):7.1f} ms")
+    print(f"스트리밍 (풀링)     p50 : 첫 글자 {p50_ms(ttft):7.1f} ms / 완료 {p50_ms(total):7.1f} ms")
+    print(f"첫 글자까지 단축        : {p50_ms(legacy) / p50_ms(ttft):,.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
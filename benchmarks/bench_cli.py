@@ -0,0 +1,85 @@
+# benchmarks/bench_cli.py
+# 일괄 계산 CLI(taxcore.cli) 처리량·코어 확장성 측정
+# 실행: python -m benchmarks.bench_cli [--rows 10000000] [--format parquet] [--workers 1,2,4,8]
+#
+# 가상 가구 데이터를 임시 파일로 만든 뒤 작업자 수별로 run() 을 실행해 행/초와
+# 작업자 1개 대비 확장 효율(= 배율 / 작업자 수)을 보고한다. 출력은 작업자 수와 무관하게 같아야 한다.
+
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from taxcore.cli import run
+from taxcore.eitc import HOUSEHOLD_TYPES
+
+
+def make_households(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "income": rng.integers(0, 60_000_000, rows),
+        "household_type": pd.Categorical.from_codes(rng.integers(0, 3, rows), HOUSEHOLD_TYPES),
+        "property_value": rng.integers(0, 300_000_000, rows),
+        "late_filing": rng.random(rows) < 0.1,
+    })
+
+
+def output_digest(path: str, fmt: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    if fmt == "csv":
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+    else:
+        h.update(pd.util.hash_pandas_object(pd.read_parquet(path), index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=("csv", "parquet"), default="parquet")
+    parser.add_argument("--workers", default=None, help="쉼표로 구분 (기본: 1, 2, 4 … CPU 코어 수)")
+    parser.add_argument("--shard-mb", type=float, default=16)
+    args = parser.parse_args(argv)
+
+    cpus = os.cpu_count() or 1
+    if args.workers:
+        counts = [int(w) for w in args.workers.split(",")]
+    else:
+        counts = sorted({1, cpus} | {2 ** k for k in range(1, cpus.bit_length()) if 2 ** k <= cpus})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, f"households.{args.format}")
+        df = make_households(args.rows)
+        if args.format == "csv":
+            df.to_csv(src, index=False)
+        else:
+            df.to_parquet(src, index=False, row_group_size=250_000)
+        del df
+
+        print(f"rows: {args.rows:,} · format: {args.format} · CPU: {cpus}")
+        print(f"{'workers':>7} | {'시간':>8} | {'행/초':>12} | {'배율':>6} | {'효율':>5}")
+        base, digest = None, None
+        for workers in counts:
+            out = os.path.join(tmp, f"out-{workers}.{args.format}")
+            summary = run(src, out, workers=workers, shard_mb=args.shard_mb, progress=False)
+            d = output_digest(out, args.format)
+            if digest is not None and d != digest:
+                print(f"❌ 작업자 {workers}개 결과가 1개일 때와 다릅니다")
+                return 1
+            digest = d
+            os.remove(out)
+            base = base or summary["seconds"]
+            speedup = base / summary["seconds"]
+            print(f"{summary['workers']:>7} | {summary['seconds']:>7.2f}s | {summary['rows_per_sec']:>12,.0f} | "
+                  f"{speedup:>5.2f}x | {speedup / summary['workers']:>5.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
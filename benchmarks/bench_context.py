@@ -0,0 +1,53 @@
+# benchmarks/bench_context.py
+# 챗봇 데이터 컨텍스트 크기 비교 – df.to_string() 전체(이전) vs 크기 제한 요약(build_context)
+# 실행: python -m benchmarks.bench_context [--sizes 6,1000,10000,100000,1000000] [--max-tokens 1500]
+#
+# 요약 컨텍스트의 추정 토큰 수가 행 수와 무관하게 --max-tokens 이하인지 확인한다.
+# to_string() 은 --full-limit 행까지만 측정한다 (그 이상은 시간·메모리가 너무 든다).
+
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from taxdata.context import build_context, estimate_tokens
+from taxdata.dataset import TaxDataset
+
+
+def make_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    income = rng.integers(1_000, 10_000, rows)
+    return pd.DataFrame({
+        "name": [f"P{i}" for i in range(rows)],
+        "income": income,
+        "tax": income // 10,
+    })
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="6,1000,10000,100000,1000000")
+    parser.add_argument("--max-tokens", type=int, default=1_500)
+    parser.add_argument("--full-limit", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    failed = False
+    print(f"{'rows':>10} | {'to_string 토큰':>14} | {'요약 토큰':>9} | {'요약 생성':>9}")
+    for rows in (int(s) for s in args.sizes.split(",")):
+        dataset = TaxDataset.from_frame(make_frame(rows))
+        full = f"{estimate_tokens(dataset.frame().to_string()):,}" if rows <= args.full_limit else "-"
+        t0 = time.perf_counter()
+        context = build_context(dataset, max_tokens=args.max_tokens)
+        elapsed = time.perf_counter() - t0
+        print(f"{rows:>10,} | {full:>14} | {context.tokens:>9,} | {elapsed * 1000:>7.1f}ms")
+        failed |= context.tokens > args.max_tokens
+    if failed:
+        print(f"❌ 요약 컨텍스트가 토큰 예산({args.max_tokens:,})을 넘었습니다")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
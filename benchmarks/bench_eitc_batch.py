@@ -0,0 +1,76 @@
+# benchmarks/bench_eitc_batch.py
+# 근로장려금 일괄 계산 엔진 vs 행 단위 df.apply 처리량 비교
+# 실행: python -m benchmarks.bench_eitc_batch [--rows 200000] [--min-speedup 50]
+
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from taxcore.batch import calc_eitc_batch
+from taxcore.eitc import (
+    HOUSEHOLD_TYPES,
+    PARAMS,
+    apply_late_filing_adjustment,
+    apply_property_adjustment,
+    calc_eitc,
+    payment_status,
+)
+
+
+def make_households(rows: int, seed: int = 0) -> pd.DataFrame:
+    """가구 합성 데이터 생성 (소득 0~5천만, 재산 0~3억)"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "income": rng.integers(0, 50_000_000, rows),
+        "household_type": rng.choice(np.array(HOUSEHOLD_TYPES, dtype=object), rows),
+        "property_value": rng.integers(0, 300_000_000, rows),
+        "late_filing": rng.random(rows) < 0.2,
+    })
+
+
+def scalar_row(row) -> tuple[int, int, int, int]:
+    base = calc_eitc(row["income"], PARAMS[row["household_type"]])
+    prop_adjusted, prop_note = apply_property_adjustment(base, row["property_value"])
+    final, late_note = apply_late_filing_adjustment(prop_adjusted, row["late_filing"])
+    return base, prop_adjusted, final, payment_status(final, prop_note, late_note)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--min-speedup", type=float, default=50.0)
+    args = parser.parse_args(argv)
+
+    df = make_households(args.rows)
+
+    t0 = time.perf_counter()
+    expected = df.apply(scalar_row, axis=1, result_type="expand").to_numpy()
+    t_apply = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    result = calc_eitc_batch(df["income"].to_numpy(), df["household_type"].to_numpy(),
+                             df["property_value"].to_numpy(), df["late_filing"].to_numpy())
+    t_batch = time.perf_counter() - t0
+
+    got = np.column_stack(result)
+    if not np.array_equal(got, expected):
+        bad = np.flatnonzero((got != expected).any(axis=1))
+        print(f"❌ 결과 불일치: {len(bad)}건 (예: 행 {bad[:5].tolist()})")
+        return 1
+
+    speedup = t_apply / t_batch
+    print(f"rows           : {args.rows:,}")
+    print(f"df.apply       : {t_apply:.3f}s ({args.rows / t_apply:,.0f} rows/s)")
+    print(f"calc_eitc_batch: {t_batch:.3f}s ({args.rows / t_batch:,.0f} rows/s)")
+    print(f"speedup        : {speedup:,.1f}x")
+    if speedup < args.min_speedup:
+        print(f"❌ 목표 배율({args.min_speedup:.0f}x) 미달")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
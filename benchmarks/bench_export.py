@@ -0,0 +1,104 @@
+# benchmarks/bench_export.py
+# 내보내기 시간·최대 메모리 비교 – 이전(to_csv 통째로 / pandas ExcelWriter + openpyxl) vs taxdata.export
+# 실행: python -m benchmarks.bench_export [--rows 1000000] [--cases csv_legacy,csv,...]
+#
+# 경우마다 새 인터프리터에서 데이터를 만든 뒤 앱과 같은 경로로 내보낸다 – 다운로드 버튼에 넘길
+# bytes 를 메모리에 만들고(이전: BytesIO/to_csv, 현재: export_bytes) 크기 확인용으로 임시 파일에 쓴다.
+# 내보내기 전후 최대 RSS(ru_maxrss) 증가분을 최대 메모리로 보고한다. (Linux/macOS)
+# xlsx_legacy 는 100만 행 기준 수 분이 걸릴 수 있다.
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from taxdata.export import export_bytes
+
+CASES = ("csv_legacy", "csv", "xlsx_legacy", "xlsx_xlsxwriter", "xlsx_openpyxl", "parquet", "arrow")
+
+
+def make_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """이름은 범주 코드로 만든다 (문자열 100만 개를 만들면 기준 최대 메모리가 올라가 측정이 가려짐)"""
+    rng = np.random.default_rng(seed)
+    income = rng.integers(1_000, 10_000, rows)
+    return pd.DataFrame({
+        "name": pd.Categorical.from_codes(np.arange(rows) % 50_000, [f"P{i}" for i in range(50_000)]),
+        "income": income,
+        "tax": income // 10,
+    })
+
+
+def _max_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / 1024 if sys.platform == "darwin" else rss / 1024
+
+
+def run_case(case: str, rows: int) -> dict:
+    df = make_frame(rows)
+    fd, path = tempfile.mkstemp()
+    os.close(fd)
+    try:
+        before = _max_rss_mb()
+        t0 = time.perf_counter()
+        if case == "csv_legacy":
+            data = df.to_csv(index=False).encode("utf-8-sig")
+            with open(path, "wb") as f:
+                f.write(data)
+        elif case == "xlsx_legacy":
+            output = BytesIO()
+            with pd.ExcelWriter(output, engine="openpyxl") as writer:
+                df.to_excel(writer, sheet_name="데이터", index=False)
+            with open(path, "wb") as f:
+                f.write(output.getvalue())
+        else:
+            if case.startswith("xlsx_"):
+                data = export_bytes(df, "xlsx", engine=case.split("_", 1)[1])
+            else:
+                data = export_bytes(df, case)
+            with open(path, "wb") as f:
+                f.write(data)
+        seconds = time.perf_counter() - t0
+        return {"case": case, "seconds": seconds, "peak_mb": _max_rss_mb() - before,
+                "size_mb": os.path.getsize(path) / 1024 / 1024}
+    finally:
+        os.remove(path)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--cases", default=",".join(CASES))
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_case(args.child, args.rows)))
+        return 0
+
+    print(f"rows: {args.rows:,}")
+    print(f"{'case':<16} | {'시간':>8} | {'최대 메모리 증가':>14} | {'파일 크기':>9}")
+    for case in args.cases.split(","):
+        if case not in CASES:
+            print(f"❌ 알 수 없는 경우: {case} (가능: {', '.join(CASES)})")
+            return 1
+        proc = subprocess.run([sys.executable, "-m", "benchmarks.bench_export",
+                               "--rows", str(args.rows), "--child", case],
+                              capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(f"{case:<16} | 실패: {proc.stderr.strip().splitlines()[-1]}")
+            continue
+        r = json.loads(proc.stdout)
+        print(f"{case:<16} | {r['seconds']:>7.2f}s | {r['peak_mb']:>12.1f}MB | {r['size_mb']:>7.1f}MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
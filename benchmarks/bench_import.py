@@ -0,0 +1,62 @@
+# benchmarks/bench_import.py
+# 계산 코어(taxcore) import 시간 측정 – 무거운 패키지를 끌어오면 실패
+# 실행: python -m benchmarks.bench_import [--repeat 5] [--budget-ms 50]
+#
+# 매 회 새 인터프리터에서 코어 함수를 import 한 뒤, 걸린 시간과
+# sys.modules 에 올라온 금지 패키지(streamlit/pandas/plotly/openai/numpy)를 확인한다.
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+FORBIDDEN = ("streamlit", "pandas", "plotly", "openai", "numpy")
+
+# 배치 작업자가 실제로 쓰는 import 경로
+PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+from taxcore import calc_eitc, apply_property_adjustment, apply_late_filing_adjustment
+from taxcore import get_eitc_amount, get_max_eitc, calculate_income_tax
+from taxcore.eitc_age import calc_eitc as calc_eitc_age
+elapsed = time.perf_counter() - t0
+loaded = sorted({m.split('.')[0] for m in sys.modules} & set(json.loads(sys.argv[1])))
+print(json.dumps({"elapsed": elapsed, "loaded": loaded}))
+"""
+
+
+def probe_once() -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, json.dumps(FORBIDDEN)],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(out.stdout)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="taxcore import 시간 측정")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    args = parser.parse_args(argv)
+
+    runs = [probe_once() for _ in range(args.repeat)]
+    times_ms = [r["elapsed"] * 1000 for r in runs]
+    loaded = sorted({m for r in runs for m in r["loaded"]})
+    median_ms = statistics.median(times_ms)
+
+    print(f"import taxcore (median of {args.repeat}): {median_ms:.2f} ms")
+    print(f"min / max: {min(times_ms):.2f} / {max(times_ms):.2f} ms")
+
+    ok = True
+    if loaded:
+        print(f"❌ 금지 패키지가 로드됨: {', '.join(loaded)}")
+        ok = False
+    if median_ms > args.budget_ms:
+        print(f"❌ import 시간 예산({args.budget_ms:.0f} ms) 초과")
+        ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+# benchmarks/bench_net_income.py
+# 순소득 파이프라인 vs 세금·근로장려금 따로 계산 – 행 단위 스칼라 / 따로 일괄 계산 / 한 번에 계산
+# 실행: python -m benchmarks.bench_net_income [--rows 1000000] [--scalar-rows 100000]
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from taxcore.batch import calc_eitc_batch
+from taxcore.eitc import HOUSEHOLD_TYPES, PARAMS, apply_late_filing_adjustment, apply_property_adjustment, calc_eitc
+from taxcore.income_tax import INCOME_TAX_2025
+from taxcore.net_income import calc_net_income_batch
+
+
+def make_households(rows: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    return (
+        rng.integers(0, 150_000_000, rows),
+        rng.choice(np.array(HOUSEHOLD_TYPES, dtype=object), rows),
+        rng.integers(0, 300_000_000, rows),
+        rng.random(rows) < 0.2,
+    )
+
+
+def separate_scalar(income, household_type, prop, late) -> list[int]:
+    """app.py 와 tax.py 를 따로 돌리던 방식 – 가구마다 스칼라 함수 두 벌"""
+    net = []
+    for i, h, p, l in zip(income.tolist(), household_type.tolist(), prop.tolist(), late.tolist()):
+        amount, _ = apply_property_adjustment(calc_eitc(i, PARAMS[h]), p)
+        amount, _ = apply_late_filing_adjustment(amount, l)
+        tax, local = INCOME_TAX_2025.calculate_with_local(i)
+        net.append(i - tax - local + amount)
+    return net
+
+
+def separate_batch(income, household_type, prop, late) -> np.ndarray:
+    eitc = calc_eitc_batch(income, household_type, prop, late)
+    tax = INCOME_TAX_2025.calculate_batch(income)
+    return income - tax.total_tax + eitc.final_amount
+
+
+def best_of(fn, repeat: int = 3) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--scalar-rows", type=int, default=100_000, help="스칼라 방식은 이 행 수로 재고 환산")
+    args = parser.parse_args(argv)
+
+    data = make_households(args.rows)
+    small = tuple(col[:args.scalar_rows] for col in data)
+
+    scalar_t, scalar_net = best_of(lambda: separate_scalar(*small), repeat=1)
+    if calc_net_income_batch(*small).net_income.tolist() != scalar_net:
+        print("❌ 파이프라인 결과가 스칼라 계산과 다릅니다")
+        return 1
+
+    sep_t, sep_net = best_of(lambda: separate_batch(*data))
+    pipe_t, pipe = best_of(lambda: calc_net_income_batch(*data))
+    if not np.array_equal(pipe.net_income, sep_net):
+        print("❌ 파이프라인 결과가 따로 계산한 결과와 다릅니다")
+        return 1
+
+    scalar_t *= args.rows / len(small[0])
+    print(f"rows: {args.rows:,}")
+    print(f"{'방식':<22} | {'시간':>9} | {'행/초':>13}")
+    for label, t in (("따로 – 행 단위 스칼라*", scalar_t), ("따로 – 일괄 계산 2회", sep_t), ("파이프라인 1회", pipe_t)):
+        print(f"{label:<22} | {t:>8.3f}s | {args.rows / t:>13,.0f}")
+    print(f"* {len(small[0]):,}행으로 측정해 환산")
+    print(f"파이프라인: 스칼라 대비 {scalar_t / pipe_t:,.0f}배, 따로 일괄 계산 대비 {sep_t / pipe_t:.2f}배")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+# benchmarks/bench_params.py
+# 파라미터 레지스트리 도입 전/후 호출당 오버헤드 비교
+# 실행: python -m benchmarks.bench_params [--number 200000]
+#
+# "이전" 구현은 호출마다 dict 산정표를 새로 만들고 구간 폭을 다시 계산하던
+# earned_income_credit_2025.py / work1.py 원본 함수를 그대로 옮겨 둔 것이다.
+
+import argparse
+import sys
+import timeit
+
+from taxcore.eitc_2025 import get_eitc_amount
+from taxcore.eitc_age import calc_eitc as calc_eitc_age
+from taxcore.params import get_schedule
+
+
+def legacy_get_eitc_amount(income: int, household_type: str) -> int:
+    table = {
+        "단독": {"max": 1650000, "min_income": 400, "peak_income": 900, "phaseout_income": 2200},
+        "홑벌이": {"max": 2850000, "min_income": 700, "peak_income": 1400, "phaseout_income": 3200},
+        "맞벌이": {"max": 3300000, "min_income": 800, "peak_income": 1700, "phaseout_income": 4400},
+    }
+    if household_type not in table:
+        raise ValueError("가구 유형은 '단독', '홑벌이', '맞벌이' 중 하나여야 합니다.")
+    t = table[household_type]
+    inc = income
+    if inc < t["min_income"]:
+        return 0
+    elif inc <= t["peak_income"]:
+        return int(t["max"] * (inc - t["min_income"]) / (t["peak_income"] - t["min_income"]))
+    elif inc <= t["phaseout_income"]:
+        return int(t["max"] * (t["phaseout_income"] - inc) / (t["phaseout_income"] - t["peak_income"]))
+    else:
+        return 0
+
+
+def legacy_calc_eitc_age(income: int, household_type: str, age: int) -> int:
+    eitc_table = {
+        '단독':  {'max': 1500000, 'max_start': 0, 'max_end': 400, 'reduce_start': 900, 'reduce_end': 2200},
+        '홑벌이': {'max': 2600000, 'max_start': 0, 'max_end': 700, 'reduce_start': 1700, 'reduce_end': 3600},
+        '맞벌이': {'max': 3000000, 'max_start': 0, 'max_end': 800, 'reduce_start': 2000, 'reduce_end': 4000}
+    }
+    if household_type not in eitc_table:
+        raise ValueError("household_type은 '단독', '홑벌이', '맞벌이' 중 하나여야 합니다.")
+    info = eitc_table[household_type]
+    income_m = income
+    if income_m <= info['max_end']:
+        amount = info['max']
+    elif income_m <= info['reduce_start']:
+        amount = info['max']
+    elif income_m <= info['reduce_end']:
+        ratio = 1 - (income_m - info['reduce_start']) / (info['reduce_end'] - info['reduce_start'])
+        amount = int(info['max'] * ratio)
+    else:
+        amount = 0
+    if age >= 65:
+        amount = int(amount * 1.1)
+    return max(amount, 0)
+
+
+def check_equivalence() -> tuple[int, int]:
+    """만원 단위 0~5000 전 구간 비교 – (2025 불일치 수, work1 불일치 수)"""
+    d2025 = d_age = 0
+    for household_type in ("단독", "홑벌이", "맞벌이"):
+        for income in range(0, 5001):
+            d2025 += legacy_get_eitc_amount(income, household_type) != get_eitc_amount(income, household_type)
+            for age in (40, 70):
+                d_age += calc_eitc_age(income, household_type, age) != legacy_calc_eitc_age(income, household_type, age)
+    return d2025, d_age
+
+
+def per_call_ns(stmt, number: int) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="파라미터 레지스트리 호출당 오버헤드 비교")
+    parser.add_argument("--number", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    get_schedule(2025)
+    get_schedule(2025, "age_bonus")
+
+    d2025, d_age = check_equivalence()
+    print(f"equivalence: get_eitc_amount 불일치 {d2025}건, work1 calc_eitc 불일치 {d_age}건")
+
+    n = args.number
+    rows = [
+        ("get_eitc_amount", lambda: legacy_get_eitc_amount(1500, "홑벌이"), lambda: get_eitc_amount(1500, "홑벌이")),
+        ("work1 calc_eitc", lambda: legacy_calc_eitc_age(2500, "맞벌이", 70), lambda: calc_eitc_age(2500, "맞벌이", 70)),
+    ]
+    print(f"{'function':<18}{'before (ns)':>14}{'after (ns)':>14}{'ratio':>9}")
+    for label, before, after in rows:
+        b, a = per_call_ns(before, n), per_call_ns(after, n)
+        print(f"{label:<18}{b:>14.0f}{a:>14.0f}{b / a:>8.2f}x")
+    return 1 if d2025 or d_age else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
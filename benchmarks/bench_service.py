@@ -0,0 +1,136 @@
+# benchmarks/bench_service.py
+# 계산 HTTP API(taxcore.service) 부하 테스트 – 동시 접속 수별 p50/p99 지연과 처리량 (로컬 전용)
+# 실행: python -m benchmarks.bench_service [--concurrency 1,8,32,128] [--requests 2000] [--compare]
+#
+# 127.0.0.1 의 빈 포트에 서버 프로세스(python -m taxcore.service)를 띄우고
+# 동시 접속마다 keep-alive 연결 하나로 단건 요청을 보낸다 (httpx 는 상태 확인에만 사용).
+# --compare 를 주면 마이크로 배칭을 끈 서버로 같은 측정을 반복한다.
+
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+from taxcore.eitc import HOUSEHOLD_TYPES
+
+ENDPOINTS = ("eitc", "eitc-2025", "income-tax", "net-income")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class LocalServer:
+    """별도 프로세스의 uvicorn 서버 (클라이언트와 GIL 을 나눠 쓰지 않도록)"""
+
+    def __init__(self, batching: bool = True):
+        self.port = free_port()
+        self.args = [sys.executable, "-m", "taxcore.service", "--port", str(self.port)]
+        if not batching:
+            self.args.append("--no-batching")
+        self.proc = None
+
+    def __enter__(self):
+        self.proc = subprocess.Popen(self.args)
+        base_url = f"http://127.0.0.1:{self.port}"
+        for _ in range(500):
+            try:
+                httpx.get(f"{base_url}/health", timeout=1)
+                return base_url
+            except httpx.TransportError:
+                time.sleep(0.02)
+        self.proc.kill()
+        raise RuntimeError("서버가 시작되지 않았습니다.")
+
+    def __exit__(self, *exc):
+        self.proc.terminate()
+        self.proc.wait()
+
+
+def payload(endpoint: str, i: int) -> dict:
+    household_type = HOUSEHOLD_TYPES[i % 3]
+    if endpoint in ("eitc", "net-income"):
+        return {"income": (i * 37_000) % 40_000_000, "household_type": household_type,
+                "property_value": (i * 7_000_000) % 300_000_000, "late_filing": i % 5 == 0}
+    if endpoint == "eitc-2025":
+        return {"income": i % 5_000, "household_type": household_type}
+    return {"income": (i * 1_234_567) % 2_000_000_000}
+
+
+async def _post(reader, writer, host: str, path: str, body: bytes) -> int:
+    """keep-alive 연결로 POST 한 번 – 응답 상태 코드 반환"""
+    writer.write(f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":", 1)[1])
+    await reader.readexactly(length)
+    return status
+
+
+async def load(port: int, endpoint: str, concurrency: int, total: int) -> tuple[list[float], float]:
+    """동시 접속마다 연결 하나를 열어 요청을 순서대로 보냄 (클라이언트 오버헤드 최소화)"""
+    latencies = []
+    counter = iter(range(total))
+    path, host = f"/v1/{endpoint}", f"127.0.0.1:{port}"
+
+    async def worker():
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            for i in counter:
+                body = json.dumps(payload(endpoint, i)).encode()
+                t0 = time.perf_counter()
+                status = await _post(reader, writer, host, path, body)
+                latencies.append(time.perf_counter() - t0)
+                if status != 200:
+                    raise RuntimeError(f"HTTP {status}")
+        finally:
+            writer.close()
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, time.perf_counter() - t0
+
+
+def report(port: int, label: str, endpoint: str, levels, total: int) -> None:
+    print(f"\n[{label}] /v1/{endpoint} · 요청 {total:,}건씩")
+    print(f"{'동시 접속':>8} | {'p50':>8} | {'p99':>8} | {'처리량':>12}")
+    for concurrency in levels:
+        latencies, elapsed = asyncio.run(load(port, endpoint, concurrency, total))
+        q = statistics.quantiles(latencies, n=100)
+        print(f"{concurrency:>8} | {q[49] * 1000:>6.2f}ms | {q[98] * 1000:>6.2f}ms | {total / elapsed:>9,.0f}/s")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", default="1,8,32,128")
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--endpoint", choices=ENDPOINTS, default="eitc")
+    parser.add_argument("--compare", action="store_true", help="배칭 끈 서버와 비교")
+    args = parser.parse_args(argv)
+    levels = [int(c) for c in args.concurrency.split(",")]
+
+    configs = [("배칭", True)] + ([("배칭 없음", False)] if args.compare else [])
+    for label, batching in configs:
+        with LocalServer(batching) as base_url:
+            report(int(base_url.rsplit(":", 1)[1]), label, args.endpoint, levels, args.requests)
+            if batching:
+                stats = httpx.get(f"{base_url}/health").json()["batchers"][args.endpoint]
+                print(f"평균 배치 크기: {stats['mean_batch']:.1f} ({stats['batches']:,}회)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
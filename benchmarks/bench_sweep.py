@@ -0,0 +1,87 @@
+# benchmarks/bench_sweep.py
+# 시나리오 스윕 vs 스칼라 반복 – 소득 격자 × 가구유형 × 재산 수준 곡선 계산 시간
+# 실행: python -m benchmarks.bench_sweep [--stop 50000000] [--step 10000]
+#
+# 같은 격자를 app.py 규칙(calc_eitc + 재산·기한후신고 조정 + 세금)으로 한 점씩 계산한 결과와
+# sweep() 결과가 일치하는지 확인한 뒤 시간을 비교한다. work1.py 곡선(2025 age_bonus)도
+# 만원 격자 전체에서 eitc_age.calc_eitc 와 같은지 확인한다.
+
+import argparse
+import sys
+import time
+
+from taxcore.eitc import HOUSEHOLD_TYPES, PARAMS, apply_late_filing_adjustment, apply_property_adjustment, calc_eitc
+from taxcore.eitc_age import MAN_WON
+from taxcore.eitc_age import calc_eitc as calc_eitc_age
+from taxcore.income_tax import INCOME_TAX_2025
+from taxcore.sweep import income_grid, sweep
+
+PROPERTY_VALUES = (0, 150_000_000, 200_000_000, 250_000_000)
+
+
+def scalar_sweep(incomes, late_filing: bool):
+    eitc, tax = {}, {}
+    for income in incomes:
+        tax[income] = sum(INCOME_TAX_2025.calculate_with_local(income))
+        for household_type in HOUSEHOLD_TYPES:
+            base = calc_eitc(income, PARAMS[household_type])
+            for prop in PROPERTY_VALUES:
+                amount, _ = apply_property_adjustment(base, prop)
+                if late_filing:
+                    amount, _ = apply_late_filing_adjustment(amount, True)
+                eitc[household_type, prop, income] = amount
+    return eitc, tax
+
+
+def check_age_bonus() -> int:
+    """work1.py 곡선 – 0~5000만원 만원 격자, 65세 미만·이상 모두 calc_eitc 와 비교 (불일치 수)"""
+    incomes = income_grid(5000 * MAN_WON, MAN_WON)
+    mismatches = 0
+    for age in (40, 70):
+        result = sweep(incomes, age=age, year=2025, schedule="age_bonus")
+        for h, household_type in enumerate(result.household_types):
+            expected = [calc_eitc_age(i // MAN_WON, household_type, age) for i in incomes.tolist()]
+            mismatches += sum(a != b for a, b in zip(result.eitc[h, 0].tolist(), expected))
+    return mismatches
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stop", type=int, default=50_000_000)
+    parser.add_argument("--step", type=int, default=10_000)
+    parser.add_argument("--late-filing", action="store_true")
+    args = parser.parse_args(argv)
+
+    incomes = income_grid(args.stop, args.step)
+    points = len(incomes) * len(HOUSEHOLD_TYPES) * len(PROPERTY_VALUES)
+
+    t0 = time.perf_counter()
+    eitc, tax = scalar_sweep(incomes.tolist(), args.late_filing)
+    scalar = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    result = sweep(incomes, property_values=PROPERTY_VALUES, late_filing=args.late_filing)
+    vectorized = time.perf_counter() - t0
+
+    for h, household_type in enumerate(HOUSEHOLD_TYPES):
+        for p, prop in enumerate(PROPERTY_VALUES):
+            expected = [eitc[household_type, prop, i] for i in incomes.tolist()]
+            if result.eitc[h, p].tolist() != expected:
+                print(f"❌ 지급액 불일치: {household_type}, 재산 {prop:,}원")
+                return 1
+    if result.tax.tolist() != [tax[i] for i in incomes.tolist()]:
+        print("❌ 세금 불일치")
+        return 1
+    mismatches = check_age_bonus()
+    if mismatches:
+        print(f"❌ work1 곡선(age_bonus) 지급액 불일치 {mismatches}건")
+        return 1
+
+    print(f"격자: {len(incomes):,}점 × 가구유형 {len(HOUSEHOLD_TYPES)} × 재산 {len(PROPERTY_VALUES)} = {points:,}점")
+    print(f"스칼라 반복: {scalar * 1000:>9.1f}ms")
+    print(f"sweep():    {vectorized * 1000:>9.1f}ms  ({scalar / vectorized:,.0f}배)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
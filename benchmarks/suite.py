@@ -0,0 +1,467 @@
+# benchmarks/suite.py
+# 전체 계산기 벤치마크 모음 – 결과를 JSON 기준값으로 저장하고, 기준값 대비 10% 넘게 느려지면 실패
+# 실행: python -m benchmarks.suite run [-o results.json] [--max-rows 1000000] [-k eitc]
+#       python -m benchmarks.suite compare baseline.json results.json [--threshold 0.10]
+#       python -m benchmarks.suite run --baseline baseline.json       # 측정 후 바로 비교
+#       python -m benchmarks.suite list
+#
+# 항목 (모두 값이 작을수록 좋음)
+#   scalar.*   스칼라 함수 호출당 지연 (app.py / work1.py / earned_income_credit_2025.py / tax.py 규칙)
+#   batch.*    일괄 계산 1회 시간 – 1e3 ~ 1e7 행 (--max-rows 까지)
+#   import.*   모듈별 import 시간 (매번 새 인터프리터, 중앙값)
+#   data.*     tax_app.py 데이터 경로 – 수집(CSV/Parquet), 집계, 조회 인덱스, 행 수정 후 증분 갱신,
+#              내보내기, 저장소 저장/열기 (합성 데이터)
+#   memory.*   최대 할당 메모리 (tracemalloc, MB)
+#
+# 시간 항목은 timeit 으로 반복 횟수를 정한 뒤 --repeat 번 재서 최솟값을 쓴다.
+# 기준값은 같은 기계·같은 설정(--max-rows, --data-rows)에서 만든 것끼리 비교해야 의미가 있다.
+#
+# pytest-benchmark / asv 대신 자체 측정기를 쓰는 이유: import 시간(새 인터프리터)과 tracemalloc 최대 메모리를
+# 시간 항목과 같은 기준값 파일·같은 임계값으로 비교해야 하고, 의존성 없이 python -m 한 줄로 돌아가야 한다.
+# 결과가 맞는지(스칼라·일괄·스윕·조회표 일치, 서비스 입력 검증, 증분 갱신)는 tests/ 의 pytest 가 확인한다.
+
+import argparse
+import atexit
+import fnmatch
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from io import BytesIO
+from typing import Callable, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_THRESHOLD = 0.10
+BATCH_SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+IMPORT_MODULES = (
+    "taxcore", "taxcore.eitc", "taxcore.eitc_2025", "taxcore.eitc_age", "taxcore.income_tax",
+    "taxcore.batch", "taxcore.lookup", "taxcore.net_income", "taxcore.sweep",
+    "taxdata.ingest", "taxdata.dataset", "taxdata.export", "taxdata.charts", "taxdata.store",
+)
+
+
+class Case(NamedTuple):
+    name: str
+    unit: str                       # "s" (1회 시간) / "MB" (최대 메모리)
+    setup: Callable[[], Callable]   # 데이터를 만들고 측정할 무인자 함수를 반환
+    rows: int = 0                   # 1회에 처리하는 행 수 (처리량 표시용)
+    calls: int = 1                  # 1회에 포함된 호출 수 (호출당 지연 = 시간 / calls)
+    kind: str = "time"              # time / memory / import
+
+
+# ------------------------------
+# 합성 데이터
+# ------------------------------
+def make_households(rows: int, seed: int = 0) -> dict:
+    """근로장려금·세금 입력 (소득 0~1.5억, 재산 0~3억, 기한후신고 10%)"""
+    rng = np.random.default_rng(seed)
+    return {
+        "income": rng.integers(0, 150_000_000, rows),
+        "household_type": rng.integers(0, 3, rows),
+        "property_value": rng.integers(0, 300_000_000, rows),
+        "late_filing": rng.random(rows) < 0.1,
+    }
+
+
+def make_tax_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """tax_app.py 업로드 형식 (name / income / tax)"""
+    rng = np.random.default_rng(seed)
+    income = rng.integers(1_000_000, 200_000_000, rows)
+    names = np.array([f"납세자{i:05d}" for i in range(10_000)], dtype=object)
+    return pd.DataFrame({
+        "name": names[np.arange(rows) % len(names)],
+        "income": income,
+        "tax": income // 10,
+    })
+
+
+def _encoded(df: pd.DataFrame, fmt: str) -> bytes:
+    from taxdata.export import export_bytes
+    return export_bytes(df, fmt)
+
+
+# ------------------------------
+# 항목 정의
+# ------------------------------
+SCALAR_INPUTS = 1_000
+
+
+def scalar_cases() -> list[Case]:
+    def inputs():
+        rng = np.random.default_rng(1)
+        return list(zip(rng.integers(0, 50_000_000, SCALAR_INPUTS).tolist(),
+                        (("단독", "홑벌이", "맞벌이")[i % 3] for i in range(SCALAR_INPUTS))))
+
+    def calc_eitc_2024():
+        from taxcore.eitc import PARAMS, calc_eitc
+        data = [(income, PARAMS[h]) for income, h in inputs()]
+        return lambda: [calc_eitc(income, params) for income, params in data]
+
+    def calc_eitc_age():
+        from taxcore.eitc_age import calc_eitc
+        data = [(income // 10_000, h, 40 + i % 40) for i, (income, h) in enumerate(inputs())]
+        return lambda: [calc_eitc(income, h, age) for income, h, age in data]
+
+    def get_eitc_amount():
+        from taxcore.eitc_2025 import get_eitc_amount
+        data = [(income // 10_000, h) for income, h in inputs()]
+        return lambda: [get_eitc_amount(income, h) for income, h in data]
+
+    def get_max_eitc():
+        from taxcore.eitc_age import get_max_eitc
+        data = [(40 + i % 40, h) for i, (_, h) in enumerate(inputs())]
+        return lambda: [get_max_eitc(age, h) for age, h in data]
+
+    def calculate_income_tax():
+        from taxcore.income_tax import calculate_income_tax
+        data = [income * 4 for income, _ in inputs()]
+        return lambda: [calculate_income_tax(income) for income in data]
+
+    def calc_net_income():
+        from taxcore.net_income import calc_net_income
+        data = inputs()
+        return lambda: [calc_net_income(income, h) for income, h in data]
+
+    return [Case(f"scalar.{fn.__name__}", "s", fn, calls=SCALAR_INPUTS)
+            for fn in (calc_eitc_2024, calc_eitc_age, get_eitc_amount, get_max_eitc,
+                       calculate_income_tax, calc_net_income)]
+
+
+def batch_cases(max_rows: int) -> list[Case]:
+    def calc_eitc_batch(rows):
+        from taxcore.batch import calc_eitc_batch
+        d = make_households(rows)
+        return lambda: calc_eitc_batch(d["income"], d["household_type"], d["property_value"], d["late_filing"])
+
+    def income_tax(rows):
+        from taxcore.income_tax import INCOME_TAX_2025
+        income = make_households(rows)["income"]
+        return lambda: INCOME_TAX_2025.calculate_batch(income)
+
+    def net_income(rows):
+        from taxcore.net_income import calc_net_income_batch
+        d = make_households(rows)
+        return lambda: calc_net_income_batch(d["income"], d["household_type"], d["property_value"], d["late_filing"])
+
+    def lookup_2025(rows):
+        from taxcore.lookup import get_lookup_table
+        table = get_lookup_table(2025)
+        d = make_households(rows)
+        income = d["income"] // 3
+        return lambda: table.amount_batch(income, d["household_type"])
+
+    cases = []
+    for fn in (calc_eitc_batch, income_tax, net_income, lookup_2025):
+        for rows in BATCH_SIZES:
+            if rows <= max_rows:
+                cases.append(Case(f"batch.{fn.__name__}[{rows:.0e}]", "s",
+                                  lambda fn=fn, rows=rows: fn(rows), rows=rows))
+    return cases
+
+
+def import_cases() -> list[Case]:
+    return [Case(f"import.{module}", "s", lambda module=module: module, kind="import")
+            for module in IMPORT_MODULES]
+
+
+def data_cases(rows: int) -> list[Case]:
+    def ingest_csv():
+        from taxdata.ingest import ingest
+        raw = _encoded(make_tax_frame(rows), "csv")
+        return lambda: ingest(BytesIO(raw), "csv")
+
+    def ingest_many_csv():
+        # 같은 행 수를 8개 파일로 나눠 동시에 읽어 데이터셋으로 합침 (tax_app.py 업로드 경로)
+        from taxdata.dataset import TaxDataset
+        from taxdata.ingest import ingest_many
+        df = make_tax_frame(rows)
+        edges = np.linspace(0, rows, 9).astype(np.int64)
+        raws = [_encoded(df.iloc[a:b], "csv") for a, b in zip(edges[:-1], edges[1:])]
+
+        def run():
+            files = []
+            for i, raw in enumerate(raws):
+                files.append(BytesIO(raw))
+                files[-1].name = f"part{i}.csv"
+            return ingest_many(files, materialize=False, sink=TaxDataset().extend)
+        return run
+
+    def ingest_parquet():
+        from taxdata.ingest import ingest
+        raw = _encoded(make_tax_frame(rows), "parquet")
+        return lambda: ingest(BytesIO(raw), "parquet")
+
+    def build_dataset():
+        from taxdata.dataset import TaxDataset
+        df = make_tax_frame(rows)
+        return lambda: TaxDataset.from_frame(df)
+
+    def aggregate():
+        from taxdata.charts import top_n_with_other
+        from taxdata.dataset import TaxDataset
+        from taxdata.stats import TaxStats
+        from taxdata.styling import band_codes
+        dataset = TaxDataset.from_frame(make_tax_frame(rows))
+        frame = dataset.frame()
+        return lambda: (TaxStats.from_frame(frame), dataset.tax_rate(), band_codes(dataset.income),
+                        top_n_with_other(frame, "name", "income", 10))
+
+    def index_build():
+        from taxdata.dataset import TaxDataset
+        from taxdata.query import DatasetIndex
+        dataset = TaxDataset.from_frame(make_tax_frame(rows))
+        return lambda: DatasetIndex(dataset)
+
+    def query():
+        # 조회 페이지 1회 – 범위 개수·분위수·상위 10명 + 두 조건 필터의 첫 페이지
+        from taxdata.dataset import TaxDataset
+        from taxdata.query import DatasetIndex, Filter
+        dataset = TaxDataset.from_frame(make_tax_frame(rows))
+        index = DatasetIndex(dataset)
+        lo, hi = index.percentile("income", 40), index.percentile("income", 60)
+        where = Filter(income_min=lo, income_max=hi, tax_min=index.percentile("tax", 50))
+        return lambda: (index.count("income", lo, hi), index.percentile("tax", 90), index.top_k("income", 10),
+                        index.query(where, sort_by="tax").page(dataset, 1, 50))
+
+    def edit_incremental():
+        # 행 하나 추가 + 하나 수정 후 화면이 쓰는 파생 값 갱신 – 집계·세율·fingerprint·조회 인덱스·이름별 합계·챗봇 컨텍스트
+        from taxdata.context import build_context
+        from taxdata.dataset import TaxDataset
+        from taxdata.query import DatasetIndex
+        from taxdata.stats import NameTotals
+        dataset = TaxDataset.from_frame(make_tax_frame(rows))
+        dataset.enable_tax_rate()
+        state = [dataset.version, DatasetIndex(dataset), NameTotals.from_dataset(dataset)]
+        rng = np.random.default_rng(2)
+
+        def run():
+            dataset.append("납세자00000", int(rng.integers(1_000_000, 200_000_000)), 100_000)
+            dataset.update(int(rng.integers(0, len(dataset))), income=int(rng.integers(1_000_000, 200_000_000)))
+            deltas = dataset.changes_since(state[0])
+            state[:] = dataset.version, state[1].updated(dataset, deltas), state[2].updated(dataset, deltas)
+            return dataset.fingerprint(), dataset.frame(), build_context(dataset, index=state[1])
+        return run
+
+    def export(fmt):
+        def setup():
+            from taxdata.export import export_bytes
+            df = make_tax_frame(rows)
+            return lambda: export_bytes(df, fmt)
+        setup.__name__ = f"export_{fmt}"
+        return setup
+
+    def _store():
+        from taxdata.store import DatasetStore
+        root = tempfile.mkdtemp(prefix="bench-store-")
+        atexit.register(shutil.rmtree, root, ignore_errors=True)
+        return DatasetStore(root)
+
+    def store_save():
+        from taxdata.dataset import TaxDataset
+        store, dataset = _store(), TaxDataset.from_frame(make_tax_frame(rows))
+        dataset_id = dataset.fingerprint()
+        return lambda: (store.delete(dataset_id), store.save(dataset))
+
+    def store_load():
+        # 이미 열린 memmap 재사용 없이 파일을 열고 소득 열을 끝까지 읽음 (페이지 캐시 적중 기준)
+        from taxdata.dataset import TaxDataset
+        store = _store()
+        dataset_id = store.save(TaxDataset.from_frame(make_tax_frame(rows)))
+
+        def run():
+            store._open.clear()
+            return int(store.load(dataset_id).income.sum())
+        return run
+
+    fns = ([ingest_csv, ingest_many_csv, ingest_parquet, build_dataset, aggregate, index_build, query,
+            edit_incremental]
+           + [export(f) for f in ("csv", "xlsx", "parquet")]
+           + [store_save, store_load])
+    return [Case(f"data.{fn.__name__}[{rows:.0e}]", "s", fn, rows=rows) for fn in fns]
+
+
+def memory_cases(batch_rows: int, data_rows: int) -> list[Case]:
+    picked = {
+        f"batch.net_income[{batch_rows:.0e}]": batch_rows,
+        f"batch.calc_eitc_batch[{batch_rows:.0e}]": batch_rows,
+        f"data.ingest_csv[{data_rows:.0e}]": data_rows,
+        f"data.build_dataset[{data_rows:.0e}]": data_rows,
+        f"data.export_csv[{data_rows:.0e}]": data_rows,
+        f"data.export_xlsx[{data_rows:.0e}]": data_rows,
+    }
+    timed = {c.name: c for c in batch_cases(batch_rows) + data_cases(data_rows)}
+    return [timed[name]._replace(name="memory." + name.split(".", 1)[1], unit="MB", kind="memory")
+            for name in picked if name in timed]
+
+
+def all_cases(max_rows: int, data_rows: int) -> list[Case]:
+    batch_rows = max(r for r in BATCH_SIZES if r <= max_rows) if max_rows >= BATCH_SIZES[0] else BATCH_SIZES[0]
+    return (scalar_cases() + batch_cases(max_rows) + import_cases() + data_cases(data_rows)
+            + memory_cases(batch_rows, data_rows))
+
+
+# ------------------------------
+# 측정
+# ------------------------------
+IMPORT_PROBE = "import sys, time; t0 = time.perf_counter(); __import__(sys.argv[1]); print(time.perf_counter() - t0)"
+
+
+def measure(case: Case, repeat: int) -> float:
+    if case.kind == "import":
+        runs = [float(subprocess.run([sys.executable, "-c", IMPORT_PROBE, case.setup()], check=True,
+                                     capture_output=True, text=True).stdout) for _ in range(max(repeat, 5))]
+        return statistics.median(runs)
+
+    fn = case.setup()
+    if case.kind == "memory":
+        fn()                            # 지연 초기화(모듈 import, 조회표 등)는 제외
+        tracemalloc.start()
+        try:
+            fn()
+            return tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        finally:
+            tracemalloc.stop()
+
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number / case.calls
+
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "commit": commit,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def format_value(value: float, unit: str) -> str:
+    if unit == "MB":
+        return f"{value:,.1f} MB"
+    if value < 1e-3:
+        return f"{value * 1e6:,.2f} µs"
+    if value < 1:
+        return f"{value * 1e3:,.2f} ms"
+    return f"{value:,.2f} s"
+
+
+def run(cases: list[Case], repeat: int) -> dict:
+    results = {}
+    for case in cases:
+        value = measure(case, repeat)
+        results[case.name] = {"value": value, "unit": case.unit, "rows": case.rows}
+        rate = f"  ({case.rows / value:,.0f} 행/초)" if case.rows and case.unit == "s" else ""
+        print(f"{case.name:<40} {format_value(value, case.unit):>14}{rate}", flush=True)
+    return results
+
+
+# ------------------------------
+# 기준값 비교
+# ------------------------------
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD) -> list[str]:
+    """기준값보다 threshold 넘게 커진(느려지거나 메모리가 는) 항목 이름 목록 – 표도 출력"""
+    base, cur = baseline["results"], current["results"]
+    regressions = []
+    print(f"{'항목':<40} {'기준':>14} {'현재':>14} {'변화':>8}")
+    for name in sorted(base.keys() & cur.keys()):
+        b, c = base[name]["value"], cur[name]["value"]
+        change = c / b - 1 if b else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  ❌ 회귀"
+        elif change < -threshold:
+            flag = "  ✅ 개선"
+        unit = cur[name]["unit"]
+        print(f"{name:<40} {format_value(b, unit):>14} {format_value(c, unit):>14} {change:>+7.1%}{flag}")
+    for label, names in (("기준값에만 있음", base.keys() - cur.keys()), ("새 항목", cur.keys() - base.keys())):
+        if names:
+            print(f"{label}: {', '.join(sorted(names))}")
+    if baseline.get("environment", {}).get("platform") != current.get("environment", {}).get("platform"):
+        print("⚠️ 기준값과 측정 환경(platform)이 다릅니다")
+    if regressions:
+        print(f"❌ {len(regressions)}개 항목이 {threshold:.0%} 넘게 나빠졌습니다")
+    else:
+        print(f"✅ {threshold:.0%} 넘게 나빠진 항목 없음")
+    return regressions
+
+
+# ------------------------------
+# 명령줄
+# ------------------------------
+def select(cases: list[Case], patterns) -> list[Case]:
+    if not patterns:
+        return cases
+    return [c for c in cases if any(p in c.name or fnmatch.fnmatch(c.name, p) for p in patterns)]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description="계산기 벤치마크 모음")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="측정하고 JSON 으로 저장")
+    list_p = sub.add_parser("list", help="항목 이름만 출력")
+    for p in (run_p, list_p):
+        p.add_argument("-k", "--filter", action="append", help="이름 일부 또는 글롭 (여러 번 지정 가능)")
+        p.add_argument("--max-rows", type=int, default=1_000_000, help="일괄 계산 최대 행 수 (1e7 까지)")
+        p.add_argument("--data-rows", type=int, default=100_000, help="tax_app 데이터 경로 행 수")
+    run_p.add_argument("-o", "--output", help="결과 JSON 경로")
+    run_p.add_argument("--repeat", type=int, default=5)
+    run_p.add_argument("--baseline", help="측정 후 이 기준값과 비교")
+    run_p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    cmp_p = sub.add_parser("compare", help="두 결과 JSON 비교 (회귀가 있으면 종료 코드 1)")
+    cmp_p.add_argument("baseline")
+    cmp_p.add_argument("current")
+    cmp_p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        return 1 if compare(load(args.baseline), load(args.current), args.threshold) else 0
+
+    cases = select(all_cases(args.max_rows, args.data_rows), args.filter)
+    if args.command == "list":
+        for case in cases:
+            print(case.name)
+        return 0
+
+    current = {
+        "environment": environment(),
+        "settings": {"max_rows": args.max_rows, "data_rows": args.data_rows, "repeat": args.repeat},
+        "results": run(cases, args.repeat),
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        print(f"저장: {args.output}")
+    if args.baseline:
+        print()
+        return 1 if compare(load(args.baseline), current, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
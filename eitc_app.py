@@ -1,32 +1,6 @@
 import streamlit as st
 
-# -----------------------------
-# 근로장려금 계산 함수
-# -----------------------------
-def get_max_eitc(age: int, household_type: str) -> int:
-    """
-    근로장려금 최대 지급 가능액 계산기
-    Parameters:
-        age (int): 나이
-        household_type (str): 가구 유형 ('단독', '홑벌이', '맞벌이')
-    Returns:
-        int: 근로장려금 최대 지급 가능액 (원)
-    """
-
-    base_amounts = {
-        '단독': 1500000,   # 150만원
-        '홑벌이': 2600000, # 260만원
-        '맞벌이': 3000000  # 300만원
-    }
-
-    if household_type not in base_amounts:
-        raise ValueError("household_type은 '단독', '홑벌이', '맞벌이' 중 하나여야 합니다.")
-
-    # 65세 이상은 10% 추가
-    bonus_rate = 1.1 if age >= 65 else 1.0
-
-    return int(base_amounts[household_type] * bonus_rate)
-
+from taxcore.eitc_age import get_max_eitc
 
 # -----------------------------
 # Streamlit UI 구성
@@ -1,5 +1,7 @@
 import streamlit as st
 
+from taxcore.income_tax import classify_income_level
+
 st.title("💰 소득 수준 분류 및 세율 계산기")
 
 # 사용자 입력 받기
@@ -7,15 +9,7 @@ income = st.number_input("연 소득을 입력하세요 (원)", min_value=0, ste
 
 # 계산 버튼
 if st.button("세율 계산하기"):
-    if income >= 50000000:
-        level = "고소득층"
-        tax_rate = 0.50
-    elif income >= 20000000:
-        level = "중간소득층"
-        tax_rate = 0.25
-    else:
-        level = "저소득층"
-        tax_rate = 0.10
+    level, tax_rate = classify_income_level(income)
 
     tax = income * tax_rate
 
@@ -1,30 +1,13 @@
 import streamlit as st
 
+from taxcore.income_tax import INCOME_TAX_2025, calculate_income_tax
+
 st.title("💰 2025년 소득세 계산기")
 st.write("연소득에 따른 소득세, 세율, 누진공제를 계산합니다.")
 
 # 입력
 income = st.number_input("연소득을 입력하세요 (원)", min_value=0, step=1000000, format="%d")
 
-# 세율표
-tax_brackets = [
-    (12_000_000, 0.06, 0),
-    (46_000_000, 0.15, 1_080_000),
-    (88_000_000, 0.24, 5_220_000),
-    (150_000_000, 0.35, 14_900_000),
-    (300_000_000, 0.38, 19_400_000),
-    (500_000_000, 0.40, 25_400_000),
-    (1_000_000_000, 0.42, 35_400_000),
-    (float('inf'), 0.45, 65_400_000)
-]
-
-# 계산 함수
-def calculate_income_tax(income):
-    for limit, rate, deduction in tax_brackets:
-        if income <= limit:
-            tax = income * rate - deduction
-            return rate, deduction, max(0, round(tax))
-
 # 계산 버튼
 if st.button("세금 계산하기"):
     rate, deduction, tax = calculate_income_tax(income)
@@ -34,7 +17,8 @@ if st.button("세금 계산하기"):
     st.write(f"**누진공제액:** {deduction:,.0f} 원")
     st.write(f"**산출세액:** {tax:,.0f} 원")
 
-    st.info(f"💡 지방소득세는 산출세액의 10%이며, 총 세액은 {tax * 1.1:,.0f} 원입니다.")
+    local_tax = INCOME_TAX_2025.local_tax(tax)
+    st.info(f"💡 지방소득세는 산출세액의 10%({local_tax:,.0f} 원)이며, 총 세액은 {tax + local_tax:,.0f} 원입니다.")
 
 # 참고용 세율표
 st.markdown("### 📊 세율표 (2025년 기준)")
@@ -1,9 +1,24 @@
+import json
+import os
+import time
+import uuid
+
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from io import StringIO, BytesIO
-from openai import OpenAI
+from taxdata import charts, perf
+from taxdata.cache import DerivedCache
+from taxdata.answers import AnswerCache, answer_key, local_answer
+from taxdata.chat import DEFAULT_MODEL, DEFAULT_TEMPERATURE, ChatBackend
+from taxdata.context import DEFAULT_FULL_ROWS, build_context, with_relevant_rows
+from taxdata.dataset import TaxDataset
+from taxdata.export import EXCEL_MAX_ROWS, EXPORT_FORMATS, export_bytes
+from taxdata.incremental import IncrementalCache
+from taxdata.ingest import ingest_many, page_count, paginate
+from taxdata.query import DatasetIndex, Filter
+from taxdata.schema import format_bytes, frame_nbytes
+from taxdata.stats import NameTotals
+from taxdata.store import DatasetStore
+from taxdata.styling import DEFAULT_THRESHOLDS, band_codes, band_legend, style_window, update_band_codes
 
 # 페이지 설정
 st.set_page_config(
@@ -12,22 +27,105 @@ st.set_page_config(
     layout="wide"
 )
 
+# 앱이 쓰는 파일(데이터셋 저장소, 성능 로그)의 위치 – 실행 위치와 무관하게 환경 변수 TAX_APP_DATA_DIR,
+# 없으면 사용자 캐시 디렉터리(XDG_CACHE_HOME 또는 ~/.cache) 아래 tax_app
+DATA_DIR = os.environ.get("TAX_APP_DATA_DIR") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "tax_app")
+
+# 성능 계측 – 주소에 ?perf=1 을 붙이면 켜짐: 사이드바 "⏱️ 성능" 패널 + 실행마다 PERF_LOG_PATH 에 JSON 한 줄
+# 꺼져 있으면 계측 지점은 빈 컨텍스트만 거친다 (taxdata.perf)
+PERF_LOG_PATH = os.path.join(DATA_DIR, "perf_log.jsonl")
+perf_enabled = st.query_params.get("perf") == "1"
+if perf_enabled:
+    if 'perf_recorder' not in st.session_state:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        st.session_state.perf_recorder = perf.Recorder(PERF_LOG_PATH)
+        st.session_state.perf_session = uuid.uuid4().hex[:8]
+    st.session_state.perf_recorder.begin_run(
+        profile=st.session_state.get("perf_profile", False),
+        trace_memory=st.session_state.get("perf_tracemalloc", False),
+        session=st.session_state.perf_session,
+    )
+
 # 제목
 st.title("💰 세금 데이터 분석 시스템")
 st.markdown("---")
 
+# 파생 결과 캐시 (프로세스 전역 – 모든 세션이 공유)
+@st.cache_resource
+def get_derived_cache():
+    return DerivedCache()
+
+cache = get_derived_cache()
+
+# 챗봇 백엔드 (프로세스 전역 – API 키별 연결 풀 + 스트리밍 실행기)
+@st.cache_resource
+def get_chat_backend():
+    return ChatBackend()
+
+chat_backend = get_chat_backend()
+
+# 챗봇 답변 캐시 (프로세스 전역) – 같은 데이터·같은 질문이면 API 를 다시 호출하지 않음
+# 파일 경로를 지정하면 SQLite 에 저장되어 재시작 후에도 유지된다 (예: os.path.join(DATA_DIR, "answers.sqlite3"))
+ANSWER_CACHE_PATH = None
+
+@st.cache_resource
+def get_answer_cache():
+    return AnswerCache(path=ANSWER_CACHE_PATH)
+
+answer_cache = get_answer_cache()
+
+# 데이터셋 저장소 (프로세스 전역) – 업로드·수정한 데이터를 열별 파일로 디스크에 한 벌만 두고 memmap 으로 연다
+# 주소의 ?dataset=<ID> 로 새로고침·재시작 후에도 복원되고, 같은 데이터를 여는 세션은 같은 사본을 공유한다
+# None 이면 저장하지 않음 (업로드 데이터는 세션 메모리에만 보관)
+DATASET_STORE_PATH = os.path.join(DATA_DIR, "data_store")
+
+@st.cache_resource
+def get_dataset_store():
+    return DatasetStore(DATASET_STORE_PATH) if DATASET_STORE_PATH else None
+
+store = get_dataset_store()
+
+def persist_dataset(dataset):
+    """현재 데이터셋을 저장소에 저장하고 주소에 ID 를 남김 (저장소가 없으면 아무것도 안 함)"""
+    if store is not None:
+        st.query_params["dataset"] = store.save(dataset)
+        # 세율 컬럼 표시 여부는 내용 해시(ID)에 들어가지 않으므로 주소에 따로 남긴다
+        if dataset.show_tax_rate:
+            st.query_params["tax_rate"] = "1"
+        elif "tax_rate" in st.query_params:
+            del st.query_params["tax_rate"]
+
 # 세션 스테이트 초기화
-if 'df' not in st.session_state:
-    st.session_state.df = pd.DataFrame({
-        'name': ['Kim', 'Lee', 'Park', 'Choi', 'Jung', 'Song'],
-        'income': [5000, 4000, 3000, 6000, 4500, 5200],
-        'tax': [500, 400, 300, 600, 450, 520]
-    })
+if 'dataset' not in st.session_state:
+    dataset_id = st.query_params.get("dataset")
+    if store is not None and dataset_id in store:
+        st.session_state.dataset = store.load(dataset_id)
+        if st.query_params.get("tax_rate") == "1":
+            st.session_state.dataset.enable_tax_rate()
+    else:
+        if dataset_id:
+            st.warning("⚠️ 저장된 데이터를 찾을 수 없어 예제 데이터로 시작합니다.")
+            del st.query_params["dataset"]
+        st.session_state.dataset = TaxDataset.from_frame(pd.DataFrame({
+            'name': ['Kim', 'Lee', 'Park', 'Choi', 'Jung', 'Song'],
+            'income': [5000, 4000, 3000, 6000, 4500, 5200],
+            'tax': [500, 400, 300, 600, 450, 520]
+        }))
 
 if 'chat_history' not in st.session_state:
     st.session_state.chat_history = []
 
-df = st.session_state.df
+# 이 세션의 파생 결과 이전 버전 (데이터가 바뀌면 변경 행만 반영해 갱신)
+if 'derived' not in st.session_state:
+    st.session_state.derived = IncrementalCache()
+
+# 데이터셋: 집계는 stats 에 캐시되어 있고, df 는 버전별로 한 번만 만들어진다
+dataset = st.session_state.dataset
+stats = dataset.stats
+with perf.section("dataset.frame"):
+    df = dataset.frame()
+    fingerprint = dataset.fingerprint()
 
 # 사이드바
 st.sidebar.title("📋 메뉴")
@@ -35,36 +133,81 @@ menu = st.sidebar.radio(
     "기능 선택:",
     ["1️⃣ 데이터 보기", "2️⃣ 세율 계산", "3️⃣ 조건부 서식", 
      "4️⃣ 통계 분석", "5️⃣ 새 데이터 추가", "6️⃣ 차트 생성",
-     "7️⃣ 데이터 업로드/다운로드", "🤖 AI 챗봇"]
+     "7️⃣ 데이터 업로드/다운로드", "8️⃣ 데이터 조회", "🤖 AI 챗봇"]
 )
 
 st.sidebar.markdown("---")
 st.sidebar.info("💡 VBA 예제를 Streamlit + AI로 구현!")
+if perf_enabled:
+    st.session_state.perf_recorder.annotate(page=menu, rows=len(df))
+
+# 페이지 단위 표 표시 (전체 행을 한 번에 브라우저로 보내지 않음)
+# style(start, stop) 을 주면 보이는 구간에만 서식을 적용한 Styler 를 표시
+# result(taxdata.query.QueryResult) 를 주면 frame 중 조회 결과 행만 – 보이는 페이지 행만 꺼낸다
+def show_paginated(frame, key, page_sizes=(50, 100, 500, 1000), style=None, result=None):
+    n_rows = len(frame) if result is None else len(result)
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        page_size = st.selectbox("페이지당 행 수", page_sizes, key=f"{key}_page_size")
+    with col2:
+        pages = page_count(n_rows, page_size)
+        page = st.number_input(f"페이지 (총 {pages:,}쪽)", min_value=1, max_value=pages,
+                               value=1, key=f"{key}_page")
+    start = (page - 1) * page_size
+    with perf.section("table.render"):     # Styler 는 st.dataframe 안에서 HTML/서식으로 변환됨
+        if style is not None:
+            st.dataframe(style(start, start + page_size), use_container_width=True)
+        elif result is not None:
+            st.dataframe(frame.iloc[result.positions(start, start + page_size)], use_container_width=True)
+        else:
+            st.dataframe(paginate(frame, page, page_size), use_container_width=True)
+    st.caption(f"{n_rows:,}행 중 {min(start + 1, n_rows):,}~{min(start + page_size, n_rows):,}행")
+
+# 파생 결과 – 같은 내용의 결과가 DerivedCache 에 있으면 그대로 쓰고, 없으면 이 세션이 만든
+# 이전 버전 결과에 데이터셋 변경 기록(행 추가·수정·삭제)만 반영해 만든다 (taxdata.incremental)
+def derived(key, build, update):
+    return cache.get_or_compute((fingerprint, *key),
+                                lambda: st.session_state.derived.get(key, dataset, build, update))
+
+# 차트는 figure JSON 으로 캐시 (같은 데이터 + 같은 차트 유형 + 같은 점 상한이면 재생성하지 않음)
+# inputs: 차트에 넘길 미리 집계한 값 (조회 인덱스·이름별 합계) – JSON 이 캐시에 없을 때만 불림
+def cached_figure(kind, build, max_points=charts.DEFAULT_MAX_POINTS, inputs=None):
+    def build_json():
+        with perf.section("chart.build"):
+            return build(df, max_points, **(inputs() if inputs else {})).to_json()
+    fig_json = cache.get_or_compute((fingerprint, "figure", kind, max_points), build_json)
+    return json.loads(fig_json), len(fig_json.encode('utf-8'))
+
+def show_figure(fig, payload_bytes):
+    with perf.section("chart.render"):
+        st.plotly_chart(fig, use_container_width=True)
+    st.caption(f"📦 차트 데이터 크기: {payload_bytes / 1024:,.1f} KB")
+
+# 조회 인덱스 (정렬 인덱스 + 이름 인덱스) – 데이터 버전별로 한 번만 만들고 모든 세션이 공유
+def get_index():
+    with perf.section("index.build"):
+        return derived(("index",), DatasetIndex, DatasetIndex.updated)
+
+# 이름별 합계 (막대·파이 차트 집계)
+def get_name_totals():
+    return derived(("name_totals",), NameTotals.from_dataset, NameTotals.updated)
 
 # AI 챗봇 함수
-def get_data_summary():
-    summary = f"""
-현재 데이터 요약:
-- 총 인원: {len(df)}명
-- 총 소득: {df['income'].sum():,}원
-- 총 세금: {df['tax'].sum():,}원
-- 평균 소득: {df['income'].mean():,.0f}원
-- 평균 세금: {df['tax'].mean():,.0f}원
-- 최고 소득: {df['income'].max():,}원 ({df.loc[df['income'].idxmax(), 'name']})
-- 최저 소득: {df['income'].min():,}원 ({df.loc[df['income'].idxmin(), 'name']})
-- 평균 세율: {(df['tax'].sum() / df['income'].sum() * 100):.2f}%
-상세 데이터:
-{df.to_string()}
-"""
-    return summary
-
-def chat_with_ai(user_message, api_key):
-    """OpenAI API를 사용하여 대화"""
-    try:
-        client = OpenAI(api_key=api_key)
-        data_context = get_data_summary()
-        
-        system_prompt = f"""당신은 세금 데이터 분석 전문가입니다. 
+# 데이터 컨텍스트는 데이터 버전별로 한 번만 만들고 (크기 제한 요약), 질문에 언급된 이름의 행만 덧붙인다
+# 행이 많으면 분위수·상위/하위 행을 조회 인덱스에서 읽는다 (인덱스는 변경 행만 반영해 갱신)
+def get_data_context():
+    return cache.get_or_compute(
+        (fingerprint, "chat_context", stats.count),
+        lambda: build_context(dataset, index=get_index() if len(dataset) > DEFAULT_FULL_ROWS else None))
+
+def get_data_summary(question=""):
+    return with_relevant_rows(get_data_context(), dataset, question).text
+
+def chat_with_ai(user_message, api_key, base_url=None):
+    """OpenAI API를 사용하여 대화 – 토큰 단위로 읽을 수 있는 ChatStream 반환"""
+    data_context = get_data_summary(user_message)
+    
+    system_prompt = f"""당신은 세금 데이터 분석 전문가입니다. 
 사용자의 질문에 대해 아래 데이터를 기반으로 정확하고 친절하게 답변해주세요.
 {data_context}
 답변 시 주의사항:
@@ -73,76 +216,118 @@ def chat_with_ai(user_message, api_key):
 3. 한국어로 친절하게 답변하세요
 4. 데이터 분석 인사이트를 제공하세요"""
 
-        # OpenAI API 호출
-        response = client.chat.completions.create(
-            model="gpt-4o",  # 또는 "gpt-3.5-turbo" (더 저렴)
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_message}
-            ],
-            max_tokens=1000,
-            temperature=0.7
-        )
-        
-        return response.choices[0].message.content
-    except Exception as e:
-        return f"❌ 오류 발생: {str(e)}\n\nAPI 키를 확인해주세요."
+    # OpenAI API 호출 (스트리밍, 실행기 스레드에서 진행)
+    return chat_backend.stream(
+        [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_message}
+        ],
+        api_key=api_key,
+        base_url=base_url
+    )
+
+def answer_question(question, api_key, base_url=None):
+    """질문을 기록하고 답변을 도착하는 대로 화면에 출력한 뒤 기록"""
+    st.session_state.chat_history.append({
+        "role": "user",
+        "content": question
+    })
+    with st.chat_message("user"):
+        st.write(question)
+    with st.chat_message("assistant"):
+        # 1) 집계로 바로 계산 가능한 질문 → API 호출 없음
+        # 2) 같은 데이터에 같은 질문을 한 적 있음 → 캐시된 답변
+        # 3) 그 외 → 스트리밍으로 답변 받고 캐시에 저장
+        answer = local_answer(question, dataset, get_index())
+        if answer is not None:
+            st.write(answer)
+            st.caption("⚡ 데이터에서 바로 계산한 답변")
+        else:
+            key = answer_key(fingerprint, question, DEFAULT_MODEL, DEFAULT_TEMPERATURE)
+            answer = answer_cache.get(key)
+            if answer is not None:
+                st.write(answer)
+                st.caption("🗄️ 캐시된 답변")
+            else:
+                with perf.section("chat.stream"):
+                    stream = chat_with_ai(question, api_key, base_url)
+                    st.write_stream(stream)
+                if perf_enabled and stream.ttft is not None:
+                    st.session_state.perf_recorder.record("chat.first_token", stream.ttft)
+                answer = stream.text
+                if stream.error is None:
+                    answer_cache.put(key, answer)
+    st.session_state.chat_history.append({
+        "role": "assistant",
+        "content": answer
+    })
+    st.rerun()
 
 # 기능 1: 데이터 보기
 if menu == "1️⃣ 데이터 보기":
     st.header("📊 현재 데이터")
-    st.dataframe(df, use_container_width=True)
+    if dataset.is_partial:
+        st.info(f"💡 대용량 데이터: 전체 {stats.count:,}행 중 앞부분 {len(df):,}행만 표시합니다. 통계는 전체 기준입니다.")
+    show_paginated(df, "view")
     
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("총 인원", f"{len(df)}명")
+        st.metric("총 인원", f"{stats.count}명")
     with col2:
-        st.metric("총 소득", f"{df['income'].sum():,}원")
+        st.metric("총 소득", f"{stats.income_sum:,}원")
     with col3:
-        st.metric("총 세금", f"{df['tax'].sum():,}원")
+        st.metric("총 세금", f"{stats.tax_sum:,}원")
 
 # 기능 2: 세율 계산
 elif menu == "2️⃣ 세율 계산":
     st.header("📈 세율 계산")
-    df_with_rate = df.copy()
-    df_with_rate['tax_rate'] = (df_with_rate['tax'] / df_with_rate['income'] * 100).round(2)
+    df_with_rate = cache.get_or_compute((fingerprint, "tax_rate_frame"),
+                                        lambda: df.assign(tax_rate=dataset.tax_rate()))
     st.dataframe(df_with_rate, use_container_width=True)
     
     if st.button("💾 세율을 데이터에 추가"):
-        st.session_state.df = df_with_rate
+        dataset.enable_tax_rate()
+        persist_dataset(dataset)
         st.success("✅ 세율이 추가되었습니다!")
         st.rerun()
 
 # 기능 3: 조건부 서식
 elif menu == "3️⃣ 조건부 서식":
     st.header("🎨 조건부 서식")
-    st.write("**소득 구간별 색상:**")
-    st.write("🔴 고소득자 (≥5000): 빨강")
-    st.write("🟡 중소득자 (4000~4999): 노랑")
-    st.write("🟢 저소득자 (<4000): 초록")
     
-    def highlight_income(row):
-        if row['income'] >= 5000:
-            return ['background-color: #ffcccc'] * len(row)
-        elif row['income'] >= 4000:
-            return ['background-color: #ffffcc'] * len(row)
-        else:
-            return ['background-color: #ccffcc'] * len(row)
+    col1, col2 = st.columns(2)
+    with col1:
+        mid_threshold = st.number_input("중소득 기준 (이상)", min_value=0,
+                                        value=DEFAULT_THRESHOLDS[0], step=100)
+    with col2:
+        high_threshold = st.number_input("고소득 기준 (이상)", min_value=0,
+                                         value=DEFAULT_THRESHOLDS[1], step=100)
     
-    styled_df = df.style.apply(highlight_income, axis=1)
-    st.dataframe(styled_df, use_container_width=True)
+    if mid_threshold >= high_threshold:
+        st.error("❌ 고소득 기준은 중소득 기준보다 커야 합니다.")
+    else:
+        thresholds = (int(mid_threshold), int(high_threshold))
+        st.write("**소득 구간별 색상:**")
+        for line in band_legend(thresholds):
+            st.write(line)
+        
+        # 구간 코드는 소득 열 전체에 대해 한 번만 계산(캐시), 서식은 보이는 페이지에만 적용
+        codes = derived(("income_bands", thresholds),
+                        lambda ds: band_codes(ds.income, thresholds),
+                        lambda codes, ds, deltas: update_band_codes(codes, deltas, thresholds))
+        show_paginated(df, "styled", style=lambda start, stop: style_window(df, codes, start, stop))
 
 # 기능 4: 통계 분석
 elif menu == "4️⃣ 통계 분석":
     st.header("📊 통계 요약")
     
-    total_income = df['income'].sum()
-    total_tax = df['tax'].sum()
-    avg_income = df['income'].mean()
-    avg_tax = df['tax'].mean()
-    max_income = df['income'].max()
-    min_income = df['income'].min()
-    avg_tax_rate = (total_tax / total_income * 100)
+    total_income = stats.income_sum
+    total_tax = stats.tax_sum
+    avg_income = stats.income_mean
+    avg_tax = stats.tax_mean
+    max_income = stats.income_max
+    min_income = stats.income_min
+    avg_tax_rate = stats.effective_rate
     
     col1, col2 = st.columns(2)
     
@@ -152,7 +337,7 @@ elif menu == "4️⃣ 통계 분석":
             '항목': ['총 인원', '총 소득', '총 세금', '평균 소득', 
                     '평균 세금', '최고 소득', '최저 소득', '평균 세율'],
             '값': [
-                f"{len(df)}명",
+                f"{stats.count}명",
                 f"{total_income:,.0f}원",
                 f"{total_tax:,.0f}원",
                 f"{avg_income:,.0f}원",
@@ -166,10 +351,8 @@ elif menu == "4️⃣ 통계 분석":
     
     with col2:
         st.subheader("📊 소득 분포")
-        fig = px.histogram(df, x='income', nbins=10, 
-                          title='소득 분포',
-                          labels={'income': '소득', 'count': '인원'})
-        st.plotly_chart(fig, use_container_width=True)
+        inputs = (lambda: {"index": get_index()}) if len(df) > charts.DEFAULT_MAX_POINTS else None
+        show_figure(*cached_figure("income_histogram", charts.income_histogram, inputs=inputs))
 
 # 기능 5: 새 데이터 추가
 elif menu == "5️⃣ 새 데이터 추가":
@@ -189,114 +372,272 @@ elif menu == "5️⃣ 새 데이터 추가":
         
         if submitted:
             if new_name:
-                new_row = pd.DataFrame({
-                    'name': [new_name],
-                    'income': [new_income],
-                    'tax': [new_tax]
-                })
-                st.session_state.df = pd.concat([st.session_state.df, new_row], 
-                                                ignore_index=True)
+                dataset.append(new_name, new_income, new_tax)
+                persist_dataset(dataset)
                 st.success(f"✅ {new_name}님의 데이터가 추가되었습니다!")
                 st.rerun()
             else:
                 st.error("❌ 이름을 입력해주세요!")
     
+    # 행 수정·삭제 – 데이터셋이 변경 행을 기록하므로 집계·세율·인덱스·차트 집계는 그 행만 다시 계산
+    st.subheader("✏️ 데이터 수정 / 삭제")
+    if dataset.is_partial:
+        st.info("💡 대용량 모드(미리보기만 보관) 데이터는 수정·삭제할 수 없습니다.")
+    elif len(dataset) == 0:
+        st.info("데이터가 없습니다.")
+    else:
+        row = st.number_input("행 번호", min_value=0, max_value=len(dataset) - 1, value=0, step=1)
+        current = df.iloc[row]
+        with st.form("edit_data_form"):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                edit_name = st.text_input("이름", value=str(current["name"]))
+            with col2:
+                edit_income = st.number_input("소득", min_value=min(0, int(current["income"])),
+                                              value=int(current["income"]), step=100)
+            with col3:
+                edit_tax = st.number_input("세금", min_value=min(0, int(current["tax"])),
+                                           value=int(current["tax"]), step=10)
+            col1, col2 = st.columns(2)
+            with col1:
+                update_clicked = st.form_submit_button("수정하기", type="primary")
+            with col2:
+                delete_clicked = st.form_submit_button("삭제하기")
+        
+        if update_clicked:
+            if edit_name:
+                dataset.update(row, name=edit_name, income=edit_income, tax=edit_tax)
+                persist_dataset(dataset)
+                st.success(f"✅ {row}행이 수정되었습니다!")
+                st.rerun()
+            else:
+                st.error("❌ 이름을 입력해주세요!")
+        elif delete_clicked:
+            dataset.delete(row)
+            persist_dataset(dataset)
+            st.success(f"✅ {row}행이 삭제되었습니다!")
+            st.rerun()
+    
     st.subheader("현재 데이터")
-    st.dataframe(df, use_container_width=True)
+    show_paginated(df, "add")
 
 # 기능 6: 차트 생성
 elif menu == "6️⃣ 차트 생성":
     st.header("📊 데이터 시각화")
     
-    chart_type = st.selectbox(
-        "차트 유형 선택:",
-        ["막대 차트", "라인 차트", "파이 차트", "산점도"]
-    )
-    
-    if chart_type == "막대 차트":
-        fig = go.Figure()
-        fig.add_trace(go.Bar(x=df['name'], y=df['income'], 
-                            name='소득', marker_color='lightblue'))
-        fig.add_trace(go.Bar(x=df['name'], y=df['tax'], 
-                            name='세금', marker_color='lightcoral'))
-        fig.update_layout(title='소득 및 세금 비교', 
-                         xaxis_title='이름', yaxis_title='금액 (원)',
-                         barmode='group')
-        st.plotly_chart(fig, use_container_width=True)
-    
-    elif chart_type == "라인 차트":
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=df['name'], y=df['income'], 
-                                mode='lines+markers', name='소득'))
-        fig.add_trace(go.Scatter(x=df['name'], y=df['tax'], 
-                                mode='lines+markers', name='세금'))
-        fig.update_layout(title='소득 및 세금 추이',
-                         xaxis_title='이름', yaxis_title='금액 (원)')
-        st.plotly_chart(fig, use_container_width=True)
-    
-    elif chart_type == "파이 차트":
-        fig = px.pie(df, values='income', names='name', 
-                    title='소득 비율')
-        st.plotly_chart(fig, use_container_width=True)
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        chart_type = st.selectbox(
+            "차트 유형 선택:",
+            ["막대 차트", "라인 차트", "파이 차트", "산점도"]
+        )
+    with col2:
+        max_points = st.number_input(
+            "최대 표시 점 수", min_value=100, max_value=100_000,
+            value=charts.DEFAULT_MAX_POINTS, step=500,
+            help="행 수가 이보다 많으면 집계/다운샘플링 후 표시합니다."
+        )
     
-    elif chart_type == "산점도":
-        fig = px.scatter(df, x='income', y='tax', text='name',
-                        title='소득-세금 상관관계',
-                        labels={'income': '소득', 'tax': '세금'})
-        fig.update_traces(textposition='top center')
-        st.plotly_chart(fig, use_container_width=True)
+    inputs = None
+    if len(df) > max_points:
+        st.info(f"💡 {len(df):,}행 → 최대 {max_points:,}점으로 줄여 표시합니다.")
+        if chart_type in charts.USES_TOTALS:
+            inputs = lambda: {"totals": get_name_totals().frame(df["name"].cat.categories)}
+    show_figure(*cached_figure(chart_type, charts.CHARTS[chart_type], int(max_points), inputs))
 
 # 기능 7: 데이터 업로드/다운로드
 elif menu == "7️⃣ 데이터 업로드/다운로드":
     st.header("📁 데이터 가져오기/내보내기")
     
-    st.subheader("📤 CSV 파일 업로드")
-    uploaded_file = st.file_uploader("CSV 파일을 선택하세요", type=['csv'])
+    st.subheader("📤 파일 업로드 (CSV / Parquet / Arrow / zip)")
+    uploaded_files = st.file_uploader("파일을 선택하세요 (여러 개 또는 zip 묶음 가능 – 순서대로 합쳐집니다)",
+                                      type=['csv', 'txt', 'parquet', 'pq', 'arrow', 'feather', 'ipc', 'zip'],
+                                      accept_multiple_files=True)
+    # 저장소가 있으면 청크를 바로 디스크에 쓰므로 메모리에 전체를 올리지 않고도 전체 데이터를 쓸 수 있다
+    stream_only = store is None and st.checkbox(
+        "대용량 모드 (전체 데이터를 메모리에 올리지 않고 통계와 미리보기만 유지)",
+        value=False,
+        help="수 GB 파일은 청크 단위로 읽어 집계만 계산합니다. 표/차트는 앞부분 미리보기 기준입니다."
+    )
     
-    if uploaded_file is not None:
+    if uploaded_files:
         try:
-            new_df = pd.read_csv(uploaded_file)
-            st.success("✅ 파일이 업로드되었습니다!")
-            st.dataframe(new_df, use_container_width=True)
+            # 같은 파일 묶음은 재실행마다 다시 읽지 않음
+            # 파일은 스레드 풀에서 동시에 읽고, 끝난 순서가 아니라 파일 순서대로 바로 저장소/데이터셋에 이어 붙인다
+            upload_key = (tuple(f.file_id for f in uploaded_files), stream_only)
+            if st.session_state.get('upload_key') != upload_key:
+                progress = st.empty()
+                on_file = lambda report, done, total: progress.caption(
+                    f"⏳ 파일 {done}/{total} 합치는 중... ({report.name})")
+                started = time.perf_counter()
+                upload_dataset = None
+                if store is not None:
+                    with store.writer() as writer:
+                        result = ingest_many(uploaded_files, materialize=False, on_file=on_file, sink=writer.write)
+                        st.session_state.upload_dataset_id = writer.commit(result.stats)
+                elif stream_only:
+                    result = ingest_many(uploaded_files, materialize=False, on_file=on_file)
+                else:
+                    upload_dataset = TaxDataset()
+                    result = ingest_many(uploaded_files, materialize=False, on_file=on_file,
+                                         sink=upload_dataset.extend)
+                progress.empty()
+                st.session_state.upload_key = upload_key
+                st.session_state.upload_result = result
+                st.session_state.upload_dataset = upload_dataset
+                st.session_state.upload_seconds = time.perf_counter() - started
+            result = st.session_state.upload_result
+            failed = [f for f in result.files if f.error]
             
-            if st.button("이 데이터로 교체하기"):
-                st.session_state.df = new_df
-                st.success("✅ 데이터가 교체되었습니다!")
-                st.rerun()
+            report = pd.DataFrame({
+                "파일": [f.name for f in result.files],
+                "행 수": [f.rows for f in result.files],
+                "읽기 시간 (ms)": [round(f.seconds * 1000, 1) for f in result.files],
+                "행/초": [round(f.rows / f.seconds) if f.seconds > 0 else 0 for f in result.files],
+                "상태": ["❌ " + f.error if f.error else "✅" for f in result.files],
+            })
+            st.dataframe(report, use_container_width=True, hide_index=True)
+            st.caption(f"파일 {len(result.files)}개 · 전체 {st.session_state.upload_seconds:.2f}초 "
+                       f"(파일별 읽기 시간 합 {sum(f.seconds for f in result.files):.2f}초)")
+            if failed:
+                st.warning(f"⚠️ {len(failed)}개 파일은 오류로 제외했습니다.")
+            
+            if result.stats.count == 0:
+                st.error("❌ 합칠 수 있는 데이터가 없습니다.")
+            else:
+                st.success(f"✅ 파일이 업로드되었습니다! ({result.stats.count:,}행, {result.chunks}개 청크)")
+                if len(result.preview) < result.stats.count:
+                    st.caption(f"미리보기: 앞부분 {len(result.preview):,}행")
+                show_paginated(result.preview, "upload")
+                
+                # 이어 붙이기는 기존 데이터의 변경으로 기록되어 인덱스·차트 집계가 새 행만 반영한다
+                can_append = not dataset.is_partial and (store is not None
+                                                         or st.session_state.upload_dataset is not None)
+                col1, col2 = st.columns(2)
+                with col1:
+                    replace_clicked = st.button("이 데이터로 교체하기")
+                with col2:
+                    append_clicked = st.button("현재 데이터에 이어 붙이기", disabled=not can_append,
+                                               help=None if can_append else
+                                               "대용량 모드에서는 이어 붙일 수 없습니다.")
+                
+                if append_clicked:
+                    if store is not None:
+                        uploaded = store.load(st.session_state.upload_dataset_id)
+                    else:
+                        uploaded = st.session_state.upload_dataset
+                    dataset.extend(uploaded.frame())
+                    persist_dataset(dataset)
+                    st.success(f"✅ {result.stats.count:,}행을 현재 데이터에 이어 붙였습니다!")
+                    st.rerun()
+                if replace_clicked:
+                    if store is not None:
+                        dataset_id = st.session_state.upload_dataset_id
+                        st.session_state.dataset = store.load(dataset_id)
+                        persist_dataset(st.session_state.dataset)
+                    elif st.session_state.upload_dataset is not None:
+                        # 업로드하면서 이미 합쳐 둔 데이터셋을 그대로 사용 (복사 없음)
+                        st.session_state.dataset = st.session_state.upload_dataset
+                    else:
+                        st.session_state.dataset = TaxDataset.from_ingest(result)
+                    st.success("✅ 데이터가 교체되었습니다!")
+                    st.rerun()
         except Exception as e:
             st.error(f"❌ 파일 읽기 오류: {e}")
     
     st.markdown("---")
     
     st.subheader("📥 현재 데이터 다운로드")
+    st.caption("파일은 다운로드 버튼을 누를 때 만들어지며, 같은 데이터는 다시 만들지 않습니다.")
+    if dataset.is_partial:
+        st.info(f"💡 대용량 모드: 보관 중인 앞부분 {len(df):,}행만 내보냅니다.")
     
-    col1, col2 = st.columns(2)
+    # 다운로드 클릭 시에만 생성 (별도 스레드) → 데이터 버전·형식별로 캐시
+    # 계측 중이면 파일 생성 시간을 단독 이벤트로 기록 (스크립트 실행이 끝난 뒤 다른 스레드에서 실행됨)
+    def cached_export(fmt, frame=df, key=(fingerprint, "export", tuple(df.columns)),
+                      recorder=st.session_state.get("perf_recorder") if perf_enabled else None):
+        def build():
+            if recorder is None:
+                return export_bytes(frame, fmt)
+            with recorder.event(f"export.{fmt}", rows=len(frame)):
+                return export_bytes(frame, fmt)
+        return cache.get_or_compute(key + (fmt,), build)
+    
+    cols = st.columns(len(EXPORT_FORMATS))
+    for col, (fmt, spec) in zip(cols, EXPORT_FORMATS.items()):
+        with col:
+            too_large = fmt == "xlsx" and len(df) + 1 > EXCEL_MAX_ROWS
+            st.download_button(
+                label=spec.label,
+                data=lambda fmt=fmt: cached_export(fmt),
+                file_name=f'tax_data{spec.extension}',
+                mime=spec.mime,
+                on_click="ignore",
+                disabled=too_large,
+                help=f"Excel 은 최대 {EXCEL_MAX_ROWS - 1:,}행까지 저장할 수 있습니다." if too_large else None,
+                key=f"download_{fmt}",
+            )
     
+    show_paginated(df, "download")
+
+# 기능 8: 데이터 조회
+elif menu == "8️⃣ 데이터 조회":
+    st.header("🔎 데이터 조회")
+    if dataset.is_partial:
+        st.info(f"💡 대용량 데이터: 보관 중인 앞부분 {len(df):,}행에서 조회합니다.")
+    index = get_index()
+    
+    st.subheader("조건 검색")
+    col1, col2, col3 = st.columns(3)
     with col1:
-        csv = df.to_csv(index=False).encode('utf-8-sig')
-        st.download_button(
-            label="📄 CSV 다운로드",
-            data=csv,
-            file_name='tax_data.csv',
-            mime='text/csv',
+        income_min = st.number_input("소득 최소 (이상)", value=None, step=100, placeholder="제한 없음")
+        income_max = st.number_input("소득 최대 (이하)", value=None, step=100, placeholder="제한 없음")
+    with col2:
+        tax_min = st.number_input("세금 최소 (이상)", value=None, step=10, placeholder="제한 없음")
+        tax_max = st.number_input("세금 최대 (이하)", value=None, step=10, placeholder="제한 없음")
+    with col3:
+        names_text = st.text_input("이름 (쉼표로 구분)", placeholder="예: Kim, Lee")
+        sort_label = st.selectbox("정렬", ["행 순서", "소득", "세금"])
+        descending = st.checkbox("내림차순", value=False)
+    
+    names = tuple(name.strip() for name in names_text.split(",") if name.strip())
+    unknown = [name for name in names if not len(index.rows_of(name))]
+    if unknown:
+        st.warning(f"⚠️ 데이터에 없는 이름: {', '.join(unknown)}")
+    with perf.section("query.run"):
+        result = index.query(
+            Filter(income_min, income_max, tax_min, tax_max, names),
+            sort_by={"소득": "income", "세금": "tax"}.get(sort_label),
+            descending=descending,
         )
     
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("조건에 맞는 인원", f"{len(result):,}명")
     with col2:
-        output = BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='데이터', index=False)
-        excel_data = output.getvalue()
-        
-        st.download_button(
-            label="📊 Excel 다운로드",
-            data=excel_data,
-            file_name='tax_data.xlsx',
-            mime='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-        )
+        st.metric("전체 대비", f"{len(result) / result.total:.1%}" if result.total else "-")
+    show_paginated(df, "query", result=result)
     
-    st.dataframe(df, use_container_width=True)
+    st.markdown("---")
+    st.subheader("📐 순위 · 분위수")
+    if index.n == 0:
+        st.info("데이터가 없습니다.")
+    else:
+        column_label = st.radio("기준 열", ["소득", "세금"], horizontal=True)
+        column = {"소득": "income", "세금": "tax"}[column_label]
+        col1, col2 = st.columns(2)
+        with col1:
+            q = st.slider("분위 (%)", min_value=0, max_value=100, value=50)
+            st.metric(f"{column_label} {q}% 분위수", f"{index.percentile(column, q):,.0f}원")
+            value = st.number_input(f"{column_label} 값의 백분위 순위", value=int(index.percentile(column, 50)),
+                                    step=100)
+            st.caption(f"{value:,}원보다 낮은 사람: 전체의 {index.percentile_rank(column, value):.1f}%")
+        with col2:
+            k = st.number_input("상위/하위 인원 수", min_value=1, max_value=100, value=10)
+            largest = st.radio("방향", ["상위", "하위"], horizontal=True) == "상위"
+            st.dataframe(df.iloc[index.top_k(column, k, largest=largest)], use_container_width=True)
 
-# 기능 8: AI 챗봇
+# 기능 9: AI 챗봇
 elif menu == "🤖 AI 챗봇":
     st.header("🤖 AI 데이터 분석 챗봇")
     
@@ -308,6 +649,13 @@ elif menu == "🤖 AI 챗봇":
         help="https://platform.openai.com/api-keys 에서 발급받을 수 있습니다."
     )
     
+    with st.expander("⚙️ 고급 설정"):
+        base_url = st.text_input(
+            "API 엔드포인트 (선택):",
+            placeholder="https://api.openai.com/v1",
+            help="OpenAI 호환 서버나 로컬 스텁(taxdata.chat_stub)을 쓸 때만 입력하세요."
+        ).strip() or None
+    
     if not api_key:
         st.warning("⚠️ API 키를 입력해야 챗봇을 사용할 수 있습니다.")
         st.markdown("""
@@ -326,6 +674,10 @@ elif menu == "🤖 AI 챗봇":
         - 신규 가입 시 $5 무료 크레딧 제공 (3개월간 유효)
         """)
     else:
+        data_context = get_data_context()
+        st.caption(f"📏 데이터 컨텍스트: 약 {data_context.tokens:,} 토큰 "
+                   f"(전체 {data_context.rows_total:,}행 중 {data_context.rows_included:,}행 포함)")
+        
         # 채팅 히스토리 표시
         for msg in st.session_state.chat_history:
             with st.chat_message(msg["role"]):
@@ -335,20 +687,7 @@ elif menu == "🤖 AI 챗봇":
         user_input = st.chat_input("데이터에 대해 질문해보세요...")
         
         if user_input:
-            st.session_state.chat_history.append({
-                "role": "user",
-                "content": user_input
-            })
-            
-            with st.spinner("🤔 AI가 생각 중..."):
-                ai_response = chat_with_ai(user_input, api_key)
-            
-            st.session_state.chat_history.append({
-                "role": "assistant",
-                "content": ai_response
-            })
-            
-            st.rerun()
+            answer_question(user_input, api_key, base_url)
         
         # 채팅 초기화 버튼
         if st.button("🗑️ 대화 기록 삭제"):
@@ -367,26 +706,96 @@ elif menu == "🤖 AI 챗봇":
         ]
         
         cols = st.columns(2)
+        clicked = None
         for idx, question in enumerate(example_questions):
             with cols[idx % 2]:
                 if st.button(question, key=f"example_{idx}"):
-                    st.session_state.chat_history.append({
-                        "role": "user",
-                        "content": question
-                    })
-                    with st.spinner("🤔 AI가 생각 중..."):
-                        ai_response = chat_with_ai(question, api_key)
-                    st.session_state.chat_history.append({
-                        "role": "assistant",
-                        "content": ai_response
-                    })
-                    st.rerun()
+                    clicked = question
+        if clicked:
+            answer_question(clicked, api_key, base_url)
+
+# 캐시 상태 (적중/실패 횟수로 캐시 크기 조정)
+with st.sidebar.expander("🗄️ 캐시 상태", expanded=False):
+    cache_stats = cache.stats()
+    st.caption(
+        f"항목 {cache_stats['entries']}개 · {cache_stats['bytes'] / 1024 / 1024:,.1f} / "
+        f"{cache_stats['max_bytes'] / 1024 / 1024:,.0f} MB\n\n"
+        f"적중 {cache_stats['hits']:,} · 실패 {cache_stats['misses']:,} · "
+        f"적중률 {cache_stats['hit_rate']:.0%} · 제거 {cache_stats['evictions']:,}"
+    )
+    answer_stats = answer_cache.stats()
+    st.caption(
+        f"챗봇 답변 {answer_stats['entries']}개 ({answer_stats['backend']}) · "
+        f"적중 {answer_stats['hits']:,} · 실패 {answer_stats['misses']:,} · "
+        f"적중률 {answer_stats['hit_rate']:.0%}"
+    )
+    derived_cache = st.session_state.derived
+    st.caption(f"이 세션의 파생 결과: 변경분 반영 {derived_cache.updates:,}회 · 새로 계산 {derived_cache.builds:,}회")
+    if store is not None:
+        store_stats = store.stats()
+        st.caption(
+            f"저장된 데이터셋 {store_stats['datasets']}개 · {store_stats['bytes'] / 1024 / 1024:,.1f} / "
+            f"{store_stats['max_bytes'] / 1024 / 1024:,.0f} MB · 열림 {store_stats['open']}개"
+        )
+
+# 세션 메모리 – 이 세션이 따로 들고 있는 바이트 (저장소 memmap·프로세스 전역 캐시는 모든 세션이 공유하므로 제외)
+def session_memory_usage():
+    upload = st.session_state.get("upload_result")
+    upload_dataset = st.session_state.get("upload_dataset")
+    usage = {
+        "dataset": dataset.memory_usage(),
+        "upload": (frame_nbytes(upload.frame) + frame_nbytes(upload.preview) if upload is not None else 0)
+                  + (upload_dataset.memory_usage()["total"]
+                     if upload_dataset is not None and upload_dataset is not dataset else 0),
+        "chat": sum(len(m["content"].encode("utf-8")) for m in st.session_state.chat_history),
+    }
+    usage["total"] = usage["dataset"]["total"] + usage["upload"] + usage["chat"]
+    return usage
+
+with st.sidebar.expander("💾 세션 메모리", expanded=False):
+    memory = session_memory_usage()
+    data_memory = memory["dataset"]
+    st.caption(
+        f"이 세션 {format_bytes(memory['total'])} – 데이터 {format_bytes(data_memory['total'])} · "
+        f"업로드 {format_bytes(memory['upload'])} · 대화 {format_bytes(memory['chat'])}\n\n"
+        f"공유(저장소 memmap) {format_bytes(data_memory['shared'])} · "
+        f"열 dtype: " + ", ".join(f"{k} {v}" for k, v in data_memory["dtypes"].items())
+    )
+    if perf_enabled:
+        st.session_state.perf_recorder.annotate(session_bytes=memory["total"], shared_bytes=data_memory["shared"])
 
 # 푸터
 st.markdown("---")
-st.markdown("""
+storage_note = ("데이터는 저장소에 보관되며, 주소(?dataset=…)로 새로고침 후에도 이어서 볼 수 있습니다"
+                if store is not None else "데이터는 세션에만 저장되며, 새로고침 시 초기화됩니다")
+st.markdown(f"""
 <div style='text-align: center; color: gray;'>
     💡 VBA 예제를 Streamlit + OpenAI로 구현한 웹 서비스입니다<br>
-    데이터는 세션에만 저장되며, 새로고침 시 초기화됩니다
+    {storage_note}
 </div>
 """, unsafe_allow_html=True)
+
+# 성능 패널 (?perf=1) – 이번 실행의 구간별 시간·메모리, 체크하면 다음 실행부터 cProfile / tracemalloc 결과도 표시
+if perf_enabled:
+    recorder = st.session_state.perf_recorder
+    report = recorder.end_run()
+    with st.sidebar.expander("⏱️ 성능", expanded=True):
+        st.caption(f"이번 실행 {report.seconds * 1000:,.1f} ms · 로그: {PERF_LOG_PATH}")
+        if report.sections:
+            st.dataframe(
+                pd.DataFrame(report.sections).assign(ms=lambda t: t["seconds"] * 1000)
+                  [["name", "calls", "ms", "alloc_mb", "peak_mb"]]
+                  .rename(columns={"name": "구간", "calls": "횟수", "alloc_mb": "순할당 MB", "peak_mb": "최대 MB"}),
+                hide_index=True, use_container_width=True,
+            )
+        col1, col2 = st.columns(2)
+        with col1:
+            st.checkbox("cProfile", key="perf_profile")
+        with col2:
+            st.checkbox("tracemalloc", key="perf_tracemalloc")
+        if report.profile:
+            st.code(report.profile, language=None)
+        if report.allocations:
+            st.code("\n".join(report.allocations), language=None)
+        for event in list(recorder.events)[-5:]:
+            st.caption(f"{event['event']}: {event['seconds'] * 1000:,.1f} ms")
@@ -0,0 +1,67 @@
+# taxcore/__init__.py
+# 세금·근로장려금 계산 코어 – Streamlit UI 없이 import 가능한 순수 계산 로직
+#
+# 하위 모듈은 이름에 처음 접근할 때 불러온다 (PEP 562).
+# `import taxcore` 만으로는 표준 라이브러리 외 어떤 패키지도 불러오지 않으며,
+# NumPy 가 필요한 일괄 계산(batch)도 calc_eitc_batch 등에 접근할 때만 로드된다.
+
+import importlib
+
+# 공개 이름 → 정의된 하위 모듈
+_EXPORTS = {
+    # 귀속연도별 파라미터 레지스트리
+    "get_schedule": "params",
+    "available_schedules": "params",
+    "available_years": "params",
+    # 2024년 귀속 (app.py)
+    "PARAMS": "eitc",
+    "HOUSEHOLD_TYPES": "eitc",
+    "calc_eitc": "eitc",
+    "apply_property_adjustment": "eitc",
+    "apply_late_filing_adjustment": "eitc",
+    "payment_status": "eitc",
+    # 2025년 산정표 (earned_income_credit_2025.py)
+    "get_eitc_amount": "eitc_2025",
+    # 65세 이상 가산 (work1.py / eitc_app.py)
+    "get_max_eitc": "eitc_age",
+    # 종합소득세 (tax.py / income_tax_app.py)
+    "tax_brackets": "income_tax",
+    "calculate_income_tax": "income_tax",
+    "calculate_income_tax_batch": "income_tax",
+    "BracketTable": "income_tax",
+    "INCOME_TAX_2025": "income_tax",
+    "classify_income_level": "income_tax",
+    "LOCAL_TAX_RATE": "income_tax",
+    # 사전 계산 조회표 (mmap 공유)
+    "EitcLookupTable": "lookup",
+    "get_lookup_table": "lookup",
+    "open_shared_table": "lookup",
+    # 일괄 계산 (NumPy)
+    "calc_eitc_batch": "batch",
+    "calc_eitc_frame": "batch",
+    "EitcBatchResult": "batch",
+    # 순소득 파이프라인 (세금 + 근로장려금)
+    "calc_net_income": "net_income",
+    "calc_net_income_batch": "net_income",
+    "calc_net_income_frame": "net_income",
+    "NetIncomeResult": "net_income",
+    # 시나리오 스윕 (소득별 곡선)
+    "sweep": "sweep",
+    "income_grid": "sweep",
+    "SweepResult": "sweep",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,145 @@
+# taxcore/batch.py
+# 근로장려금 일괄 계산 엔진 – app.py 규칙(2024년 귀속)을 NumPy 배열 단위로 계산
+#
+# calc_eitc → apply_property_adjustment → apply_late_filing_adjustment 를
+# 가구 배열 전체에 대해 한 번에 수행하며, 결과는 스칼라 함수와 비트 단위로 동일하다.
+# (int() 절사 포함: 양수 float → int64 변환은 0 방향 절사)
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .eitc import (
+    HOUSEHOLD_TYPES,
+    PARAMS,
+    PROPERTY_EXCLUDE_LIMIT,
+    PROPERTY_REDUCE_LIMIT,
+    STATUS_NORMAL,
+    STATUS_NOT_ELIGIBLE,
+    STATUS_PROPERTY_EXCLUDED,
+    STATUS_REDUCED,
+)
+
+# ------------------------------
+# 1️⃣ 가구유형 코드별 파라미터 배열
+# ------------------------------
+def _param_column(key: str) -> np.ndarray:
+    return np.array([PARAMS[t][key] for t in HOUSEHOLD_TYPES], dtype=np.int64)
+
+_MAX = _param_column("max")
+_PHASE_IN_START = _param_column("phase_in_start")
+_PEAK_START = _param_column("peak_start")
+_PEAK_END = _param_column("peak_end")
+_UPPER = _param_column("upper_income")
+
+_CODE_OF = {name: code for code, name in enumerate(HOUSEHOLD_TYPES)}
+
+# 구간 폭이 모두 양수이면 min(상승 직선, 하강 직선)으로 분기 없이 계산 (마스크 인덱싱 없음)
+_BRANCHLESS = bool((_PEAK_START > _PHASE_IN_START).all() and (_UPPER > _PEAK_END).all())
+
+
+class EitcBatchResult(NamedTuple):
+    """일괄 계산 결과 (모든 필드는 입력과 같은 길이의 배열)"""
+    base_amount: np.ndarray     # 기본 산정액 (calc_eitc)
+    prop_adjusted: np.ndarray   # 재산 조정 후
+    final_amount: np.ndarray    # 최종 지급액 (기한후신고 반영)
+    status: np.ndarray          # 지급 판정 코드 (eitc.STATUS_*)
+
+
+def household_codes(household_type) -> np.ndarray:
+    """가구유형 배열('단독'/'홑벌이'/'맞벌이' 또는 0/1/2 코드)을 정수 코드로 변환"""
+    arr = np.asarray(household_type)
+    if arr.dtype.kind in "iu":
+        codes = arr.astype(np.intp, copy=False)
+        if codes.size and (codes.min() < 0 or codes.max() >= len(HOUSEHOLD_TYPES)):
+            raise ValueError("가구 유형 코드는 0(단독), 1(홑벌이), 2(맞벌이) 중 하나여야 합니다.")
+        return codes
+
+    try:
+        codes = np.fromiter(map(_CODE_OF.__getitem__, arr.ravel().tolist()), dtype=np.intp, count=arr.size)
+    except (KeyError, TypeError):
+        raise ValueError("가구 유형은 '단독', '홑벌이', '맞벌이' 중 하나여야 합니다.") from None
+    return codes.reshape(arr.shape)
+
+
+# ------------------------------
+# 2️⃣ 일괄 계산
+# ------------------------------
+def calc_eitc_batch(income, household_type, property_value=0, late_filing=False) -> EitcBatchResult:
+    """
+    근로장려금 일괄 계산
+    income: 연간 총소득 배열 (원, 정수)
+    household_type: 가구유형 배열 (문자열 또는 코드)
+    property_value: 재산가액 배열 또는 스칼라 (원)
+    late_filing: 기한 후 신고 여부 배열 또는 스칼라
+    """
+    income = np.asarray(income, dtype=np.int64)
+    codes = household_codes(household_type)
+    prop = np.asarray(property_value, dtype=np.int64)
+    late = np.asarray(late_filing, dtype=bool)
+    income, codes, prop, late = np.broadcast_arrays(income, codes, prop, late)
+
+    base = _base_amounts(income, codes)
+
+    # 재산 기준 감액 또는 제외
+    reduce = (prop > PROPERTY_REDUCE_LIMIT) & (prop <= PROPERTY_EXCLUDE_LIMIT)
+    exclude = prop > PROPERTY_EXCLUDE_LIMIT
+    prop_adjusted = np.where(exclude, 0, np.where(reduce, (base * 0.5).astype(np.int64), base))
+
+    # 기한 후 신고 감액
+    final = np.where(late, (prop_adjusted * 0.9).astype(np.int64), prop_adjusted)
+
+    # 지급 판정 (app.py 팝업 분기와 동일)
+    zero = final == 0
+    status = np.select(
+        [zero & exclude, zero, reduce | late],
+        [STATUS_PROPERTY_EXCLUDED, STATUS_NOT_ELIGIBLE, STATUS_REDUCED],
+        default=STATUS_NORMAL,
+    ).astype(np.int8)
+
+    return EitcBatchResult(base, prop_adjusted, final, status)
+
+
+def _base_amounts(income: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """기본 산정액 (calc_eitc) – 입력은 같은 모양의 int64 소득 / 가구유형 코드 배열"""
+    max_amt = _MAX[codes]
+    s = _PHASE_IN_START[codes]
+    peak_start = _PEAK_START[codes]
+    peak_end = _PEAK_END[codes]
+    upper = _UPPER[codes]
+
+    if _BRANCHLESS:
+        # 소득을 [s, upper] 로 자르면 상승·하강 직선 모두 0 ~ max 범위 → 작은 쪽이 산정액
+        # (각 구간에서 calc_eitc 와 같은 곱셈·나눗셈 순서이므로 절사 결과도 같다)
+        x = np.clip(income, s, upper)
+        rising = max_amt * (np.minimum(x, peak_start) - s) / (peak_start - s)
+        falling = max_amt * (upper - np.maximum(x, peak_end)) / (upper - peak_end)
+        return np.asarray(np.minimum(rising, falling)).astype(np.int64)
+
+    # 구간별 마스크에 해당하는 원소만 계산 (미사용 구간의 오버플로·0 나눗셈 방지)
+    base = np.zeros(income.shape, dtype=np.int64)
+    phase_in = (income >= s) & (income < peak_start)
+    plateau = (income >= peak_start) & (income <= peak_end)
+    phase_out = (income > peak_end) & (income < upper)
+
+    base[plateau] = max_amt[plateau]
+    m = max_amt[phase_in]
+    base[phase_in] = (m * (income[phase_in] - s[phase_in]) / (peak_start[phase_in] - s[phase_in])).astype(np.int64)
+    m = max_amt[phase_out]
+    base[phase_out] = (m * (upper[phase_out] - income[phase_out]) / (upper[phase_out] - peak_end[phase_out])).astype(np.int64)
+    return base
+
+
+def calc_eitc_frame(df, income="income", household_type="household_type",
+                    property_value="property_value", late_filing="late_filing"):
+    """
+    DataFrame 단위 일괄 계산 – 결과 컬럼(base_amount, prop_adjusted, final_amount, status)을 붙인 새 DataFrame 반환
+    재산/기한후신고 컬럼이 없으면 각각 0, False 로 간주
+    """
+    result = calc_eitc_batch(
+        df[income].to_numpy(),
+        df[household_type].to_numpy(),
+        df[property_value].to_numpy() if property_value in df else 0,
+        df[late_filing].to_numpy() if late_filing in df else False,
+    )
+    return df.assign(**result._asdict())
@@ -0,0 +1,352 @@
+# taxcore/cli.py
+# 일괄 계산 명령줄 도구 – 가구·소득자 파일에 근로장려금(app.py 규칙)과 종합소득세(tax.py 세율표)를 적용
+#
+#   python -m taxcore.cli households.csv -o result.parquet [--workers 8] [--shard-mb 64]
+#
+# 입력 (CSV 또는 Parquet)
+#   income          연간 총소득 (원, 필수) – 과세표준은 --taxable-column 으로 따로 지정 가능
+#   household_type  '단독' / '홑벌이' / '맞벌이' (근로장려금 계산 시 필수)
+#   property_value  재산가액 (원, 선택 – 없으면 0)
+#   late_filing     기한 후 신고 여부 (선택 – 없으면 False)
+# 출력 (CSV 또는 Parquet): 입력 컬럼 + eitc_base, eitc_prop_adjusted, eitc_final, eitc_status,
+#                           income_tax, local_tax, total_tax, net_income (둘 다 계산할 때)
+#
+# 입력을 샤드(CSV: 레코드 경계에 맞춘 바이트 구간, Parquet: row group 묶음)로 나눠 프로세스 풀에서 처리한다.
+# 작업자는 자기 샤드를 직접 읽고 부분 파일로 쓰므로 큰 데이터가 프로세스 사이를 오가지 않으며,
+# 부분 파일은 마지막에 입력 순서대로 이어 붙인다. Parquet 부분 파일은 모두 같은 스키마(output_schema)로 쓴다.
+
+import argparse
+import csv
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from .batch import calc_eitc_batch, household_codes
+from .eitc import HOUSEHOLD_TYPES, STATUS_LABELS
+from .income_tax import INCOME_TAX_2025
+from .net_income import calc_net_income_batch
+
+DEFAULT_SHARD_MB = 64
+FORMATS = {".csv": "csv", ".txt": "csv", ".parquet": "parquet", ".pq": "parquet"}
+CSV_DTYPES = {"income": "int64", "property_value": "int64", "household_type": "category",
+              "late_filing": "boolean"}     # 그 밖의 컬럼은 문자열 그대로 (샤드마다 형식 추론이 달라지지 않도록)
+SCAN_BLOCK = 1 << 20
+TRUE_VALUES = ["True", "true", "TRUE", "1", "Y", "y", "예"]
+FALSE_VALUES = ["False", "false", "FALSE", "0", "N", "n", "아니오"]
+
+
+class Shard(NamedTuple):
+    index: int
+    fmt: str
+    path: str
+    start: int          # CSV: 바이트 오프셋 / Parquet: 첫 row group
+    stop: int           # CSV: 끝 오프셋(미포함) / Parquet: 끝 row group(미포함)
+    header: bytes       # CSV 머리글 레코드
+
+
+class ShardResult(NamedTuple):
+    index: int
+    part: str
+    rows: int
+    eitc_total: int
+    tax_total: int
+    status_counts: tuple
+    columns: tuple
+
+
+def detect_format(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    try:
+        return FORMATS[ext]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {ext or path} (CSV / Parquet)") from None
+
+
+# ------------------------------
+# 샤드 분할
+# ------------------------------
+def _finish_record(f, quoted: bool) -> None:
+    """현재 위치에서 레코드 끝(따옴표 밖의 줄바꿈 뒤)까지 읽음 – quoted: 지금 따옴표 안인지"""
+    while True:
+        line = f.readline()
+        quoted ^= line.count(b'"') % 2 == 1
+        if not quoted or not line:
+            return
+
+
+def _quote_parity(f, start: int, stop: int) -> bool:
+    """[start, stop) 구간의 따옴표 개수가 홀수인지 – 끝나면 파일 위치는 stop"""
+    f.seek(start)
+    count, left = 0, stop - start
+    while left > 0:
+        block = f.read(min(SCAN_BLOCK, left))
+        count += block.count(b'"')
+        left -= len(block)
+    return count % 2 == 1
+
+
+def csv_shards(path: str, shard_bytes: int) -> list[Shard]:
+    """
+    머리글을 뺀 본문을 shard_bytes 단위로 나누고, 경계를 다음 레코드 끝으로 맞춤
+    따옴표로 감싼 값 안의 줄바꿈에서 자르지 않도록 본문 전체의 따옴표 홀짝을 따라간다
+    (이스케이프된 따옴표 "" 는 짝수라 홀짝에 영향이 없다).
+    """
+    size = os.path.getsize(path)
+    shards = []
+    with open(path, "rb") as f:
+        _finish_record(f, False)                     # 머리글 레코드
+        start = f.tell()
+        f.seek(0)
+        header = f.read(start)
+        while start < size:
+            target = min(start + shard_bytes, size)
+            quoted = _quote_parity(f, start, target)     # 샤드 시작은 레코드 경계라 따옴표 밖
+            if target < size:
+                _finish_record(f, quoted)
+            stop = min(f.tell(), size)
+            shards.append(Shard(len(shards), "csv", path, start, stop, header))
+            start = stop
+    return shards
+
+
+def parquet_shards(path: str, shard_bytes: int) -> list[Shard]:
+    """row group 을 비압축 크기 합이 shard_bytes 이상이 되도록 묶음"""
+    import pyarrow.parquet as pq
+
+    meta = pq.ParquetFile(path).metadata
+    shards, start, acc = [], 0, 0
+    for i in range(meta.num_row_groups):
+        acc += meta.row_group(i).total_byte_size
+        if acc >= shard_bytes:
+            shards.append(Shard(len(shards), "parquet", path, start, i + 1, b""))
+            start, acc = i + 1, 0
+    if start < meta.num_row_groups:
+        shards.append(Shard(len(shards), "parquet", path, start, meta.num_row_groups, b""))
+    return shards
+
+
+# ------------------------------
+# 계산
+# ------------------------------
+def _read_csv(header: bytes, body: bytes) -> pd.DataFrame:
+    names = next(csv.reader(io.StringIO(header.decode("utf-8-sig"))), [])
+    return pd.read_csv(io.BytesIO(header + body),
+                       dtype={name: CSV_DTYPES.get(name, "str") for name in names},
+                       true_values=TRUE_VALUES, false_values=FALSE_VALUES,
+                       encoding="utf-8-sig")
+
+
+def read_shard(shard: Shard) -> pd.DataFrame:
+    if shard.fmt == "csv":
+        with open(shard.path, "rb") as f:
+            f.seek(shard.start)
+            body = f.read(shard.stop - shard.start)
+        return _read_csv(shard.header, body)
+    import pyarrow.parquet as pq
+
+    pf = pq.ParquetFile(shard.path)
+    return pf.read_row_groups(range(shard.start, shard.stop)).to_pandas()
+
+
+def _numbers(column: pd.Series) -> np.ndarray:
+    """과세표준 컬럼 – CSV 에서 문자열로 읽은 컬럼은 숫자로 변환"""
+    if column.dtype.kind in "iuf":
+        return column.to_numpy()
+    return pd.to_numeric(column).to_numpy()
+
+
+def compute(df: pd.DataFrame, eitc: bool = True, income_tax: bool = True,
+            taxable_column: str = "income") -> pd.DataFrame:
+    """근로장려금·종합소득세 결과 컬럼을 붙인 DataFrame (둘 다 계산하면 net_income 도 추가)"""
+    columns = {}
+    if eitc:
+        if "household_type" not in df:
+            raise ValueError("household_type 컬럼이 없습니다. (근로장려금을 빼려면 --no-eitc)")
+        codes = household_codes(df["household_type"].to_numpy())
+        columns["household_type"] = pd.Categorical.from_codes(codes, HOUSEHOLD_TYPES)
+        args = (
+            df["income"].to_numpy(),
+            codes,
+            df["property_value"].to_numpy() if "property_value" in df else 0,
+            df["late_filing"].to_numpy(dtype=bool, na_value=False) if "late_filing" in df else False,
+        )
+        if income_tax:     # 세금·근로장려금·순소득을 한 번에 (net_income 파이프라인)
+            result = calc_net_income_batch(*args, taxable_income=_numbers(df[taxable_column]))
+            return df.assign(**columns, **result._asdict())
+        result = calc_eitc_batch(*args)
+        columns.update(eitc_base=result.base_amount, eitc_prop_adjusted=result.prop_adjusted,
+                       eitc_final=result.final_amount, eitc_status=result.status)
+    if income_tax:
+        result = INCOME_TAX_2025.calculate_batch(_numbers(df[taxable_column]))
+        columns.update(income_tax=result.tax, local_tax=result.local_tax, total_tax=result.total_tax)
+    return df.assign(**columns)
+
+
+def output_schema(shard: Shard, options: dict):
+    """
+    Parquet 부분 파일이 함께 쓸 스키마 – 빈 입력으로 compute 를 돌려 컬럼 순서·형식을 정함
+    Parquet 입력의 컬럼은 파일 스키마 형식을 그대로 쓴다 (전부 null 인 샤드에서 형식이 바뀌지 않도록).
+    """
+    import pyarrow as pa
+
+    if shard.fmt == "csv":
+        source, empty = None, _read_csv(shard.header, b"")
+    else:
+        import pyarrow.parquet as pq
+
+        source = pq.ParquetFile(shard.path).schema_arrow
+        empty = source.empty_table().to_pandas()
+    schema = pa.Schema.from_pandas(compute(empty, **options), preserve_index=False)
+    replaced = {"household_type"} if options.get("eitc", True) else set()
+    for field in source or ():
+        if field.name not in replaced:
+            schema = schema.set(schema.get_field_index(field.name), field)
+    return schema
+
+
+def write_part(df: pd.DataFrame, fmt: str, path: str, schema=None) -> None:
+    if fmt == "csv":
+        df.to_csv(path, index=False, header=False)
+    else:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table.cast(schema) if schema is not None else table, path)
+
+
+def process_shard(shard: Shard, out_fmt: str, part_dir: str, options: dict, schema=None) -> ShardResult:
+    """작업자 진입점 – 샤드 읽기 → 계산 → 부분 파일 쓰기"""
+    df = compute(read_shard(shard), **options)
+    part = os.path.join(part_dir, f"part-{shard.index:05d}.{out_fmt}")
+    write_part(df, out_fmt, part, schema)
+    eitc_total = int(df["eitc_final"].sum()) if "eitc_final" in df else 0
+    tax_total = int(df["total_tax"].sum()) if "total_tax" in df else 0
+    counts = (tuple(np.bincount(df["eitc_status"].to_numpy(), minlength=len(STATUS_LABELS)).tolist())
+              if "eitc_status" in df else ())
+    return ShardResult(shard.index, part, len(df), eitc_total, tax_total, counts, tuple(df.columns))
+
+
+# ------------------------------
+# 부분 파일 병합
+# ------------------------------
+def merge_parts(results: list[ShardResult], out_fmt: str, output: str, columns) -> None:
+    parts = [r.part for r in sorted(results, key=lambda r: r.index)]
+    if out_fmt == "csv":
+        with open(output, "wb") as out:
+            out.write((",".join(columns) + "\n").encode("utf-8-sig"))
+            for part in parts:
+                with open(part, "rb") as f:
+                    shutil.copyfileobj(f, out, 1 << 20)
+        return
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for part in parts:      # 부분 파일은 모두 output_schema 로 썼으므로 첫 파일의 스키마가 공통 스키마
+            pf = pq.ParquetFile(part)
+            if writer is None:
+                writer = pq.ParquetWriter(output, pf.schema_arrow)
+            for i in range(pf.num_row_groups):
+                writer.write_table(pf.read_row_group(i))
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _progress(done: int, total: int, rows: int, started: float) -> None:
+    elapsed = time.perf_counter() - started
+    rate = rows / elapsed if elapsed else 0.0
+    bar = "#" * (20 * done // total) + "-" * (20 - 20 * done // total)
+    print(f"\r[{bar}] {done}/{total} 샤드 · {rows:,}행 · {rate:,.0f}행/초", end="", file=sys.stderr, flush=True)
+
+
+def run(input_path: str, output: str, workers: int = None, shard_mb: float = DEFAULT_SHARD_MB,
+        progress: bool = True, **options) -> dict:
+    """일괄 계산 실행 – 처리 결과 요약(dict) 반환"""
+    in_fmt, out_fmt = detect_format(input_path), detect_format(output)
+    shard_bytes = max(int(shard_mb * 1024 * 1024), 1)
+    shards = (csv_shards if in_fmt == "csv" else parquet_shards)(input_path, shard_bytes)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(shards) or 1))
+    schema = output_schema(shards[0], options) if shards and out_fmt == "parquet" else None
+
+    started = time.perf_counter()
+    results = []
+    with tempfile.TemporaryDirectory(prefix="taxcore-", dir=os.path.dirname(os.path.abspath(output))) as part_dir:
+        if workers == 1:
+            for shard in shards:
+                results.append(process_shard(shard, out_fmt, part_dir, options, schema))
+                if progress:
+                    _progress(len(results), len(shards), sum(r.rows for r in results), started)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(process_shard, s, out_fmt, part_dir, options, schema) for s in shards]
+                for future in as_completed(futures):
+                    results.append(future.result())
+                    if progress:
+                        _progress(len(results), len(shards), sum(r.rows for r in results), started)
+        if progress and shards:
+            print(file=sys.stderr)
+
+        if not results:
+            raise ValueError("입력 파일에 데이터가 없습니다.")
+        merge_parts(results, out_fmt, output, results[0].columns)
+
+    elapsed = time.perf_counter() - started
+    rows = sum(r.rows for r in results)
+    status_counts = [sum(c) for c in zip(*(r.status_counts for r in results))]
+    return {
+        "rows": rows,
+        "seconds": elapsed,
+        "rows_per_sec": rows / elapsed if elapsed else 0.0,
+        "workers": workers,
+        "shards": len(shards),
+        "eitc_total": sum(r.eitc_total for r in results),
+        "tax_total": sum(r.tax_total for r in results),
+        "status_counts": {STATUS_LABELS[i]: n for i, n in enumerate(status_counts)},
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m taxcore.cli",
+        description="가구·소득자 파일에 근로장려금(2024년 귀속)과 종합소득세(2025년 귀속)를 일괄 적용합니다.",
+    )
+    parser.add_argument("input", help="입력 파일 (.csv / .parquet)")
+    parser.add_argument("-o", "--output", required=True, help="출력 파일 (.csv / .parquet)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="작업 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--shard-mb", type=float, default=DEFAULT_SHARD_MB, help="샤드 크기 (MB)")
+    parser.add_argument("--taxable-column", default="income", help="종합소득세 과세표준 컬럼 (기본: income)")
+    parser.add_argument("--no-eitc", action="store_true", help="근로장려금 계산 생략")
+    parser.add_argument("--no-income-tax", action="store_true", help="종합소득세 계산 생략")
+    parser.add_argument("-q", "--quiet", action="store_true", help="진행 표시 끄기")
+    args = parser.parse_args(argv)
+
+    try:
+        summary = run(args.input, args.output, workers=args.workers, shard_mb=args.shard_mb,
+                      progress=not args.quiet, eitc=not args.no_eitc, income_tax=not args.no_income_tax,
+                      taxable_column=args.taxable_column)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ 오류: {e}", file=sys.stderr)
+        return 1
+
+    print(f"✅ {summary['rows']:,}행 처리 · {summary['seconds']:.2f}초 · "
+          f"{summary['rows_per_sec']:,.0f}행/초 · 작업자 {summary['workers']}개 · 샤드 {summary['shards']}개")
+    if not args.no_eitc:
+        counts = " / ".join(f"{label} {n:,}" for label, n in summary["status_counts"].items())
+        print(f"   근로장려금 합계: {summary['eitc_total']:,}원 ({counts})")
+    if not args.no_income_tax:
+        print(f"   종합소득세+지방소득세 합계: {summary['tax_total']:,}원")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
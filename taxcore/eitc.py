@@ -0,0 +1,81 @@
+# taxcore/eitc.py
+# 근로장려금 계산 로직 – 2024년 귀속 (app.py 기준, Streamlit 비의존)
+
+from types import MappingProxyType
+
+from .params import get_schedule
+
+# ------------------------------
+# 1️⃣ 기준 파라미터 (2024년 귀속)
+# ------------------------------
+HOUSEHOLD_TYPES = ("단독", "홑벌이", "맞벌이")
+
+# 귀속연도별 파라미터는 params 레지스트리(data/eitc_params.json)에서 로드
+SCHEDULE = get_schedule(2024)
+PARAMS = MappingProxyType({t: MappingProxyType(SCHEDULE[t].as_dict()) for t in HOUSEHOLD_TYPES})
+
+# 재산 기준 (원)
+PROPERTY_REDUCE_LIMIT = 140_000_000    # 초과 시 50% 감액
+PROPERTY_EXCLUDE_LIMIT = 240_000_000   # 초과 시 지급 제외
+
+# 지급 판정 코드 (app.py 팝업 분기와 동일한 순서)
+STATUS_NORMAL = 0             # 정상지급
+STATUS_REDUCED = 1            # 감액지급 (재산 또는 기한후신고)
+STATUS_PROPERTY_EXCLUDED = 2  # 재산기준 초과(미지급)
+STATUS_NOT_ELIGIBLE = 3       # 소득 또는 조건 미달
+
+STATUS_LABELS = {
+    STATUS_NORMAL: "정상지급",
+    STATUS_REDUCED: "감액지급",
+    STATUS_PROPERTY_EXCLUDED: "지급기준 초과",
+    STATUS_NOT_ELIGIBLE: "미지급",
+}
+
+
+# ------------------------------
+# 2️⃣ 근로장려금 계산 함수
+# ------------------------------
+def calc_eitc(income: int, params: dict) -> int:
+    """소득에 따른 근로장려금 계산 (선형 근사)"""
+    max_amt = params["max"]
+    s = params["phase_in_start"]
+    peak_start = params["peak_start"]
+    peak_end = params["peak_end"]
+    upper = params["upper_income"]
+
+    if income < s:
+        return 0
+    if s <= income < peak_start:
+        span = peak_start - s
+        return int(max_amt * (income - s) / span)
+    if peak_start <= income <= peak_end:
+        return int(max_amt)
+    if peak_end < income < upper:
+        span = upper - peak_end
+        return int(max_amt * (upper - income) / span)
+    return 0
+
+def apply_property_adjustment(amount: int, prop: int) -> tuple[int, str]:
+    """재산 기준 감액 또는 제외"""
+    if prop <= PROPERTY_REDUCE_LIMIT:
+        return amount, "정상 지급"
+    elif PROPERTY_REDUCE_LIMIT < prop <= PROPERTY_EXCLUDE_LIMIT:
+        return int(amount * 0.5), "재산기준 감액(50%)"
+    else:
+        return 0, "재산기준 초과(미지급)"
+
+def apply_late_filing_adjustment(amount: int, is_late: bool) -> tuple[int, str]:
+    """기한 후 신고 감액"""
+    if not is_late:
+        return amount, ""
+    return int(amount * 0.9), "기한 후 신고 감액(10%)"
+
+def payment_status(final_amount: int, prop_note: str, late_note: str) -> int:
+    """최종 지급액과 조정 사유로 지급 판정 코드 산출"""
+    if final_amount == 0:
+        if prop_note == "재산기준 초과(미지급)":
+            return STATUS_PROPERTY_EXCLUDED
+        return STATUS_NOT_ELIGIBLE
+    if "감액" in prop_note or late_note:
+        return STATUS_REDUCED
+    return STATUS_NORMAL
@@ -0,0 +1,17 @@
+# taxcore/eitc_2025.py
+# 근로장려금 산정 – 2025년 산정표 (earned_income_credit_2025.py 기준, 소득은 만원 단위)
+
+from .params import get_schedule
+
+MAN_WON = 10_000
+
+
+def get_eitc_amount(income: int, household_type: str) -> int:
+    """
+    2025년 근로장려금 산정표(가정치 기준)
+    household_type: "단독", "홑벌이", "맞벌이"
+    income: 연간 총소득 (만원 단위)
+    return: 근로장려금 지급액 (원 단위)
+    """
+    # 산정표는 params 레지스트리에서 1회 컴파일된 스케줄을 재사용
+    return get_schedule(2025)[household_type].amount(income * MAN_WON)
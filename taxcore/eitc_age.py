@@ -0,0 +1,76 @@
+# taxcore/eitc_age.py
+# 근로장려금 계산 – 65세 이상 10% 가산 반영 (work1.py / eitc_app.py 기준, 소득은 만원 단위)
+
+from .params import get_schedule
+
+MAN_WON = 10_000
+SCHEDULE = (2025, "age_bonus")     # 이 모듈의 산정표 – 스윕·조회표도 이 산정표는 아래 부동소수 산정식을 쓴다
+
+
+def _schedule(household_type: str):
+    schedule = get_schedule(*SCHEDULE)
+    if household_type not in schedule.households:
+        raise ValueError("household_type은 '단독', '홑벌이', '맞벌이' 중 하나여야 합니다.")
+    return schedule
+
+
+def calc_eitc(income: int, household_type: str, age: int) -> int:
+    """
+    소득구간별 근로장려금 계산
+    income: 연소득 (만원 단위)
+    산정식은 work1.py 원본의 부동소수 연산(1 - x/y 비율, × 1.1 가산 후 절사)을 그대로 따른다.
+    """
+    schedule = _schedule(household_type)
+    info = schedule[household_type]
+    reduce_start, reduce_end = info.peak_end // MAN_WON, info.upper_income // MAN_WON
+
+    # 구간별 계산
+    if income <= reduce_start:
+        amount = info.max
+    elif income <= reduce_end:
+        # 선형 감액
+        ratio = 1 - (income - reduce_start) / (reduce_end - reduce_start)
+        amount = int(info.max * ratio)
+    else:
+        amount = 0
+
+    # 65세 이상 추가 10%
+    if schedule.senior_age is not None and age >= schedule.senior_age:
+        amount = int(amount * (1 + schedule.senior_bonus_percent / 100))
+
+    return max(amount, 0)
+
+
+def calc_eitc_amounts(incomes, household_type: str, age=None):
+    """
+    calc_eitc 의 배열 버전 – 소득(만원 단위) 배열에 대한 지급액 int64 배열 (age 가 None 이면 가산 없음)
+    calc_eitc 와 같은 부동소수 연산을 같은 순서로 하므로 결과가 비트 단위로 같다 (taxcore.sweep, taxcore.lookup 용).
+    """
+    import numpy as np
+
+    schedule = _schedule(household_type)
+    info = schedule[household_type]
+    reduce_start, reduce_end = info.peak_end // MAN_WON, info.upper_income // MAN_WON
+    income = np.asarray(incomes, dtype=np.float64)
+
+    with np.errstate(invalid="ignore"):
+        ratio = 1 - (income - reduce_start) / (reduce_end - reduce_start)
+        reduced = (info.max * ratio).astype(np.int64)
+    amount = np.where(income <= reduce_start, info.max, np.where(income <= reduce_end, reduced, 0))
+
+    if age is not None and schedule.senior_age is not None and age >= schedule.senior_age:
+        amount = (amount * (1 + schedule.senior_bonus_percent / 100)).astype(np.int64)
+
+    return np.maximum(amount, 0).astype(np.int64)
+
+
+def get_max_eitc(age: int, household_type: str) -> int:
+    """
+    근로장려금 최대 지급 가능액 계산기
+    Parameters:
+        age (int): 나이
+        household_type (str): 가구 유형 ('단독', '홑벌이', '맞벌이')
+    Returns:
+        int: 근로장려금 최대 지급 가능액 (원)
+    """
+    return _schedule(household_type).max_amount(household_type, age)
@@ -0,0 +1,155 @@
+# taxcore/income_tax.py
+# 종합소득세 계산 – 2025년 세율표 (tax.py 기준) 및 소득 수준 분류 (income_tax_app.py 기준)
+#
+# 세율표는 BracketTable 로 한 번 컴파일해 두고, 구간 조회는 bisect(O(log n)),
+# 세액은 원 단위 정수 연산으로 계산한다. 일괄 계산은 np.searchsorted 로 동일하게 처리한다.
+
+from bisect import bisect_left
+from typing import NamedTuple
+
+# 세율표: (상한액, 세율, 누진공제) – 공개 형식 (세율은 소수, 마지막 상한은 inf)
+tax_brackets = [
+    (12_000_000, 0.06, 0),
+    (46_000_000, 0.15, 1_080_000),
+    (88_000_000, 0.24, 5_220_000),
+    (150_000_000, 0.35, 14_900_000),
+    (300_000_000, 0.38, 19_400_000),
+    (500_000_000, 0.40, 25_400_000),
+    (1_000_000_000, 0.42, 35_400_000),
+    (float('inf'), 0.45, 65_400_000)
+]
+
+# BracketTable 용: (상한액, 세율(%), 누진공제) – 정수 연산을 위해 세율은 정수 %, 마지막 상한은 None
+_TAX_BRACKETS_2025 = [
+    (None if limit == float('inf') else limit, round(rate * 100), deduction)
+    for limit, rate, deduction in tax_brackets
+]
+
+# 지방소득세율 (산출세액 대비)
+LOCAL_TAX_RATE = 0.1
+LOCAL_TAX_PERCENT = 10
+
+
+def _round_half_even_div100(num: int) -> int:
+    """num / 100 을 정수 연산으로 반올림 (round() 와 같은 오사오입)"""
+    q, r = divmod(num, 100)
+    if r > 50 or (r == 50 and q % 2 == 1):
+        q += 1
+    return q
+
+
+class IncomeTaxBatchResult(NamedTuple):
+    """일괄 계산 결과 (모든 필드는 입력과 같은 길이의 배열)"""
+    rate: object        # 적용 세율 (float, 0.06 …)
+    deduction: object   # 누진공제액 (원)
+    tax: object         # 산출세액 (원)
+    local_tax: object   # 지방소득세 (원)
+    total_tax: object   # 산출세액 + 지방소득세 (원)
+
+
+class BracketTable:
+    """
+    컴파일된 누진세율표
+    brackets: [(상한액, 세율(%), 누진공제), …] – 상한액 오름차순, 마지막 상한은 None
+    local_percent: 지방소득세율 (산출세액 대비 %)
+    """
+
+    __slots__ = ("limits", "percents", "deductions", "local_percent", "_arrays")
+
+    def __init__(self, brackets, local_percent: int = LOCAL_TAX_PERCENT):
+        *finite, last = brackets
+        if last[0] is not None or any(limit is None for limit, _, _ in finite):
+            raise ValueError("마지막 구간만 상한액이 None 이어야 합니다.")
+        limits = [int(limit) for limit, _, _ in finite]
+        if limits != sorted(set(limits)):
+            raise ValueError("세율표 상한액은 오름차순이어야 합니다.")
+
+        self.limits = tuple(limits)
+        self.percents = tuple(int(pct) for _, pct, _ in brackets)
+        self.deductions = tuple(int(ded) for _, _, ded in brackets)
+        self.local_percent = int(local_percent)
+        self._arrays = None
+
+    def lookup(self, income) -> int:
+        """소득이 속하는 구간 번호 (상한액 이하인 첫 구간)"""
+        return bisect_left(self.limits, income)
+
+    def calculate(self, income) -> tuple[float, int, int]:
+        """
+        (적용 세율, 누진공제액, 산출세액) – calculate_income_tax 와 같은 형식
+        구간은 입력값 그대로 찾는다 (12,000,000.7 → 15% 구간). 정수 소득은 정수 연산,
+        원 미만이 있는 소득은 원래의 부동소수점 식(income * rate - deduction 반올림)으로 계산한다.
+        """
+        i = bisect_left(self.limits, income)
+        pct, deduction = self.percents[i], self.deductions[i]
+        if income == int(income):
+            tax = _round_half_even_div100(int(income) * pct - deduction * 100)
+        else:
+            tax = round(income * (pct / 100) - deduction)
+        return pct / 100, deduction, max(0, tax)
+
+    def local_tax(self, tax: int) -> int:
+        """지방소득세 (원 미만 절사)"""
+        return tax * self.local_percent // 100
+
+    def calculate_with_local(self, income) -> tuple[int, int]:
+        """(산출세액, 지방소득세)"""
+        _, _, tax = self.calculate(income)
+        return tax, self.local_tax(tax)
+
+    def _numpy_arrays(self):
+        if self._arrays is None:
+            import numpy as np
+            self._arrays = (
+                np.array(self.limits, dtype=np.int64),
+                np.array(self.percents, dtype=np.int64),
+                np.array(self.deductions, dtype=np.int64),
+            )
+        return self._arrays
+
+    def calculate_batch(self, incomes) -> IncomeTaxBatchResult:
+        """소득 배열 전체에 대해 구간 조회·누진공제·지방소득세를 한 번에 계산"""
+        import numpy as np
+
+        limits, percents, deductions = self._numpy_arrays()
+        raw = np.asarray(incomes)
+        incomes = raw.astype(np.int64)
+
+        idx = np.searchsorted(limits, raw, side="left")       # 구간은 입력값 그대로
+        pct = percents[idx]
+        deduction = deductions[idx]
+
+        # income * rate - deduction 을 1/100 원 단위 정수로 계산 후 오사오입
+        q, r = np.divmod(incomes * pct - deduction * 100, 100)
+        q += (r > 50) | ((r == 50) & (q % 2 == 1))
+        if raw.dtype.kind == "f":               # 원 미만이 있는 소득은 스칼라와 같은 부동소수점 식
+            fractional = raw != incomes
+            if fractional.any():
+                q = np.where(fractional, np.round(raw * (pct / 100) - deduction), q).astype(np.int64)
+        tax = np.maximum(q, 0)
+        local = tax * self.local_percent // 100
+
+        return IncomeTaxBatchResult(pct / 100, deduction, tax, local, tax + local)
+
+
+# 2025년 귀속 세율표
+INCOME_TAX_2025 = BracketTable(_TAX_BRACKETS_2025)
+
+
+# 계산 함수
+def calculate_income_tax(income):
+    return INCOME_TAX_2025.calculate(income)
+
+
+def calculate_income_tax_batch(incomes) -> IncomeTaxBatchResult:
+    return INCOME_TAX_2025.calculate_batch(incomes)
+
+
+def classify_income_level(income) -> tuple[str, float]:
+    """소득 수준 분류 및 단일 세율 (고소득층 50% / 중간소득층 25% / 저소득층 10%)"""
+    if income >= 50000000:
+        return "고소득층", 0.50
+    elif income >= 20000000:
+        return "중간소득층", 0.25
+    else:
+        return "저소득층", 0.10
@@ -0,0 +1,226 @@
+# taxcore/lookup.py
+# 근로장려금 사전 계산 조회표 – 가구유형별 산정액을 소득 단계(기본 1만원)마다 미리 계산해 두고
+# 가구 하나당 인덱스 1회로 지급액을 구한다.
+#
+# 조회표는 int32 배열(array('i'))이며, 파일로 저장하면 mmap 으로 열 수 있어
+# 여러 작업자 프로세스가 같은 페이지 캐시를 공유한다 (프로세스별 재계산·복사 없음).
+#
+#   table = get_lookup_table(2025)                  # 메모리에서 1회 생성 후 캐시
+#   table.save("eitc_2025.lut")
+#   shared = EitcLookupTable.load("eitc_2025.lut")  # 읽기 전용 mmap
+#   shared.amount(15_000_000, "홑벌이")
+#
+# 소득이 단계의 배수가 아니면 아래쪽 단계 값을 쓴다(공식 산정표와 같은 계단식).
+# 단계 배수인 소득에 대해서는 스케줄 계산 결과와 정확히 같다 – (2025, "age_bonus") 는 eitc_age.calc_eitc 와 같은
+# 부동소수 산정식·가산(× 1.1 후 절사)으로, 그 밖의 산정표는 HouseholdSchedule.amount 의 정수 연산으로 채운다.
+
+import json
+import mmap
+import os
+import sys
+from array import array
+from functools import lru_cache
+
+from .eitc_age import MAN_WON, SCHEDULE as AGE_BONUS_SCHEDULE, calc_eitc_amounts
+from .params import get_schedule
+
+MAGIC = b"EITCLUT1"
+DEFAULT_STEP = 10_000   # 1만원 단위
+_ALIGN = 8
+
+
+class EitcLookupTable:
+    """
+    가구유형 × 소득 단계 조회표
+    values: 길이 len(households) * n_steps 의 int32 버퍼 (행 = 가구유형)
+    """
+
+    __slots__ = ("year", "name", "step", "households", "n_steps", "senior_age",
+                 "senior_bonus_percent", "values", "_rows", "_mmap", "_file")
+
+    def __init__(self, year, name, step, households, n_steps, values,
+                 senior_age=None, senior_bonus_percent=0):
+        self.year = year
+        self.name = name
+        self.step = int(step)
+        self.households = tuple(households)
+        self.n_steps = int(n_steps)
+        self.senior_age = senior_age
+        self.senior_bonus_percent = int(senior_bonus_percent)
+        self.values = values
+        self._rows = {t: i * self.n_steps for i, t in enumerate(self.households)}
+        self._mmap = None
+        self._file = None
+        if len(values) != len(self.households) * self.n_steps:
+            raise ValueError("조회표 크기가 가구유형 수 × 단계 수와 다릅니다.")
+
+    def __repr__(self):
+        return (f"EitcLookupTable(year={self.year}, name={self.name!r}, step={self.step}, "
+                f"n_steps={self.n_steps}, mmap={self._mmap is not None})")
+
+    # ------------------------------
+    # 생성
+    # ------------------------------
+    @classmethod
+    def build(cls, schedule, step: int = DEFAULT_STEP) -> "EitcLookupTable":
+        """EitcSchedule 의 전 구간을 소득 단계별로 미리 계산"""
+        households = tuple(schedule.households)
+        upper = max(schedule[t].upper_income for t in households)
+        n_steps = -(-upper // step) + 1     # upper_income 이상은 모두 0
+        values = array("i")
+        work1 = (schedule.year, schedule.name) == AGE_BONUS_SCHEDULE
+        if work1:
+            import numpy as np
+        for t in households:
+            if work1:
+                values.extend(calc_eitc_amounts(np.arange(n_steps) * step / MAN_WON, t).tolist())
+            else:
+                amount = schedule[t].amount
+                values.extend(amount(k * step) for k in range(n_steps))
+        return cls(schedule.year, schedule.name, step, households, n_steps, values,
+                   schedule.senior_age, schedule.senior_bonus_percent)
+
+    # ------------------------------
+    # 조회
+    # ------------------------------
+    def row(self, household_type: str) -> int:
+        try:
+            return self._rows[household_type]
+        except KeyError:
+            raise ValueError("가구 유형은 '단독', '홑벌이', '맞벌이' 중 하나여야 합니다.") from None
+
+    def amount(self, income: int, household_type: str, age=None) -> int:
+        """연간 총소득(원)에 대한 지급액 – 인덱스 1회"""
+        row = self.row(household_type)
+        k = int(income) // self.step
+        if k < 0 or k >= self.n_steps:
+            return 0
+        amount = self.values[row + k]
+        if age is not None and self.senior_age is not None and age >= self.senior_age:
+            amount = int(amount * (1 + self.senior_bonus_percent / 100))     # calc_eitc 와 같은 가산·절사
+        return amount
+
+    def as_numpy(self):
+        """(가구유형 수, 단계 수) int32 배열 – mmap 으로 연 경우 복사 없는 뷰 (배열이 살아 있는 동안 매핑 유지)"""
+        import numpy as np
+        return np.frombuffer(self.values, dtype=np.int32).reshape(len(self.households), self.n_steps)
+
+    def amount_batch(self, incomes, household_codes, ages=None):
+        """소득 배열·가구유형 코드 배열(households 순서)에 대한 지급액 배열"""
+        import numpy as np
+
+        flat = np.frombuffer(self.values, dtype=np.int32)
+        k = np.asarray(incomes, dtype=np.int64) // self.step
+        valid = (k >= 0) & (k < self.n_steps)
+        idx = np.asarray(household_codes, dtype=np.int64) * self.n_steps + np.clip(k, 0, self.n_steps - 1)
+        out = np.where(valid, flat[idx], 0).astype(np.int64)
+        if ages is not None and self.senior_age is not None:
+            senior = np.asarray(ages) >= self.senior_age
+            out = np.where(senior, (out * (1 + self.senior_bonus_percent / 100)).astype(np.int64), out)
+        return out
+
+    # ------------------------------
+    # 파일 저장 / mmap 로드
+    # ------------------------------
+    def _header(self) -> bytes:
+        return json.dumps({
+            "year": self.year, "name": self.name, "step": self.step,
+            "households": self.households, "n_steps": self.n_steps,
+            "senior_age": self.senior_age, "senior_bonus_percent": self.senior_bonus_percent,
+            "byteorder": sys.byteorder, "itemsize": self.values.itemsize,
+        }, ensure_ascii=False).encode("utf-8")
+
+    def save(self, path) -> None:
+        """MAGIC | 헤더 길이(8바이트) | JSON 헤더 | 정렬 패딩 | int32 데이터 – 임시 파일에 쓴 뒤 교체"""
+        header = self._header()
+        offset = len(MAGIC) + 8 + len(header)
+        padding = -offset % _ALIGN
+        tmp = f"{path}.tmp{os.getpid()}"
+        with open(tmp, "wb") as f:
+            f.write(MAGIC)
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            f.write(b"\0" * padding)
+            f.write(memoryview(self.values).cast("B"))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, use_mmap: bool = True) -> "EitcLookupTable":
+        """저장된 조회표 열기 – 기본은 읽기 전용 mmap (프로세스 간 페이지 공유)"""
+        f = open(path, "rb")
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if use_mmap else f.read()
+        except BaseException:
+            f.close()
+            raise
+        if not use_mmap:
+            f.close()
+            f = None
+
+        view = memoryview(buf)
+        try:
+            if bytes(view[:len(MAGIC)]) != MAGIC:
+                raise ValueError(f"근로장려금 조회표 파일이 아닙니다: {path}")
+            size = int.from_bytes(view[len(MAGIC):len(MAGIC) + 8], "little")
+            start = len(MAGIC) + 8
+            meta = json.loads(bytes(view[start:start + size]).decode("utf-8"))
+            if meta["byteorder"] != sys.byteorder or meta["itemsize"] != array("i").itemsize:
+                raise ValueError("조회표 파일의 바이트 순서/정수 크기가 현재 플랫폼과 다릅니다.")
+            offset = start + size
+            offset += -offset % _ALIGN
+
+            table = cls(meta["year"], meta["name"], meta["step"], meta["households"], meta["n_steps"],
+                        view[offset:].cast("i"), meta["senior_age"], meta["senior_bonus_percent"])
+        except BaseException:
+            # 헤더가 잘못된 파일 – mmap·파일 핸들을 닫고 원래 예외를 그대로 올린다
+            view.release()
+            if use_mmap:
+                try:
+                    buf.close()
+                except BufferError:
+                    pass
+                f.close()
+            raise
+        if use_mmap:
+            table._mmap = buf
+            table._file = f
+        return table
+
+    def close(self) -> None:
+        """
+        mmap 해제 (이후 조회 불가)
+        as_numpy() 배열은 mmap 을 직접 가리키므로, 살아 있는 동안에는 매핑을 바로 풀 수 없다.
+        그때는 조회표의 참조만 끊고 매핑은 마지막 배열이 사라질 때 해제된다.
+        """
+        if self._mmap is None:
+            return
+        buf, f = self._mmap, self._file
+        values, self.values = self.values, array("i")
+        self._mmap = self._file = None
+        try:
+            values.release()
+            buf.close()
+        except BufferError:
+            pass
+        finally:
+            f.close()
+
+
+@lru_cache(maxsize=None)
+def get_lookup_table(year: int, name: str = "standard", step: int = DEFAULT_STEP) -> EitcLookupTable:
+    """레지스트리 스케줄로부터 조회표 생성 (프로세스 내 1회)"""
+    return EitcLookupTable.build(get_schedule(year, name), step)
+
+
+def open_shared_table(path, year: int, name: str = "standard", step: int = DEFAULT_STEP) -> EitcLookupTable:
+    """
+    공유 조회표 파일을 mmap 으로 연다. 파일이 없거나 다른 산정표이면 새로 만들어 저장한다.
+    작업자 프로세스들은 같은 path 를 열어 하나의 사본을 공유한다.
+    """
+    if os.path.exists(path):
+        table = EitcLookupTable.load(path)
+        if (table.year, table.name, table.step) == (year, name, step):
+            return table
+        table.close()
+    EitcLookupTable.build(get_schedule(year, name), step).save(path)
+    return EitcLookupTable.load(path)
@@ -0,0 +1,149 @@
+# taxcore/params.py
+# 근로장려금 파라미터 레지스트리 – 귀속연도·산정표별 파라미터를 데이터 파일에서 한 번만 읽어
+# 원 단위로 정규화하고, 불변(frozen) 스케줄 객체로 컴파일해 캐시한다.
+#
+#   get_schedule(2024)                 → app.py 기준 산정표
+#   get_schedule(2025)                 → earned_income_credit_2025.py 기준 산정표
+#   get_schedule(2025, "age_bonus")    → work1.py / eitc_app.py 기준 (65세 이상 10% 가산)
+
+import json
+import os
+from functools import lru_cache
+from types import MappingProxyType
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "data", "eitc_params.json")
+
+# 데이터 파일의 금액 단위 → 원 환산 배율
+UNIT_SCALE = {"won": 1, "man_won": 10_000}
+
+_AMOUNT_KEYS = ("phase_in_start", "peak_start", "peak_end", "upper_income")
+
+
+class HouseholdSchedule:
+    """
+    가구유형 하나의 구간별 선형 산정식 (원 단위)
+    phase_in_start 미만 0 → peak_start 까지 점증 → peak_end 까지 최대액 → upper_income 까지 점감 → 0
+    구간 폭은 생성 시 한 번만 계산하며, 지급액은 정수 연산(절사)으로 구한다.
+    """
+
+    __slots__ = ("max", "phase_in_start", "peak_start", "peak_end", "upper_income",
+                 "_in_span", "_out_span")
+
+    def __init__(self, max, phase_in_start, peak_start, peak_end, upper_income):
+        if not phase_in_start <= peak_start <= peak_end <= upper_income:
+            raise ValueError("구간 경계는 phase_in_start ≤ peak_start ≤ peak_end ≤ upper_income 이어야 합니다.")
+        set_ = object.__setattr__
+        set_(self, "max", int(max))
+        set_(self, "phase_in_start", int(phase_in_start))
+        set_(self, "peak_start", int(peak_start))
+        set_(self, "peak_end", int(peak_end))
+        set_(self, "upper_income", int(upper_income))
+        set_(self, "_in_span", int(peak_start - phase_in_start))
+        set_(self, "_out_span", int(upper_income - peak_end))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} 는 변경할 수 없습니다.")
+
+    def __repr__(self):
+        return (f"HouseholdSchedule(max={self.max}, phase_in_start={self.phase_in_start}, "
+                f"peak_start={self.peak_start}, peak_end={self.peak_end}, upper_income={self.upper_income})")
+
+    def amount(self, income: int) -> int:
+        """연간 총소득(원)에 대한 지급액(원)"""
+        if income < self.phase_in_start:
+            return 0
+        if income < self.peak_start:
+            return int(self.max * (income - self.phase_in_start) // self._in_span)
+        if income <= self.peak_end:
+            return self.max
+        if income < self.upper_income:
+            return int(self.max * (self.upper_income - income) // self._out_span)
+        return 0
+
+    def as_dict(self) -> dict:
+        """app.py PARAMS 형식의 파라미터 dict"""
+        return {"max": self.max, "upper_income": self.upper_income, "phase_in_start": self.phase_in_start,
+                "peak_start": self.peak_start, "peak_end": self.peak_end}
+
+
+class EitcSchedule:
+    """귀속연도·산정표 하나 – 가구유형별 HouseholdSchedule 과 고령자 가산 규칙"""
+
+    __slots__ = ("year", "name", "source", "households", "senior_age", "senior_bonus_percent")
+
+    def __init__(self, year, name, households, source="", senior_age=None, senior_bonus_percent=0):
+        set_ = object.__setattr__
+        set_(self, "year", int(year))
+        set_(self, "name", name)
+        set_(self, "source", source)
+        set_(self, "households", MappingProxyType(dict(households)))
+        set_(self, "senior_age", senior_age)
+        set_(self, "senior_bonus_percent", int(senior_bonus_percent))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} 는 변경할 수 없습니다.")
+
+    def __repr__(self):
+        return f"EitcSchedule(year={self.year}, name={self.name!r}, households={list(self.households)})"
+
+    def __getitem__(self, household_type: str) -> HouseholdSchedule:
+        try:
+            return self.households[household_type]
+        except KeyError:
+            raise ValueError("가구 유형은 '단독', '홑벌이', '맞벌이' 중 하나여야 합니다.") from None
+
+    def apply_senior_bonus(self, amount: int, age) -> int:
+        """고령자 가산 (예: 65세 이상 10%) – 원 미만 절사"""
+        if age is None or self.senior_age is None or age < self.senior_age:
+            return amount
+        return amount * (100 + self.senior_bonus_percent) // 100
+
+    def amount(self, income: int, household_type: str, age=None) -> int:
+        """연간 총소득(원)·가구유형·나이에 대한 지급액(원)"""
+        return self.apply_senior_bonus(self[household_type].amount(income), age)
+
+    def max_amount(self, household_type: str, age=None) -> int:
+        """가구유형별 최대 지급 가능액 (고령자 가산 포함)"""
+        return self.apply_senior_bonus(self[household_type].max, age)
+
+
+# ------------------------------
+# 레지스트리 (데이터 파일 1회 로드 + 연도별 캐시)
+# ------------------------------
+def _compile(entry: dict) -> EitcSchedule:
+    scale = UNIT_SCALE[entry.get("unit", "won")]
+    households = {}
+    for household_type, p in entry["households"].items():
+        households[household_type] = HouseholdSchedule(
+            p["max"], *(p[k] * scale for k in _AMOUNT_KEYS))
+    return EitcSchedule(entry["year"], entry.get("name", "standard"), households,
+                        source=entry.get("source", ""),
+                        senior_age=entry.get("senior_age"),
+                        senior_bonus_percent=entry.get("senior_bonus_percent", 0))
+
+
+@lru_cache(maxsize=None)
+def _registry() -> MappingProxyType:
+    with open(DATA_FILE, encoding="utf-8") as f:
+        data = json.load(f)
+    return MappingProxyType({(e["year"], e.get("name", "standard")): e for e in data["schedules"]})
+
+
+@lru_cache(maxsize=None)
+def get_schedule(year: int, name: str = "standard") -> EitcSchedule:
+    """귀속연도·산정표 이름에 해당하는 컴파일된 스케줄 (연도별 1회 생성 후 캐시)"""
+    try:
+        entry = _registry()[(int(year), name)]
+    except KeyError:
+        raise ValueError(f"{year}년 '{name}' 근로장려금 파라미터가 없습니다. "
+                         f"사용 가능: {available_schedules()}") from None
+    return _compile(entry)
+
+
+def available_schedules() -> list[tuple[int, str]]:
+    """등록된 (귀속연도, 산정표 이름) 목록"""
+    return sorted(_registry())
+
+
+def available_years() -> list[int]:
+    return sorted({year for year, _ in _registry()})
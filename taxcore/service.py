@@ -0,0 +1,331 @@
+# taxcore/service.py
+# 계산 HTTP API (ASGI) – 근로장려금·종합소득세 계산을 다른 시스템에서 JSON 으로 호출
+#
+#   python -m taxcore.service --port 8000          # uvicorn 필요
+#   uvicorn taxcore.service:app
+#
+# 엔드포인트 (GET /health 외에는 모두 POST + JSON)
+#   /v1/eitc               {"income": 원, "household_type": "단독", "property_value": 0, "late_filing": false}
+#                          → app.py 규칙(2024년 귀속): calc_eitc + 재산·기한후신고 조정 + 지급 판정
+#   /v1/eitc-2025          {"income": 만원, "household_type": "단독"} → get_eitc_amount
+#   /v1/income-tax         {"income": 원} → calculate_income_tax + 지방소득세
+#   /v1/net-income         /v1/eitc 와 같은 입력 → 세금·근로장려금·순소득 (net_income 파이프라인)
+#   /v1/<위 이름>/bulk      {"items": [단건과 같은 객체, …]} → {"results": […]}
+# 금액은 0 이상 MAX_AMOUNT(원, 만원 입력은 그 1/10,000) 이하의 정수만 받는다 (그 밖은 400).
+#
+# 동시에 들어온 단건 요청은 MicroBatcher 가 잠깐(최대 2ms) 모아 NumPy 일괄 계산 한 번으로 처리한다.
+# 대기 중인 다른 요청이 없으면 기다리지 않고 바로 계산한다.
+# 결과는 스칼라 함수와 같다 (batch / lookup / BracketTable.calculate_batch 참고).
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+
+import numpy as np
+
+from .batch import calc_eitc_batch
+from .eitc import HOUSEHOLD_TYPES, STATUS_LABELS
+from .income_tax import INCOME_TAX_2025
+from .lookup import get_lookup_table
+from .net_income import calc_net_income_batch
+
+DEFAULT_MAX_BATCH = 1_024
+DEFAULT_MAX_DELAY = 0.002        # 초
+MAX_BULK_ITEMS = 100_000
+MAX_BODY_BYTES = 16 * 1024 * 1024
+MAN_WON = 10_000
+MAX_AMOUNT = 10 ** 15            # 금액 입력 상한 (원) – int64 일괄 계산이 넘치지 않는 범위
+
+
+class RequestError(Exception):
+    """잘못된 요청 (HTTP 상태 코드 포함)"""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+# ------------------------------
+# 입력 검증
+# ------------------------------
+def _int_field(item: dict, name: str, default=None, maximum: int = MAX_AMOUNT) -> int:
+    value = item.get(name, default)
+    if value is None:
+        raise RequestError(f"'{name}' 값이 필요합니다.")
+    if isinstance(value, bool) or not isinstance(value, (int, float)) \
+            or (isinstance(value, float) and not math.isfinite(value)) or value != int(value):
+        raise RequestError(f"'{name}' 은(는) 정수여야 합니다.")
+    if value < 0:
+        raise RequestError(f"'{name}' 은(는) 0 이상이어야 합니다.")
+    if value > maximum:
+        raise RequestError(f"'{name}' 은(는) {maximum:,} 이하여야 합니다.")
+    return int(value)
+
+
+def _household_code(item: dict) -> int:
+    try:
+        return HOUSEHOLD_TYPES.index(item.get("household_type"))
+    except ValueError:
+        raise RequestError("household_type 은 '단독', '홑벌이', '맞벌이' 중 하나여야 합니다.") from None
+
+
+def _object(item) -> dict:
+    if not isinstance(item, dict):
+        raise RequestError("요청 본문은 JSON 객체여야 합니다.")
+    return item
+
+
+# ------------------------------
+# 엔드포인트별 검증(parse) + 일괄 계산(compute)
+# ------------------------------
+def parse_eitc(item) -> tuple:
+    item = _object(item)
+    late = item.get("late_filing", False)
+    if not isinstance(late, bool):
+        raise RequestError("'late_filing' 은(는) true / false 여야 합니다.")
+    return _int_field(item, "income"), _household_code(item), _int_field(item, "property_value", 0), late
+
+
+def compute_eitc(rows) -> list[dict]:
+    income, codes, prop, late = (np.array(col) for col in zip(*rows))
+    r = calc_eitc_batch(income.astype(np.int64), codes, prop.astype(np.int64), late.astype(bool))
+    return [
+        {"base_amount": b, "prop_adjusted": p, "final_amount": f, "status": s, "status_label": STATUS_LABELS[s]}
+        for b, p, f, s in zip(r.base_amount.tolist(), r.prop_adjusted.tolist(),
+                              r.final_amount.tolist(), r.status.tolist())
+    ]
+
+
+def parse_eitc_2025(item) -> tuple:
+    item = _object(item)
+    return _int_field(item, "income", maximum=MAX_AMOUNT // MAN_WON), _household_code(item)
+
+
+def compute_eitc_2025(rows) -> list[dict]:
+    table = get_lookup_table(2025)     # 만원 단위 소득은 조회표 단계(1만원)와 정확히 일치
+    income, codes = (np.array(col, dtype=np.int64) for col in zip(*rows))
+    rows_of = np.array([table.households.index(t) for t in HOUSEHOLD_TYPES], dtype=np.int64)
+    amounts = table.amount_batch(income * MAN_WON, rows_of[codes])
+    return [{"amount": a} for a in amounts.tolist()]
+
+
+def parse_income_tax(item) -> tuple:
+    return (_int_field(_object(item), "income"),)
+
+
+def compute_income_tax(rows) -> list[dict]:
+    r = INCOME_TAX_2025.calculate_batch(np.array([row[0] for row in rows], dtype=np.int64))
+    return [
+        {"rate": rate, "deduction": d, "tax": t, "local_tax": lt, "total_tax": tt}
+        for rate, d, t, lt, tt in zip(r.rate.tolist(), r.deduction.tolist(), r.tax.tolist(),
+                                      r.local_tax.tolist(), r.total_tax.tolist())
+    ]
+
+
+def compute_net_income(rows) -> list[dict]:
+    income, codes, prop, late = (np.array(col) for col in zip(*rows))
+    r = calc_net_income_batch(income.astype(np.int64), codes, prop.astype(np.int64), late.astype(bool))
+    columns = [getattr(r, name).tolist() for name in r._fields]
+    return [dict(zip(r._fields, values)) for values in zip(*columns)]
+
+
+ENDPOINTS = {
+    "eitc": (parse_eitc, compute_eitc),
+    "eitc-2025": (parse_eitc_2025, compute_eitc_2025),
+    "income-tax": (parse_income_tax, compute_income_tax),
+    "net-income": (parse_eitc, compute_net_income),
+}
+
+
+# ------------------------------
+# 마이크로 배칭
+# ------------------------------
+class MicroBatcher:
+    """
+    단건 요청을 모아 compute(rows) 한 번으로 처리
+    첫 요청 뒤에 다른 요청이 대기 중이면 max_delay 만큼 더 기다렸다가 최대 max_batch 개까지 함께 계산한다.
+    """
+
+    def __init__(self, compute, max_batch: int = DEFAULT_MAX_BATCH, max_delay: float = DEFAULT_MAX_DELAY):
+        self.compute = compute
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.batches = 0
+        self.items = 0
+        self._queue = None
+        self._task = None
+
+    async def submit(self, row):
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((row, future))
+        return await future
+
+    async def _run(self):
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            await asyncio.sleep(0)          # 이미 도착한 요청이 큐에 들어오도록 한 번 양보
+            if not queue.empty():           # 동시 요청이 있을 때만 더 모음 (단독 요청은 바로 계산)
+                await asyncio.sleep(self.max_delay)
+            while len(batch) < self.max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            self.batches += 1
+            self.items += len(batch)
+            try:
+                results = self.compute([row for row, _ in batch])
+            except Exception:
+                # 한 행 때문에 묶음 전체가 실패하지 않도록 행마다 다시 계산 – 실패한 요청만 오류
+                for row, future in batch:
+                    try:
+                        result = self.compute([row])[0]
+                    except Exception as e:
+                        if not future.done():
+                            future.set_exception(e)
+                    else:
+                        if not future.done():
+                            future.set_result(result)
+            else:
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._queue = self._task = None
+
+    def stats(self) -> dict:
+        return {"batches": self.batches, "items": self.items,
+                "mean_batch": self.items / self.batches if self.batches else 0.0}
+
+
+# ------------------------------
+# ASGI 앱
+# ------------------------------
+class CalcService:
+    """ASGI 앱 – batching=False 이면 단건 요청도 바로 계산 (비교용)"""
+
+    def __init__(self, batching: bool = True, max_batch: int = DEFAULT_MAX_BATCH,
+                 max_delay: float = DEFAULT_MAX_DELAY):
+        self.batching = batching
+        self.batchers = {name: MicroBatcher(compute, max_batch, max_delay)
+                         for name, (_, compute) in ENDPOINTS.items()}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            try:
+                status, payload = await self._handle(scope, receive)
+            except RequestError as e:
+                status, payload = e.status, {"error": str(e)}
+            except Exception as e:          # 예상하지 못한 오류도 응답은 보낸다
+                status, payload = 500, {"error": f"계산 중 오류가 발생했습니다: {type(e).__name__}"}
+            await self._respond(send, status, payload)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                for batcher in self.batchers.values():
+                    await batcher.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _handle(self, scope, receive):
+        path = scope["path"].rstrip("/")
+        if path == "/health":
+            return 200, {"status": "ok", "batching": self.batching,
+                         "batchers": {name: b.stats() for name, b in self.batchers.items()}}
+
+        parts = path.split("/")          # ["", "v1", name] 또는 ["", "v1", name, "bulk"]
+        if len(parts) not in (3, 4) or parts[1] != "v1" or parts[2] not in ENDPOINTS \
+                or (len(parts) == 4 and parts[3] != "bulk"):
+            raise RequestError("없는 경로입니다.", 404)
+        if scope["method"] != "POST":
+            raise RequestError("POST 로 요청해주세요.", 405)
+
+        name, bulk = parts[2], len(parts) == 4
+        parse, compute = ENDPOINTS[name]
+        body = await self._read_json(receive)
+        if not bulk:
+            row = parse(body)
+            if self.batching:
+                return 200, await self.batchers[name].submit(row)
+            return 200, compute([row])[0]
+
+        items = _object(body).get("items")
+        if not isinstance(items, list):
+            raise RequestError("'items' 는 배열이어야 합니다.")
+        if len(items) > MAX_BULK_ITEMS:
+            raise RequestError(f"한 번에 최대 {MAX_BULK_ITEMS:,}건까지 계산할 수 있습니다.", 413)
+        rows = []
+        for i, item in enumerate(items):
+            try:
+                rows.append(parse(item))
+            except RequestError as e:
+                raise RequestError(f"items[{i}]: {e}", e.status) from None
+        return 200, {"results": compute(rows) if rows else []}
+
+    @staticmethod
+    async def _read_json(receive):
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            body = message.get("body", b"")
+            size += len(body)
+            if size > MAX_BODY_BYTES:
+                raise RequestError("요청 본문이 너무 큽니다.", 413)
+            chunks.append(body)
+            if not message.get("more_body", False):
+                break
+        try:
+            return json.loads(b"".join(chunks) or b"null")
+        except ValueError:
+            raise RequestError("JSON 형식이 아닙니다.") from None
+
+    @staticmethod
+    async def _respond(send, status: int, payload) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        await send({"type": "http.response.start", "status": status,
+                    "headers": [(b"content-type", b"application/json; charset=utf-8"),
+                                (b"content-length", str(len(body)).encode())]})
+        await send({"type": "http.response.body", "body": body})
+
+
+app = CalcService()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m taxcore.service",
+                                     description="근로장려금·종합소득세 계산 HTTP API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH)
+    parser.add_argument("--max-delay-ms", type=float, default=DEFAULT_MAX_DELAY * 1000)
+    parser.add_argument("--no-batching", action="store_true", help="단건 요청을 모으지 않고 바로 계산")
+    args = parser.parse_args(argv)
+
+    try:
+        import uvicorn
+    except ImportError:
+        print("❌ 서버 실행에는 uvicorn 이 필요합니다: pip install uvicorn", file=sys.stderr)
+        return 1
+    service = CalcService(not args.no_batching, args.max_batch, args.max_delay_ms / 1000)
+    uvicorn.run(service, host=args.host, port=args.port, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+# taxcore/sweep.py
+# 시나리오 스윕 – 소득 격자 × 가구유형 × 재산 수준 전체에 대한 근로장려금·세금 곡선을 한 번에 계산
+#
+#   result = sweep(income_grid(50_000_000, 100_000), property_values=[0, 150_000_000])
+#   curve = result.curve("홑벌이", 0)         # 소득별 지급액·세금·순소득·실효 한계세율 배열
+#   point = result.point(13_500_000, "홑벌이", 0)   # 곡선 위 사용자 위치 (재계산 없음)
+#
+# 산정표
+#   (2024, "standard")  : app.py 규칙 – calc_eitc_batch 로 계산하므로 스칼라 calc_eitc 와 비트 단위로 같다
+#   (2025, "age_bonus") : work1.py / eitc_app.py 규칙 – eitc_age.calc_eitc_amounts 로 계산하므로 스칼라
+#                         calc_eitc 와 같은 부동소수 연산 (age 가 senior_age 이상이면 가산)
+#   그 밖의 레지스트리 산정표는 HouseholdSchedule.amount 와 같은 정수 연산으로 계산한다
+# 재산·기한후신고 조정(app.py)은 어느 산정표에든 같은 방식으로 적용한다.
+#
+# 세금은 tax.py 세율표(2025년 귀속) 산출세액 + 지방소득세이며, 총소득을 과세표준으로 간주한 근사이다.
+# 실효 한계세율 = 1 − Δ순소득 / Δ소득 (순소득 = 소득 − 세금 + 근로장려금), 격자 인접 점 사이에서 계산한다.
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .batch import calc_eitc_batch
+from .eitc import (
+    HOUSEHOLD_TYPES,
+    PROPERTY_EXCLUDE_LIMIT,
+    PROPERTY_REDUCE_LIMIT,
+    STATUS_NORMAL,
+    STATUS_NOT_ELIGIBLE,
+    STATUS_PROPERTY_EXCLUDED,
+    STATUS_REDUCED,
+)
+from .eitc_age import MAN_WON, SCHEDULE as AGE_BONUS_SCHEDULE, calc_eitc_amounts
+from .income_tax import INCOME_TAX_2025
+from .params import get_schedule
+
+
+def income_grid(stop: int, step: int = 100_000, start: int = 0) -> np.ndarray:
+    """start 부터 stop 까지(포함) step 간격의 소득 격자 (원)"""
+    if step <= 0:
+        raise ValueError("step 은 0보다 커야 합니다.")
+    return np.arange(int(start), int(stop) + 1, int(step), dtype=np.int64)
+
+
+def _schedule_amounts(schedule, incomes: np.ndarray, household_types) -> np.ndarray:
+    """(가구유형, 소득) 기본 산정액 – HouseholdSchedule.amount 의 정수 연산을 배열로"""
+    out = np.zeros((len(household_types), len(incomes)), dtype=np.int64)
+    for h, household_type in enumerate(household_types):
+        s = schedule[household_type]
+        row = out[h]
+        phase_in = (incomes >= s.phase_in_start) & (incomes < s.peak_start)
+        plateau = (incomes >= s.peak_start) & (incomes <= s.peak_end)
+        phase_out = (incomes > s.peak_end) & (incomes < s.upper_income)
+        row[plateau] = s.max
+        if s.peak_start > s.phase_in_start:
+            row[phase_in] = s.max * (incomes[phase_in] - s.phase_in_start) // (s.peak_start - s.phase_in_start)
+        if s.upper_income > s.peak_end:
+            row[phase_out] = s.max * (s.upper_income - incomes[phase_out]) // (s.upper_income - s.peak_end)
+    return out
+
+
+class SweepResult(NamedTuple):
+    """배열 모양: 소득 (n_income,) / 가구유형 × 재산 × 소득 (n_household, n_property, n_income)"""
+    incomes: np.ndarray
+    household_types: tuple
+    property_values: np.ndarray
+    eitc: np.ndarray            # 최종 지급액 (재산·기한후신고·고령자 가산 반영)
+    status: np.ndarray          # 지급 판정 코드 (eitc.STATUS_*)
+    tax: np.ndarray             # (n_income,) 산출세액 + 지방소득세
+    net_income: np.ndarray      # 소득 − 세금 + 근로장려금
+    marginal_rate: np.ndarray   # 실효 한계세율 (첫 점은 NaN)
+
+    def _index(self, household_type: str, property_value) -> tuple[int, int]:
+        try:
+            h = self.household_types.index(household_type)
+        except ValueError:
+            raise ValueError("가구 유형은 '단독', '홑벌이', '맞벌이' 중 하나여야 합니다.") from None
+        matches = np.flatnonzero(self.property_values == property_value)
+        if not len(matches):
+            raise ValueError(f"스윕에 없는 재산 수준입니다: {property_value:,}원")
+        return h, int(matches[0])
+
+    def curve(self, household_type: str, property_value=0) -> dict:
+        """가구유형·재산 수준 하나의 곡선 (열 이름 → 소득 격자 길이 배열)"""
+        h, p = self._index(household_type, property_value)
+        return {
+            "income": self.incomes,
+            "eitc": self.eitc[h, p],
+            "status": self.status[h, p],
+            "tax": self.tax,
+            "net_income": self.net_income[h, p],
+            "marginal_rate": self.marginal_rate[h, p],
+        }
+
+    def point(self, income: int, household_type: str, property_value=0) -> dict:
+        """곡선 위의 사용자 위치 – income 이하인 가장 가까운 격자 점의 값"""
+        h, p = self._index(household_type, property_value)
+        i = int(np.clip(np.searchsorted(self.incomes, income, side="right") - 1, 0, len(self.incomes) - 1))
+        return {
+            "income": int(self.incomes[i]),
+            "eitc": int(self.eitc[h, p, i]),
+            "status": int(self.status[h, p, i]),
+            "tax": int(self.tax[i]),
+            "net_income": int(self.net_income[h, p, i]),
+            "marginal_rate": float(self.marginal_rate[h, p, i]),
+        }
+
+
+def sweep(incomes, household_types=HOUSEHOLD_TYPES, property_values=(0,), late_filing: bool = False,
+          age=None, year: int = 2024, schedule: str = "standard") -> SweepResult:
+    """
+    소득 격자 × 가구유형 × 재산 수준 전체를 한 번에 계산
+    incomes: 오름차순 소득 격자 (원)
+    age: 고령자 가산 산정표에서만 사용 (None 이면 가산 없음)
+    """
+    incomes = np.asarray(incomes, dtype=np.int64)
+    if incomes.ndim != 1 or (np.diff(incomes) <= 0).any():
+        raise ValueError("소득 격자는 1차원 오름차순이어야 합니다.")
+    household_types = tuple(household_types)
+    props = np.asarray(property_values, dtype=np.int64).reshape(-1)
+    n_h, n_p, n_i = len(household_types), len(props), len(incomes)
+
+    # 기본 산정액 (가구유형 × 소득)
+    if (year, schedule) == (2024, "standard"):
+        codes = np.array([HOUSEHOLD_TYPES.index(t) for t in household_types], dtype=np.intp)
+        base = calc_eitc_batch(np.tile(incomes, n_h), np.repeat(codes, n_i)).base_amount.reshape(n_h, n_i)
+    elif (year, schedule) == AGE_BONUS_SCHEDULE:
+        base = np.array([calc_eitc_amounts(incomes / MAN_WON, t, age) for t in household_types],
+                        dtype=np.int64).reshape(n_h, n_i)
+    else:
+        sched = get_schedule(year, schedule)
+        base = _schedule_amounts(sched, incomes, household_types)
+        if age is not None and sched.senior_age is not None and age >= sched.senior_age:
+            base = base * (100 + sched.senior_bonus_percent) // 100
+
+    # 재산 → 기한후신고 조정 (app.py 와 같은 순서·절사), 재산 축으로 브로드캐스트
+    base3 = np.broadcast_to(base[:, None, :], (n_h, n_p, n_i))
+    reduce = ((props > PROPERTY_REDUCE_LIMIT) & (props <= PROPERTY_EXCLUDE_LIMIT))[None, :, None]
+    exclude = (props > PROPERTY_EXCLUDE_LIMIT)[None, :, None]
+    adjusted = np.where(exclude, 0, np.where(reduce, (base3 * 0.5).astype(np.int64), base3))
+    final = (adjusted * 0.9).astype(np.int64) if late_filing else adjusted
+
+    zero = final == 0
+    status = np.select(
+        [zero & exclude, zero, reduce | late_filing],
+        [STATUS_PROPERTY_EXCLUDED, STATUS_NOT_ELIGIBLE, STATUS_REDUCED],
+        default=STATUS_NORMAL,
+    ).astype(np.int8)
+
+    tax = INCOME_TAX_2025.calculate_batch(incomes).total_tax
+    net = incomes - tax + final
+    marginal = np.full(net.shape, np.nan)
+    if n_i > 1:
+        marginal[..., 1:] = 1 - np.diff(net, axis=-1) / np.diff(incomes)
+
+    return SweepResult(incomes, household_types, props, final, status, tax, net, marginal)
@@ -0,0 +1,3 @@
+# taxdata/__init__.py
+# tax_app.py(세금 데이터 분석 시스템)의 데이터 처리 계층 – 수집·집계·내보내기 등
+# Streamlit 에 의존하지 않으며, 화면 구성은 tax_app.py 가 담당한다.
@@ -0,0 +1,241 @@
+# taxdata/answers.py
+# 챗봇 답변 캐시 + 집계로 바로 답할 수 있는 질문의 로컬 계산 경로
+#
+#   answer = local_answer(question, dataset, index)   # API 호출 없이 계산 (못 하면 None)
+#                                                     # index(taxdata.query.DatasetIndex)가 있으면 O(log n) 조회
+#   key = answer_key(fingerprint, question, model, temperature)
+#   answers.get(key) / answers.put(key, text)         # 같은 데이터·같은 질문이면 재사용
+#
+# AnswerCache 는 TTL + LRU 메모리 캐시이며, path 를 주면 SQLite 파일에 저장해
+# 프로세스가 재시작돼도 유지된다.
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+DEFAULT_TTL = 24 * 60 * 60          # 초
+DEFAULT_MAX_ENTRIES = 1_000
+
+_SPACES = re.compile(r"\s+")
+_TRAILING = re.compile(r"[\s?？!！.。~]+$")
+MAX_TOP_K = 20
+
+
+# ------------------------------
+# 질문 정규화 / 캐시 키
+# ------------------------------
+def normalize_question(question: str) -> str:
+    """NFKC 정규화, 소문자, 공백 하나로, 끝의 물음표·마침표 제거"""
+    text = unicodedata.normalize("NFKC", question).lower()
+    return _TRAILING.sub("", _SPACES.sub(" ", text).strip())
+
+
+def answer_key(fingerprint: str, question: str, model: str, temperature: float) -> str:
+    raw = "\x1f".join((fingerprint, normalize_question(question), model, repr(float(temperature))))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# ------------------------------
+# 로컬 계산 경로
+# ------------------------------
+# 로컬 경로는 질문 전체가 아래 템플릿 하나와 정확히 맞을 때만 답한다 (공백 제거 후 fullmatch).
+# 조건·비교·다른 내용어가 붙은 질문("… 이상이면서 세금 …", "평균 소득보다 …", "최고 소득자의 세금 …")은
+# 템플릿에 맞지 않아 None → 모델에 넘긴다.
+_JOSA = r"(?:은|는|이|가|을|를)?"
+_ASK = (r"(?:얼마|몇%|몇퍼센트|누구|뭐|무엇)?"
+        r"(?:인가요|인가|입니까|인지|이에요|예요|에요|이야|야|일까요|임|이지|지)?"
+        r"(?:알려줘|알려주세요|보여줘|보여주세요)?")
+_END = _JOSA + _ASK
+_HIGHEST = r"(?:가장높은|제일높은|최고)소득(?:자|을받는사람|인사람)?|소득이(?:가장|제일)높은사람"
+_LOWEST = r"(?:가장낮은|제일낮은|최저)소득(?:자|을받는사람|인사람)?|소득이(?:가장|제일)낮은사람"
+_AMOUNT = r"(\d[\d,]*(?:\.\d+)?)(만)?원?(이상|초과|이하|미만)"
+
+
+def _template(pattern: str):
+    return re.compile(f"(?:{pattern}){_END}")
+
+
+_TEMPLATES = (
+    ("effective_rate", _template(r"(?:전체)?평균세율")),
+    ("income_mean", _template(r"(?:전체)?평균소득")),
+    ("tax_mean", _template(r"(?:전체)?평균세금")),
+    ("income_max", _template(_HIGHEST)),
+    ("income_min", _template(_LOWEST)),
+    ("count_income", _template(r"소득(?:이|은)?" + _AMOUNT + r"(?:인|인사람|인사람의|인사람은|인사람이)?(?:몇명|인원수?|수)")),
+    ("count_income", _template(_AMOUNT + r"(?:인)?소득자(?:는|가|의)?(?:몇명|인원수?|수)")),
+    ("median_income", _template(r"소득(?:의)?(?:중위값|중앙값|중간값)|중위소득")),
+    ("top_k_income", _template(r"소득(?:이|의)?(상위|하위)(\d+)명")),
+    ("total_count", _template(r"(?:총|전체)인원(?:수)?|(?:총|전체)?몇명")),
+)
+
+
+def match_question(question: str):
+    """(템플릿 이름, 매치) – 질문 전체가 맞는 템플릿이 없으면 (None, None)"""
+    q = normalize_question(question).replace(" ", "")
+    for name, pattern in _TEMPLATES:
+        match = pattern.fullmatch(q)
+        if match:
+            return name, match
+    return None, None
+
+
+def _count_answer(dataset, match, index=None) -> str:
+    amount = round(float(match.group(1).replace(",", "")) * (10_000 if match.group(2) else 1))
+    op = match.group(3)
+    income = dataset.income
+    if index is not None:
+        below = index.count_below("income", amount, inclusive=op in ("초과", "이하"))
+        n = below if op in ("이하", "미만") else len(income) - below
+    elif op == "이상":
+        n = int((income >= amount).sum())
+    elif op == "초과":
+        n = int((income > amount).sum())
+    elif op == "이하":
+        n = int((income <= amount).sum())
+    else:
+        n = int((income < amount).sum())
+    return f"소득이 {amount:,}원 {op}인 사람은 전체 {len(income):,}명 중 **{n:,}명**입니다."
+
+
+def _top_k_answer(dataset, index, match) -> str:
+    largest = match.group(1) == "상위"
+    rows = index.top_k("income", min(int(match.group(2)), MAX_TOP_K), largest=largest)
+    categories = dataset.categories
+    lines = [f"{rank}. {categories[dataset.name_codes[i]]} – {int(dataset.income[i]):,}원"
+             for rank, i in enumerate(rows, 1)]
+    return f"소득 {match.group(1)} {len(rows)}명입니다.\n\n" + "\n".join(lines)
+
+
+def local_answer(question: str, dataset, index=None):
+    """
+    집계만으로 답할 수 있는 질문이면 답변 문자열, 아니면 None
+    질문 전체가 템플릿(_TEMPLATES) 하나와 맞아야 한다. 인원 세기·중위 소득·소득 상위/하위 N명은
+    전체 행이 있을 때만, 중위 소득·상위/하위 N명은 index 가 있을 때만 계산한다.
+    """
+    stats = dataset.stats
+    if stats.count == 0:
+        return None
+    name, match = match_question(question)
+    if name is None:
+        return None
+
+    if name == "effective_rate":
+        return (f"평균 세율(총 세금 ÷ 총 소득)은 **{stats.effective_rate:.2f}%**입니다. "
+                f"(총 세금 {stats.tax_sum:,}원 / 총 소득 {stats.income_sum:,}원)")
+    if name == "income_mean":
+        return f"평균 소득은 **{stats.income_mean:,.0f}원**입니다. (총 {stats.count:,}명)"
+    if name == "tax_mean":
+        return f"평균 세금은 **{stats.tax_mean:,.0f}원**입니다. (총 {stats.count:,}명)"
+    if name == "income_max":
+        return f"가장 높은 소득자는 **{stats.income_max_name}**이며, 소득은 {stats.income_max:,}원입니다."
+    if name == "income_min":
+        return f"가장 낮은 소득자는 **{stats.income_min_name}**이며, 소득은 {stats.income_min:,}원입니다."
+    if name == "total_count":
+        return f"전체 인원은 **{stats.count:,}명**입니다."
+    if dataset.is_partial:                        # 아래는 전체 행이 있어야 계산 가능
+        return None
+    if name == "count_income":
+        return _count_answer(dataset, match, index)
+    if index is None or not len(dataset):
+        return None
+    if name == "median_income":
+        return f"소득 중앙값(중위 소득)은 **{index.percentile('income', 50):,.0f}원**입니다. (총 {len(dataset):,}명)"
+    if name == "top_k_income":
+        return _top_k_answer(dataset, index, match)
+    return None
+
+
+# ------------------------------
+# 답변 캐시
+# ------------------------------
+class AnswerCache:
+    """TTL + LRU 답변 캐시 (스레드 안전) – path 를 주면 SQLite 에 저장"""
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES, path: str = None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()       # key → (answer, created)
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS answers ("
+                             "key TEXT PRIMARY KEY, answer TEXT NOT NULL, "
+                             "created REAL NOT NULL, last_used REAL NOT NULL)")
+            self._db.commit()
+
+    def __len__(self):
+        with self._lock:
+            if self._db is not None:
+                return self._db.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+            return len(self._memory)
+
+    def get(self, key: str):
+        now = time.time()
+        with self._lock:
+            if self._db is not None:
+                row = self._db.execute("SELECT answer, created FROM answers WHERE key = ?", (key,)).fetchone()
+                if row is not None and now - row[1] > self.ttl:
+                    self._db.execute("DELETE FROM answers WHERE key = ?", (key,))
+                    self._db.commit()
+                    row = None
+                if row is not None:
+                    self._db.execute("UPDATE answers SET last_used = ? WHERE key = ?", (now, key))
+                    self._db.commit()
+            else:
+                row = self._memory.get(key)
+                if row is not None and now - row[1] > self.ttl:
+                    del self._memory[key]
+                    row = None
+                if row is not None:
+                    self._memory.move_to_end(key)
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, answer: str) -> None:
+        now = time.time()
+        with self._lock:
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?)", (key, answer, now, now))
+                self._db.execute("DELETE FROM answers WHERE created < ?", (now - self.ttl,))
+                self._db.execute("DELETE FROM answers WHERE key IN (SELECT key FROM answers "
+                                 "ORDER BY last_used DESC LIMIT -1 OFFSET ?)", (self.max_entries,))
+                self._db.commit()
+            else:
+                self._memory[key] = (answer, now)
+                self._memory.move_to_end(key)
+                while len(self._memory) > self.max_entries:
+                    self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM answers")
+                self._db.commit()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "backend": "sqlite" if self._db is not None else "memory",
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,122 @@
+# taxdata/cache.py
+# 파생 결과 캐시 – 데이터 내용 해시(fingerprint)를 키로 파생 DataFrame / Styler / 차트 JSON 을 보관한다.
+#
+# 프로세스 전역에서 하나의 인스턴스를 공유하므로(tax_app.py 는 st.cache_resource 로 생성),
+# 같은 데이터를 보는 여러 세션이 계산 결과를 재사용한다.
+# 총 크기(바이트)와 항목 수 상한을 넘으면 가장 오래 사용되지 않은 항목부터 제거한다(LRU).
+
+import sys
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 512
+
+
+def estimate_size(value) -> int:
+    """캐시 항목의 대략적인 메모리 크기 (바이트)"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8", "surrogatepass"))
+    if isinstance(value, tuple):               # NamedTuple 등 – 원소 크기 합
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(index=True, deep=True)
+            return int(usage.sum() if hasattr(usage, "sum") else usage)
+        except TypeError:
+            pass
+    data = getattr(value, "data", None)        # pandas Styler → 원본 DataFrame
+    if data is not None and data is not value and hasattr(data, "memory_usage"):
+        return 2 * estimate_size(data)
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    return sys.getsizeof(value)
+
+
+class DerivedCache:
+    """크기 제한 LRU 캐시 (스레드 안전) – 적중/실패/제거 횟수 집계"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_bytes = int(max_bytes)
+        self.max_entries = int(max_entries)
+        self._items = OrderedDict()      # key → (value, size)
+        self._lock = threading.RLock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __repr__(self):
+        return f"DerivedCache(entries={len(self)}, bytes={self.bytes}, hits={self.hits}, misses={self.misses})"
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key, value, size: int = None) -> None:
+        size = estimate_size(value) if size is None else int(size)
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            if size > self.max_bytes:
+                return          # 상한보다 큰 항목은 보관하지 않음
+            self._items[key] = (value, size)
+            self.bytes += size
+            self._evict()
+
+    def get_or_compute(self, key, compute):
+        """캐시에 있으면 반환, 없으면 compute() 결과를 저장 후 반환"""
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def _evict(self) -> None:
+        while self._items and (self.bytes > self.max_bytes or len(self._items) > self.max_entries):
+            _, (_, size) = self._items.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def discard(self, predicate) -> int:
+        """predicate(key) 가 참인 항목 제거 – 제거 수 반환"""
+        with self._lock:
+            keys = [k for k in self._items if predicate(k)]
+            for k in keys:
+                self.bytes -= self._items.pop(k)[1]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._items),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,174 @@
+# taxdata/charts.py
+# tax_app.py 차트 생성 – 4️⃣ 통계 분석의 소득 분포, 6️⃣ 차트 생성의 막대/라인/파이/산점도
+#
+# 행 수가 max_points 를 넘으면 차트에 넣기 전에 줄인다 (브라우저로 보내는 JSON 크기 제한).
+#   - 소득 분포: 서버에서 구간 집계 후 막대로 표시
+#   - 막대: 이름별 합계 상위 max_points 명
+#   - 라인: LTTB(Largest-Triangle-Three-Buckets) 다운샘플링 – 소득·세금을 함께 보고 한 번 고른 행을 두 선이 같이 씀
+#   - 파이: 이름별 합계 상위 N 명 + "기타"
+#   - 산점도: 무작위 표본 max_points 점을 WebGL(Scattergl)로, 그보다 훨씬 많으면 서버에서 집계한 2차원 히스토그램(밀도)
+# 집계는 미리 만들어 둔 것을 받을 수 있다 – 소득 분포는 조회 인덱스(index), 막대·파이는 이름별 합계(totals,
+# taxdata.stats.NameTotals.frame()). 둘 다 데이터가 바뀌면 변경 행만 반영해 갱신되므로 차트를 다시 만들 때
+# 전체 행을 다시 집계하지 않는다.
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+DEFAULT_MAX_POINTS = 2_000
+WEBGL_MAX_POINTS = 100_000
+PIE_TOP_N = 10
+OTHER_LABEL = "기타"
+USES_TOTALS = ("막대 차트", "파이 차트")     # 이름별 합계(totals)를 받는 6️⃣ 차트
+
+
+# ------------------------------
+# 다운샘플링 / 집계
+# ------------------------------
+def lttb_indices(y, n_out: int) -> np.ndarray:
+    """
+    LTTB 로 선택한 행 위치 (x 는 행 순서) – 첫 점과 마지막 점은 항상 포함
+    y 가 (행, 계열) 2차원이면 계열마다 값 범위로 정규화한 삼각형 넓이의 합으로 모든 계열에 공통인 행을 고른다.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    series = [y] if y.ndim == 1 else [np.ascontiguousarray(column) for column in y.T]
+    if len(series) > 1:
+        series = [(s - s.min()) / ((s.max() - s.min()) or 1) for s in series]
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    bounds = np.append(edges, n)
+    avg_xs = (bounds[:-1] + bounds[1:] - 1) / 2                                 # 구간별 평균 x
+    avg_ys = [np.add.reduceat(s, edges) / np.diff(bounds) for s in series]     # 계열·구간별 평균 y
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        avg_x = avg_xs[i + 1]
+        xs = np.arange(start, end)
+        area = 0
+        for s, avg in zip(series, avg_ys):
+            area = area + np.abs((a - avg_x) * (s[start:end] - s[a]) - (a - xs) * (avg[i + 1] - s[a]))
+        a = start + int(area.argmax())
+        out[i + 1] = a
+    return out
+
+
+def top_n_with_other(df, names: str, values: str, n: int, totals=None) -> pd.DataFrame:
+    """이름별 합계 상위 n 개 + 나머지 합계('기타') – totals(이름별 합계 DataFrame)가 있으면 다시 집계하지 않음"""
+    if totals is None:
+        totals = df.groupby(names, observed=True, sort=False)[values].sum()
+    else:
+        totals = totals.set_index(names)[values]
+    totals = totals.sort_values(ascending=False, kind="stable")     # 동률은 먼저 나온 이름 우선
+    if len(totals) <= n:
+        return totals.reset_index()
+    top = totals.iloc[:n]
+    other = pd.Series([totals.iloc[n:].sum()], index=[OTHER_LABEL])
+    merged = pd.concat([pd.Series(top.to_numpy(), index=top.index.astype(str)), other])
+    return merged.rename_axis(names).rename(values).reset_index()
+
+
+def payload_size(fig) -> int:
+    """figure JSON 크기 (바이트)"""
+    return len(fig.to_json().encode("utf-8"))
+
+
+# ------------------------------
+# 차트
+# ------------------------------
+def income_histogram(df, max_points: int = DEFAULT_MAX_POINTS, index=None):
+    if len(df) <= max_points:
+        return px.histogram(df, x='income', nbins=10,
+                            title='소득 분포',
+                            labels={'income': '소득', 'count': '인원'})
+    if index is not None:
+        counts, edges = index.histogram('income', bins=10)
+    else:
+        counts, edges = np.histogram(df['income'].to_numpy(), bins=10)
+    fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts,
+                           width=np.diff(edges), name='인원'))
+    fig.update_layout(title='소득 분포', xaxis_title='소득', yaxis_title='인원', bargap=0)
+    return fig
+
+
+def bar_chart(df, max_points: int = DEFAULT_MAX_POINTS, totals=None):
+    title = '소득 및 세금 비교'
+    if len(df) > max_points:
+        if totals is None:
+            totals = df.groupby('name', observed=True, sort=False)[['income', 'tax']].sum().reset_index()
+        df = totals.nlargest(max_points, 'income')
+        title += f' (소득 상위 {max_points:,}명)'
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=df['name'], y=df['income'],
+                         name='소득', marker_color='lightblue'))
+    fig.add_trace(go.Bar(x=df['name'], y=df['tax'],
+                         name='세금', marker_color='lightcoral'))
+    fig.update_layout(title=title,
+                      xaxis_title='이름', yaxis_title='금액 (원)',
+                      barmode='group')
+    return fig
+
+
+def line_chart(df, max_points: int = DEFAULT_MAX_POINTS):
+    title = '소득 및 세금 추이'
+    if len(df) > max_points:
+        # 행을 한 번만 골라 두 선이 같은 행을 쓰고, x 는 행 번호 (이름은 겹칠 수 있어 범주 축이면 점이 한데 모임)
+        rows = lttb_indices(df[['income', 'tax']].to_numpy(), max_points)
+        part, x, text, xaxis_title = df.iloc[rows], rows, df['name'].iloc[rows], '행 번호'
+        title += f' (LTTB {max_points:,}점)'
+    else:
+        part, x, text, xaxis_title = df, df['name'], None, '이름'
+    fig = go.Figure()
+    for column, label in (('income', '소득'), ('tax', '세금')):
+        fig.add_trace(go.Scatter(x=x, y=part[column], text=text,
+                                 mode='lines+markers', name=label))
+    fig.update_layout(title=title,
+                      xaxis_title=xaxis_title, yaxis_title='금액 (원)')
+    return fig
+
+
+def pie_chart(df, max_points: int = DEFAULT_MAX_POINTS, top_n: int = PIE_TOP_N, totals=None):
+    if len(df) <= max_points and df['name'].nunique() <= top_n:
+        return px.pie(df, values='income', names='name',
+                      title='소득 비율')
+    grouped = top_n_with_other(df, 'name', 'income', top_n, totals=totals)
+    return px.pie(grouped, values='income', names='name',
+                  title=f'소득 비율 (상위 {top_n}명 + {OTHER_LABEL})')
+
+
+def scatter_chart(df, max_points: int = DEFAULT_MAX_POINTS, webgl_max_points: int = WEBGL_MAX_POINTS):
+    if len(df) <= max_points:
+        fig = px.scatter(df, x='income', y='tax', text='name',
+                         title='소득-세금 상관관계',
+                         labels={'income': '소득', 'tax': '세금'})
+        fig.update_traces(textposition='top center')
+        return fig
+    if len(df) <= webgl_max_points:
+        # max_points 행 무작위 표본만 전송 (시드 고정 – 같은 데이터면 같은 그림), 점별 이름 라벨 없음
+        rows = np.sort(np.random.default_rng(0).choice(len(df), max_points, replace=False))
+        sample = df.iloc[rows]
+        fig = go.Figure(go.Scattergl(x=sample['income'], y=sample['tax'], mode='markers',
+                                     marker=dict(size=4, opacity=0.6)))
+        title = f'소득-세금 상관관계 (WebGL, 표본 {max_points:,}점)'
+    else:
+        # 서버에서 구간 집계 후 격자만 전송
+        counts, x_edges, y_edges = np.histogram2d(df['income'].to_numpy(), df['tax'].to_numpy(), bins=100)
+        fig = go.Figure(go.Heatmap(x=(x_edges[:-1] + x_edges[1:]) / 2, y=(y_edges[:-1] + y_edges[1:]) / 2,
+                                   z=counts.T, colorscale='Blues', colorbar=dict(title='인원')))
+        title = '소득-세금 분포 (2차원 히스토그램)'
+    fig.update_layout(title=title, xaxis_title='소득', yaxis_title='세금')
+    return fig
+
+
+# 6️⃣ 차트 생성 선택지 → 생성 함수
+CHARTS = {
+    "막대 차트": bar_chart,
+    "라인 차트": line_chart,
+    "파이 차트": pie_chart,
+    "산점도": scatter_chart,
+}
@@ -0,0 +1,152 @@
+# taxdata/chat.py
+# AI 챗봇 백엔드 – API 키·엔드포인트별로 OpenAI 클라이언트(HTTP 연결 풀)를 재사용하고,
+# 스레드 실행기에서 스트리밍 요청을 보내 토큰이 도착하는 대로 넘겨준다.
+#
+#   backend = ChatBackend()
+#   stream = backend.stream(messages, api_key=..., base_url=None)
+#   st.write_stream(stream)          # 토큰 단위 출력
+#   stream.text, stream.ttft         # 전체 응답, 첫 토큰까지 걸린 시간
+#
+# 첫 토큰 전에 연결 오류·429·5xx 가 나면 지수 백오프로 재시도하고, 토큰이 나오기 시작한 뒤에는
+# 중복 출력을 막기 위해 재시도하지 않는다. base_url 을 바꾸면 로컬 스텁(taxdata.chat_stub) 등
+# OpenAI 호환 엔드포인트로 보낼 수 있다.
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_MODEL = "gpt-4o"  # 또는 "gpt-3.5-turbo" (더 저렴)
+DEFAULT_MAX_TOKENS = 1000
+DEFAULT_TEMPERATURE = 0.7
+
+
+def format_error(exc) -> str:
+    return f"❌ 오류 발생: {str(exc)}\n\nAPI 키를 확인해주세요."
+
+
+def _is_retryable(exc) -> bool:
+    import openai
+    return isinstance(exc, (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError))
+
+
+class ChatStream:
+    """
+    스트리밍 응답 – 반복하면 토큰(문자열 조각)을 차례로 반환한다.
+    오류나 시간 초과는 예외 대신 오류 문구를 마지막 조각으로 반환하고 error 에 기록한다.
+    """
+
+    def __init__(self, first_token_timeout: float, idle_timeout: float):
+        self.text = ""
+        self.ttft = None            # 요청 → 첫 토큰 (초)
+        self.elapsed = None         # 요청 → 완료 (초)
+        self.error = None
+        self.attempts = 0
+        self._queue = queue.Queue()
+        self._cancelled = threading.Event()
+        self._first_token_timeout = first_token_timeout
+        self._idle_timeout = idle_timeout
+        self._started = time.perf_counter()
+
+    def __iter__(self):
+        while True:
+            timeout = self._first_token_timeout if self.ttft is None else self._idle_timeout
+            try:
+                kind, value = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self.cancel()
+                kind, value = "error", TimeoutError(f"응답 대기 시간({timeout:.0f}초)을 초과했습니다.")
+
+            if kind == "token":
+                if self.ttft is None:
+                    self.ttft = time.perf_counter() - self._started
+                self.text += value
+                yield value
+            else:
+                if kind == "error":
+                    self.error = value
+                    message = format_error(value)
+                    self.text += message
+                    yield message
+                break
+        self.elapsed = time.perf_counter() - self._started
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def result(self) -> str:
+        """끝까지 읽고 전체 응답 반환 (스트리밍 없이 쓸 때)"""
+        for _ in self:
+            pass
+        return self.text
+
+
+class ChatBackend:
+    """프로세스 전역 챗봇 백엔드 – 클라이언트 풀 + 요청 실행기"""
+
+    def __init__(self, max_workers: int = 8, request_timeout: float = 60.0, retries: int = 2,
+                 backoff: float = 0.5, first_token_timeout: float = 30.0, idle_timeout: float = 30.0):
+        self.request_timeout = request_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.first_token_timeout = first_token_timeout
+        self.idle_timeout = idle_timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="chat")
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def client(self, api_key: str, base_url: str = None):
+        """(API 키, 엔드포인트)별 OpenAI 클라이언트 – 내부 HTTP 연결 풀을 재사용"""
+        key = (api_key, base_url or None)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                from openai import OpenAI
+                client = OpenAI(api_key=api_key, base_url=base_url or None,
+                                timeout=self.request_timeout, max_retries=0)
+                self._clients[key] = client
+            return client
+
+    def stream(self, messages, api_key: str, base_url: str = None, model: str = DEFAULT_MODEL,
+               max_tokens: int = DEFAULT_MAX_TOKENS, temperature: float = DEFAULT_TEMPERATURE) -> ChatStream:
+        """요청을 실행기에 넘기고 바로 ChatStream 반환"""
+        stream = ChatStream(self.first_token_timeout, self.idle_timeout)
+        request = dict(model=model, messages=messages, max_tokens=max_tokens,
+                       temperature=temperature, stream=True)
+        self._executor.submit(self._run, stream, api_key, base_url, request)
+        return stream
+
+    def complete(self, messages, api_key: str, **kwargs) -> str:
+        """스트리밍 없이 전체 응답 문자열 반환"""
+        return self.stream(messages, api_key, **kwargs).result()
+
+    def _run(self, stream: ChatStream, api_key, base_url, request) -> None:
+        put = stream._queue.put
+        for attempt in range(self.retries + 1):
+            stream.attempts = attempt + 1
+            produced = False
+            try:
+                response = self.client(api_key, base_url).chat.completions.create(**request)
+                with response:
+                    for chunk in response:
+                        if stream._cancelled.is_set():
+                            return
+                        delta = chunk.choices[0].delta.content if chunk.choices else None
+                        if delta:
+                            produced = True
+                            put(("token", delta))
+                put(("done", None))
+                return
+            except Exception as e:
+                if produced or attempt == self.retries or not _is_retryable(e):
+                    put(("error", e))
+                    return
+                if stream._cancelled.wait(self.backoff * 2 ** attempt):
+                    return
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
@@ -0,0 +1,139 @@
+# taxdata/chat_stub.py
+# 로컬 OpenAI 호환 스텁 서버 – /v1/chat/completions 를 흉내 내며, 실제 API 없이 챗봇·벤치마크를 돌릴 때 쓴다.
+#
+#   with StubChatServer(token_delay=0.01) as server:
+#       backend.stream(messages, api_key="stub", base_url=server.base_url)
+#
+# 스트리밍 요청에는 SSE(data: …) 청크를 HTTP/1.1 chunked 전송으로 보내므로 연결이 재사용된다.
+# fail_first=n 이면 처음 n 개 요청에 500 을 돌려준다 (재시도 확인용).
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_REPLY = "스텁 응답입니다. 데이터 요약을 바탕으로 답변을 생성했다고 가정합니다."
+
+
+def split_tokens(text: str) -> list[str]:
+    """공백을 앞 토큰에 붙여 단어 단위로 분할"""
+    tokens, current = [], ""
+    for ch in text:
+        current += ch
+        if ch == " ":
+            tokens.append(current)
+            current = ""
+    if current:
+        tokens.append(current)
+    return tokens
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):      # 요청 로그 출력 안 함
+        pass
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_POST(self):
+        server = self.server.stub
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "not found"}})
+            return
+        with server.lock:
+            server.requests += 1
+            fail = server.requests <= server.fail_first
+        if fail:
+            self._send_json(500, {"error": {"message": "stub failure", "type": "server_error"}})
+            return
+
+        request = json.loads(body or b"{}")
+        reply = server.reply(request) if callable(server.reply) else server.reply
+        model = request.get("model", "stub")
+        created = int(time.time())
+        time.sleep(server.first_token_delay)
+
+        tokens = split_tokens(reply)
+        if not request.get("stream"):
+            time.sleep(server.token_delay * max(len(tokens) - 1, 0))   # 생성 시간은 스트리밍과 같게
+            self._send_json(200, {
+                "id": "chatcmpl-stub", "object": "chat.completion", "created": created, "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": reply},
+                             "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            })
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def event(delta, finish_reason=None):
+            chunk = {"id": "chatcmpl-stub", "object": "chat.completion.chunk", "created": created,
+                     "model": model,
+                     "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]}
+            self._write_chunk(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+
+        event({"role": "assistant", "content": ""})
+        for i, token in enumerate(tokens):
+            if i:
+                time.sleep(server.token_delay)
+            event({"content": token})
+        event({}, "stop")
+        self._write_chunk(b"data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+class StubChatServer:
+    """
+    백그라운드 스레드에서 도는 스텁 서버
+    reply: 고정 응답 문자열 또는 request(dict) → 문자열 함수
+    first_token_delay / token_delay: 첫 토큰 전 / 토큰 사이 지연(초)
+    """
+
+    def __init__(self, reply=DEFAULT_REPLY, first_token_delay: float = 0.0, token_delay: float = 0.0,
+                 fail_first: int = 0, host: str = "127.0.0.1", port: int = 0):
+        self.reply = reply
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+        self.fail_first = fail_first
+        self.requests = 0
+        self.lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "StubChatServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="chat-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,125 @@
+# taxdata/context.py
+# 챗봇 시스템 프롬프트용 데이터 컨텍스트 – 데이터 크기와 무관하게 크기가 제한된 요약을 만든다.
+#
+# df.to_string() 전체를 넣으면 프롬프트가 행 수에 비례해 커지므로, 대신
+#   - 누적 집계(TaxStats): 인원·합계·평균·최고/최저·평균 세율
+#   - 소득·세금 분위수
+#   - 소득 상위/하위 k 행
+#   - 행 순서대로 고르게 뽑은 표본 행 (행이 적으면 전체 행)
+# 을 담는다. build_context() 결과는 데이터 버전(fingerprint)별로 캐시하고,
+# 질문에 언급된 이름의 행만 with_relevant_rows() 로 매 질문마다 덧붙인다.
+# 조회 인덱스(taxdata.query.DatasetIndex)를 주면 분위수·상위/하위 행을 정렬 인덱스에서 바로 읽는다 –
+# 인덱스는 데이터가 바뀌어도 변경 행만 반영해 갱신되므로 컨텍스트를 다시 만들 때 전체 정렬이 없다.
+
+import math
+import re
+from typing import NamedTuple
+
+import numpy as np
+
+from .perf import timed
+
+DEFAULT_FULL_ROWS = 50       # 이하이면 전체 행 포함
+DEFAULT_TOP_K = 5
+DEFAULT_SAMPLE_ROWS = 20
+DEFAULT_MAX_TOKENS = 1_500
+RELEVANT_ROWS = 10
+QUANTILES = (10, 25, 50, 75, 90)
+
+_WORD = re.compile(r"[\w가-힣]+")
+
+
+class DataContext(NamedTuple):
+    text: str
+    tokens: int          # 추정 토큰 수
+    rows_included: int   # 프롬프트에 들어간 행 수
+    rows_total: int      # 전체 행 수 (집계 기준)
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 – ASCII 는 4글자당 1토큰, 한글 등 그 외 문자는 글자당 1토큰"""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+def _row_lines(dataset, idx) -> list[str]:
+    categories = dataset.categories
+    codes, income, tax = dataset.name_codes[idx], dataset.income[idx], dataset.tax[idx]
+    return [f"{categories[c]}: 소득 {i:,}원 / 세금 {t:,}원" for c, i, t in zip(codes, income, tax)]
+
+
+def _section(title: str, lines) -> str:
+    return f"{title}:\n" + "\n".join(f"- {line}" for line in lines)
+
+
+@timed("context.build")
+def build_context(dataset, full_rows: int = DEFAULT_FULL_ROWS, top_k: int = DEFAULT_TOP_K,
+                  sample_rows: int = DEFAULT_SAMPLE_ROWS, max_tokens: int = DEFAULT_MAX_TOKENS,
+                  index=None) -> DataContext:
+    """데이터셋 요약 컨텍스트 – 행 수와 무관하게 대략 max_tokens 이하 (index 는 같은 버전의 DatasetIndex)"""
+    stats = dataset.stats
+    n = len(dataset)
+    summary = _section("현재 데이터 요약", [
+        f"총 인원: {stats.count:,}명",
+        f"총 소득: {stats.income_sum:,}원",
+        f"총 세금: {stats.tax_sum:,}원",
+        f"평균 소득: {stats.income_mean:,.0f}원",
+        f"평균 세금: {stats.tax_mean:,.0f}원",
+        f"최고 소득: {stats.income_max:,}원 ({stats.income_max_name})" if stats.count else "최고 소득: 없음",
+        f"최저 소득: {stats.income_min:,}원 ({stats.income_min_name})" if stats.count else "최저 소득: 없음",
+        f"평균 세율: {stats.effective_rate:.2f}%",
+    ])
+    if n == 0:
+        return DataContext(summary, estimate_tokens(summary), 0, stats.count)
+
+    parts = [summary]
+    note = f" (전체 {stats.count:,}행 중 보관된 {n:,}행 기준)" if dataset.is_partial else ""
+    if n <= full_rows:
+        parts.append(_section(f"상세 데이터{note}", _row_lines(dataset, np.arange(n))))
+        text = "\n\n".join(parts)
+        return DataContext(text, estimate_tokens(text), n, stats.count)
+
+    if index is not None:
+        income_q = [index.percentile("income", q) for q in QUANTILES]
+        tax_q = [index.percentile("tax", q) for q in QUANTILES]
+        order = index.order("income")
+    else:
+        income_q, tax_q = np.percentile(dataset.income, QUANTILES), np.percentile(dataset.tax, QUANTILES)
+        order = np.argsort(dataset.income, kind="stable")
+    parts.append(_section(f"분위수{note}", [
+        f"{q}%: 소득 {a:,.0f}원 / 세금 {b:,.0f}원" for q, a, b in zip(QUANTILES, income_q, tax_q)
+    ]))
+    top, bottom = order[::-1][:top_k], order[:top_k]
+    parts.append(_section(f"소득 상위 {len(top)}명", _row_lines(dataset, top)))
+    parts.append(_section(f"소득 하위 {len(bottom)}명", _row_lines(dataset, bottom)))
+
+    # 표본 행은 예산을 넘지 않는 만큼만
+    head = "\n\n".join(parts)
+    budget = max_tokens - estimate_tokens(head)
+    sample = np.unique(np.linspace(0, n - 1, min(sample_rows, n)).astype(np.int64))
+    lines = []
+    for line in _row_lines(dataset, sample):
+        cost = estimate_tokens(line) + 2
+        if cost > budget:
+            break
+        budget -= cost
+        lines.append(line)
+    if lines:
+        parts.append(_section(f"표본 {len(lines)}행 (행 순서대로 고르게 추출)", lines))
+    text = "\n\n".join(parts)
+    return DataContext(text, estimate_tokens(text), len(top) + len(bottom) + len(lines), stats.count)
+
+
+def with_relevant_rows(context: DataContext, dataset, question: str, limit: int = RELEVANT_ROWS) -> DataContext:
+    """질문에 이름이 언급된 사람의 행을 덧붙인 컨텍스트 (전체 행이 이미 들어 있으면 그대로)"""
+    if context.rows_included >= len(dataset):
+        return context
+    idx = []
+    for word in dict.fromkeys(_WORD.findall(question)):
+        idx.extend(dataset.rows_of(word)[:limit - len(idx)].tolist())
+        if len(idx) >= limit:
+            break
+    if not idx:
+        return context
+    text = context.text + "\n\n" + _section("질문에 언급된 행", _row_lines(dataset, np.asarray(idx)))
+    return DataContext(text, estimate_tokens(text), context.rows_included + len(idx), context.rows_total)
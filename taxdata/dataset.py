@@ -0,0 +1,463 @@
+# taxdata/dataset.py
+# 세금 데이터셋 – 열별 가변 버퍼(용량 2배 확장)에 행을 추가하고 누적 집계(TaxStats)를 함께 갱신한다.
+#
+# 행 추가는 분할 상환 O(1)이며 pd.concat 처럼 전체 프레임을 복사하지 않는다.
+# 화면·챗봇은 dataset.stats 의 캐시된 집계를 O(1)로 읽고, 표·차트가 필요할 때만
+# dataset.frame() 으로 DataFrame 을 만든다 (버전별 1회 생성 후 캐시).
+# 열 버퍼는 값 범위에 맞는 가장 작은 정수 dtype 을 쓰고 필요할 때만 넓힌다 (taxdata.schema).
+# frame() 은 버퍼를 복사 없이 감싸며, 파생 컬럼(tax_rate)은 pandas copy-on-write 로 기본 열을 공유한다.
+#
+# 변경(append / extend / update / delete)마다 version 이 오르고 행 단위 변경 기록(Delta)이 남는다.
+# 조회 인덱스·차트 집계 같은 파생 결과는 changes_since(이전 버전)의 변경분만 반영해 갱신하고
+# (taxdata.incremental), 데이터셋이 직접 가진 파생 값도 바뀐 행만 다시 계산한다.
+#   - stats: 추가 O(1), 수정·삭제도 합계는 O(1) – 최고/최저 소득 행이 빠질 때만 남은 행에서 다시 구함
+#   - tax_rate(): 한 번 계산한 세율 버퍼에 새로 추가·수정된 행만 계산
+#   - fingerprint(): BLOCK_ROWS 행 블록별 해시를 보관하고 바뀐 블록만 다시 해시
+# 행 추가는 버퍼의 뒤쪽에만 쓰므로 이전 버전의 frame·뷰가 그대로 유효하다. 수정은 그 칸만 제자리에서 고치되,
+# 버퍼를 밖으로 내준 뒤(frame(), income / tax / name_codes / tax_rate() 뷰, 저장소 memmap)라면 처음 고칠 때만
+# 새 버퍼로 한 번 복사한다 (copy-on-write) – 이전 버전 frame 은 DerivedCache 를 통해 다른 세션과 공유될 수 있다.
+# 삭제는 행이 당겨지므로 항상 새 버퍼를 만든다.
+
+import hashlib
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from .schema import code_dtype, int_dtype, is_shared, strings_nbytes, value_range
+from .stats import TaxStats
+
+_MIN_CAPACITY = 16
+BLOCK_ROWS = 1 << 16            # fingerprint 블록 크기 (행)
+MAX_CHANGES = 64                # 보관하는 변경 기록 수
+MAX_CHANGE_ROWS = 100_000       # 변경 기록에 담는 행 수 상한 – 이보다 큰 변경은 파생 결과를 새로 만드는 편이 빠르다
+
+APPEND, UPDATE, DELETE = "append", "update", "delete"
+
+
+class Delta(NamedTuple):
+    """
+    행 단위 변경 하나
+    rows: 변경 직전 버전 기준 행 위치 (append 는 추가된 행 위치의 range, delete 는 오름차순 배열)
+    before / after: 바뀌기 전·후 (codes, income, tax) 배열 – append 는 after 만, delete 는 before 만
+    """
+    version: int                 # 이 변경으로 만들어진 버전
+    kind: str                    # APPEND / UPDATE / DELETE
+    rows: object
+    before: Optional[tuple] = None
+    after: Optional[tuple] = None
+
+
+def _copied(buffer: np.ndarray, n: int) -> np.ndarray:
+    """같은 용량의 새 버퍼에 앞 n 개만 복사 (memmap 이어도 일반 배열로)"""
+    new = np.empty(len(buffer), dtype=buffer.dtype)
+    new[:n] = buffer[:n]
+    return new
+
+
+def _rates(income, tax) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.round(tax / income * 100, 2)
+
+
+class TaxDataset:
+    """
+    name / income / tax 열 버퍼 + 누적 집계
+    name 은 범주 코드와 범주 목록으로, income / tax 는 값 범위에 맞는 가장 작은 정수 dtype 으로 저장한다.
+    stats 는 버퍼보다 많은 행을 대표할 수 있다 (대용량 모드: 미리보기 행만 보관, 집계는 전체 기준).
+    """
+
+    def __init__(self, capacity: int = _MIN_CAPACITY):
+        capacity = max(int(capacity), _MIN_CAPACITY)
+        self._codes = np.empty(capacity, dtype=np.int8)
+        self._income = np.empty(capacity, dtype=np.int8)
+        self._tax = np.empty(capacity, dtype=np.int8)
+        self._n = 0
+        self._categories = []
+        self._code_of = {}
+        self._category_index = None
+        self.stats = TaxStats()
+        self.show_tax_rate = False
+        self.version = 0
+        self._frame_cache = None
+        self._fingerprint = None
+        self._rate = None                # 세율 버퍼 (앞 _rate_n 행만 계산됨)
+        self._rate_n = 0
+        self._exported = set()           # 뷰를 밖으로 내준 버퍼 속성 이름 – 고치기 전에 복사해야 함
+        self._changes = []               # 변경 기록 – _changes_base 버전 이후의 Delta
+        self._changes_base = 0
+        self._change_rows = 0
+        self._blocks = []                # 블록별 해시 (None 은 다시 계산)
+        self._block_dtypes = None
+        self._names_hash = hashlib.blake2b(digest_size=16)
+        self._names_hashed = 0
+
+    def __len__(self):
+        return self._n
+
+    def __repr__(self):
+        return f"TaxDataset(rows={self._n}, capacity={len(self._income)}, version={self.version}, stats={self.stats})"
+
+    @property
+    def capacity(self) -> int:
+        return len(self._income)
+
+    @property
+    def is_partial(self) -> bool:
+        """집계 대상 전체 행 중 일부만 보관 중인지 (대용량 모드)"""
+        return self.stats.count > self._n
+
+    # ------------------------------
+    # 생성
+    # ------------------------------
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "TaxDataset":
+        dataset = cls(capacity=len(df))
+        dataset.extend(df)
+        dataset.show_tax_rate = "tax_rate" in df.columns
+        return dataset
+
+    @classmethod
+    def from_columns(cls, codes, income, tax, categories, stats: TaxStats) -> "TaxDataset":
+        """
+        이미 있는 열 배열을 복사 없이 감싼 데이터셋 (taxdata.store 의 memmap 등)
+        용량 = 행 수이므로 행을 추가하면 그때 새 버퍼로 복사되고 원본 배열은 바뀌지 않는다.
+        """
+        dataset = cls(capacity=0)
+        dataset._codes, dataset._income, dataset._tax = codes, income, tax
+        dataset._exported.update(("_codes", "_income", "_tax"))     # 남의 배열 – 고칠 때는 복사본에
+        dataset._n = len(income)
+        dataset._categories = list(categories)
+        dataset._code_of = {name: code for code, name in enumerate(dataset._categories)}
+        dataset.stats = stats
+        return dataset
+
+    @classmethod
+    def from_ingest(cls, result) -> "TaxDataset":
+        """taxdata.ingest.IngestResult → 데이터셋 (전체 프레임이 없으면 미리보기 + 전체 집계)"""
+        frame = result.frame if result.frame is not None else result.preview
+        dataset = cls.from_frame(frame)
+        dataset.stats = TaxStats().merge(result.stats)
+        return dataset
+
+    # ------------------------------
+    # 내부 버퍼
+    # ------------------------------
+    def _reserve(self, extra: int, income_range=(0, 0), tax_range=(0, 0)) -> None:
+        """
+        extra 행 용량 확보 + 들어올 값 범위(lo, hi)가 담기도록 dtype 을 넓힘
+        둘 중 하나라도 필요한 열만 한 번 복사한다.
+        """
+        needed = self._n + extra
+        grow = needed > self.capacity
+        new_capacity = max(needed, 2 * self.capacity) if grow else self.capacity
+        for attr, dtype in (("_codes", code_dtype(len(self._categories))),
+                            ("_income", int_dtype(*income_range)),
+                            ("_tax", int_dtype(*tax_range))):
+            old = getattr(self, attr)
+            dtype = np.promote_types(old.dtype, dtype)
+            if grow or dtype != old.dtype:
+                new = np.empty(new_capacity, dtype=dtype)
+                new[:self._n] = old[:self._n]
+                setattr(self, attr, new)
+                self._exported.discard(attr)
+
+    def _code(self, name) -> int:
+        code = self._code_of.get(name)
+        if code is None:
+            code = self._code_of[name] = len(self._categories)
+            self._categories.append(name)
+            self._category_index = None
+        return code
+
+    def _encode(self, names) -> np.ndarray:
+        codes, uniques = pd.factorize(pd.Series(names), use_na_sentinel=True)
+        if (codes < 0).any():
+            raise ValueError("name 컬럼에 빈 값이 있습니다.")
+        mapping = np.fromiter((self._code(u) for u in uniques), dtype=np.int32, count=len(uniques))
+        return mapping[codes]
+
+    def _rows(self, index) -> tuple:
+        """(codes, income, tax) 의 해당 행 복사본 – 변경 기록용"""
+        return tuple(np.array(column[index]) for column in (self._codes, self._income, self._tax))
+
+    def _writable(self, attr: str) -> np.ndarray:
+        """제자리에서 고칠 수 있는 버퍼 – 밖으로 내준 버퍼면 이번에 한 번만 새 버퍼로 복사 (copy-on-write)"""
+        buffer = getattr(self, attr)
+        if attr in self._exported:
+            buffer = _copied(buffer, self._rate_n if attr == "_rate" else self._n)
+            setattr(self, attr, buffer)
+            self._exported.discard(attr)
+        return buffer
+
+    def _position(self, row) -> int:
+        row = int(row)
+        if not 0 <= row < self._n:
+            raise IndexError(f"행 번호가 범위를 벗어났습니다: {row} (0 ~ {self._n - 1})")
+        return row
+
+    def _check_editable(self) -> None:
+        if self.is_partial:
+            raise ValueError("대용량 모드(미리보기만 보관) 데이터는 수정·삭제할 수 없습니다.")
+
+    def _invalidate(self, start: int, stop: int = None) -> None:
+        """행 [start, stop) 이 든 블록의 해시를 버림 (stop 이 없으면 그 뒤 블록 전부)"""
+        first = start // BLOCK_ROWS
+        if stop is None:
+            del self._blocks[first:]
+        else:
+            for b in range(first, min(len(self._blocks), -(-stop // BLOCK_ROWS))):
+                self._blocks[b] = None
+
+    def _rescan_extremes(self) -> None:
+        """최고/최저 소득 행을 남은 행에서 다시 구함 – O(n), 그 행이 수정·삭제됐을 때만"""
+        income = self._income[:self._n]
+        if len(income) == 0:
+            return
+        i, j = int(income.argmax()), int(income.argmin())
+        self.stats.income_max, self.stats.income_max_name = int(income[i]), self._categories[self._codes[i]]
+        self.stats.income_min, self.stats.income_min_name = int(income[j]), self._categories[self._codes[j]]
+
+    def _touch(self) -> None:
+        self.version += 1
+        self._frame_cache = None
+        self._fingerprint = None
+
+    def _record(self, kind: str, rows, before=None, after=None) -> None:
+        """버전을 올리고 변경 기록을 남김 – 기록이 상한을 넘으면 오래된 것부터 버린다"""
+        self._touch()
+        if len(rows) > MAX_CHANGE_ROWS:
+            self._changes.clear()
+            self._change_rows = 0
+            self._changes_base = self.version
+            return
+        self._changes.append(Delta(self.version, kind, rows, before, after))
+        self._change_rows += len(rows)
+        while len(self._changes) > MAX_CHANGES or self._change_rows > MAX_CHANGE_ROWS:
+            dropped = self._changes.pop(0)
+            self._change_rows -= len(dropped.rows)
+            self._changes_base = dropped.version
+
+    def changes_since(self, version: int) -> Optional[list]:
+        """
+        version 이후의 변경 목록 (오래된 순, 같은 버전이면 빈 목록)
+        기록이 남아 있지 않으면 None – 파생 결과를 처음부터 다시 만들어야 한다.
+        """
+        if version == self.version:
+            return []
+        if not self._changes_base <= version < self.version:
+            return None
+        return [delta for delta in self._changes if delta.version > version]
+
+    # ------------------------------
+    # 변경
+    # ------------------------------
+    def append(self, name, income: int, tax: int) -> None:
+        """행 하나 추가 – 분할 상환 O(1), 집계도 O(1) 갱신"""
+        code = self._code(name)
+        self._reserve(1, (income, income), (tax, tax))
+        i = self._n
+        self._codes[i] = code
+        self._income[i] = income
+        self._tax[i] = tax
+        self._n += 1
+        self.stats.add_row(name, int(income), int(tax))
+        self._invalidate(i, i + 1)
+        self._record(APPEND, range(i, i + 1), after=self._rows(slice(i, i + 1)))
+
+    def extend(self, df: pd.DataFrame) -> None:
+        """DataFrame 의 name / income / tax 를 뒤에 이어 붙임 (열 단위 복사 1회)"""
+        k = len(df)
+        if k == 0:
+            return
+        codes = self._encode(df["name"])
+        income, tax = df["income"].to_numpy(), df["tax"].to_numpy()
+        self._reserve(k, value_range(income), value_range(tax))
+        n = self._n
+        self._codes[n:n + k] = codes
+        self._income[n:n + k] = income
+        self._tax[n:n + k] = tax
+        self._n += k
+        self.stats.update(df)
+        self._invalidate(n, n + k)
+        self._record(APPEND, range(n, n + k), after=self._rows(slice(n, n + k)) if k <= MAX_CHANGE_ROWS else None)
+
+    def update(self, row: int, name=None, income: int = None, tax: int = None) -> None:
+        """
+        행 하나 수정 (None 인 값은 그대로) – 바뀐 칸만 제자리에서 고친다 (버퍼를 밖으로 내준 뒤면 처음 한 번 복사)
+        집계·세율·fingerprint 는 그 행만 다시 계산한다 (최고/최저 소득 행이 바뀔 때만 최고/최저를 다시 구함).
+        """
+        self._check_editable()
+        row = self._position(row)
+        before = self._rows([row])
+        old = tuple(int(column[0]) for column in before)
+        code = old[0] if name is None else self._code(name)
+        new = (code, old[1] if income is None else int(income), old[2] if tax is None else int(tax))
+        if new == old:
+            return
+        self._reserve(0, (new[1], new[1]), (new[2], new[2]))
+        for attr, value in zip(("_codes", "_income", "_tax"), new):
+            if getattr(self, attr)[row] != value:
+                self._writable(attr)[row] = value
+        if self._rate is not None and row < self._rate_n and new[1:] != old[1:]:
+            self._writable("_rate")[row] = _rates(self._income[row:row + 1], self._tax[row:row + 1])[0]
+
+        stale = self.stats.remove_rows(before[1], before[2])
+        tie = new[1] in (self.stats.income_max, self.stats.income_min)
+        self.stats.add_row(self._categories[code], new[1], new[2])
+        if stale or tie:
+            self._rescan_extremes()
+        self._invalidate(row, row + 1)
+        self._record(UPDATE, np.array([row]), before=before, after=self._rows([row]))
+
+    def delete(self, rows) -> None:
+        """행 삭제 (행 위치 하나 또는 목록) – 열마다 한 번 복사하면서 값 범위에 맞게 dtype 도 다시 줄인다"""
+        self._check_editable()
+        rows = np.unique(np.asarray(rows, dtype=np.intp).reshape(-1))
+        if rows.size == 0:
+            return
+        self._position(rows[0])
+        self._position(rows[-1])
+        n = self._n
+        before = self._rows(rows)
+        for attr in ("_codes", "_income", "_tax"):
+            old = getattr(self, attr)
+            kept = np.delete(old[:n], rows)
+            dtype = old.dtype if attr == "_codes" else int_dtype(*value_range(kept))
+            new = np.empty(len(old), dtype=dtype)
+            new[:len(kept)] = kept
+            setattr(self, attr, new)
+            self._exported.discard(attr)
+        self._n = n - len(rows)
+        if self._rate is not None:
+            kept = np.delete(self._rate[:self._rate_n], rows[rows < self._rate_n])
+            self._rate = np.empty(len(self._rate), dtype=np.float64)
+            self._rate[:len(kept)] = kept
+            self._rate_n = len(kept)
+            self._exported.discard("_rate")
+
+        if self.stats.remove_rows(before[1], before[2]):
+            self._rescan_extremes()
+        self._invalidate(int(rows[0]))
+        self._record(DELETE, rows, before=before)
+
+    def enable_tax_rate(self) -> None:
+        """세율(tax_rate) 파생 컬럼 표시 – 내용은 그대로이므로 버전·fingerprint 는 유지"""
+        if not self.show_tax_rate:
+            self.show_tax_rate = True
+            self._frame_cache = None
+
+    # ------------------------------
+    # 조회
+    # ------------------------------
+    # 아래 열 뷰는 버퍼를 그대로 가리키므로, 내준 뒤 수정하면 그 열은 한 번 복사된다 (이전 뷰는 그대로 유지)
+    @property
+    def income(self) -> np.ndarray:
+        self._exported.add("_income")
+        return self._income[:self._n]
+
+    @property
+    def tax(self) -> np.ndarray:
+        self._exported.add("_tax")
+        return self._tax[:self._n]
+
+    @property
+    def name_codes(self) -> np.ndarray:
+        self._exported.add("_codes")
+        return self._codes[:self._n]
+
+    @property
+    def categories(self) -> list:
+        return self._categories
+
+    def rows_of(self, name) -> np.ndarray:
+        """해당 이름의 행 위치 (없으면 빈 배열)"""
+        code = self._code_of.get(name)
+        if code is None:
+            return np.empty(0, dtype=np.intp)
+        return np.flatnonzero(self._codes[:self._n] == code)
+
+    def tax_rate(self) -> np.ndarray:
+        """세율(%) = tax / income * 100, 소수 둘째 자리 반올림 – 처음 한 번 전체, 이후에는 새 행만 계산"""
+        n = self._n
+        if self._rate is None or len(self._rate) < n:
+            rate = np.empty(self.capacity, dtype=np.float64)
+            if self._rate is not None:
+                rate[:self._rate_n] = self._rate[:self._rate_n]
+            self._rate = rate
+            self._exported.discard("_rate")
+        if self._rate_n < n:
+            start = self._rate_n
+            self._rate[start:n] = _rates(self._income[start:n], self._tax[start:n])
+            self._rate_n = n
+        self._exported.add("_rate")
+        return self._rate[:n]
+
+    def fingerprint(self) -> str:
+        """
+        데이터 내용 해시 – 같은 내용이면 세션이 달라도 같은 값 (버전별 1회 계산)
+        범주 이름은 이어서 해시하고 행은 블록별 해시를 보관하므로, 행 하나 추가·수정 후에는 그 블록만 다시 해시한다.
+        """
+        if self._fingerprint is None:
+            for name in self._categories[self._names_hashed:]:
+                self._names_hash.update(str(name).encode("utf-8") + b"\x1f")
+            self._names_hashed = len(self._categories)
+            columns = (self._codes[:self._n], self._income[:self._n], self._tax[:self._n])
+            dtypes = tuple(column.dtype.str for column in columns)
+            if dtypes != self._block_dtypes:        # dtype 이 바뀌면 바이트가 달라지므로 전부 다시
+                self._blocks, self._block_dtypes = [], dtypes
+            n_blocks = -(-self._n // BLOCK_ROWS)
+            del self._blocks[n_blocks:]
+            self._blocks.extend([None] * (n_blocks - len(self._blocks)))
+
+            h = hashlib.blake2b(digest_size=16)
+            h.update(self._names_hash.digest())
+            h.update("|".join(dtypes).encode())
+            h.update(self._n.to_bytes(8, "little"))
+            for b, digest in enumerate(self._blocks):
+                if digest is None:
+                    block = hashlib.blake2b(digest_size=16)
+                    for column in columns:
+                        block.update(np.ascontiguousarray(column[b * BLOCK_ROWS:(b + 1) * BLOCK_ROWS]).data)
+                    digest = self._blocks[b] = block.digest()
+                h.update(digest)
+            self._fingerprint = h.hexdigest()
+        return self._fingerprint
+
+    def frame(self) -> pd.DataFrame:
+        """현재 데이터를 DataFrame 으로 (같은 버전이면 캐시 재사용)"""
+        if self._frame_cache is None:
+            n = self._n
+            if self._category_index is None:
+                self._category_index = pd.Index(self._categories)
+            self._exported.update(("_codes", "_income", "_tax"))
+            columns = {
+                "name": pd.Categorical.from_codes(self._codes[:n], categories=self._category_index),
+                "income": self._income[:n],
+                "tax": self._tax[:n],
+            }
+            if self.show_tax_rate:
+                columns["tax_rate"] = self.tax_rate()
+            self._frame_cache = pd.DataFrame(columns, copy=False)
+        return self._frame_cache
+
+    def memory_usage(self) -> dict:
+        """
+        이 데이터셋이 차지하는 바이트
+        columns: 열 버퍼 (용량 기준, 저장소 memmap 은 제외) · names: 범주 문자열 (목록 + frame 용 Index)
+        derived: 버퍼 밖 파생 데이터 (세율 버퍼 + 변경 기록)
+        shared: 저장소 memmap 처럼 여러 세션이 함께 쓰는 바이트 · total: 세션 몫 합계
+        """
+        buffers = (self._codes, self._income, self._tax)
+        own = sum(b.nbytes for b in buffers if not is_shared(b))
+        shared = sum(b.nbytes for b in buffers if is_shared(b))
+        names = strings_nbytes(self._categories)
+        if self._category_index is not None:
+            names += self._category_index.memory_usage(deep=True)
+        derived = self._rate.nbytes if self._rate is not None else 0
+        derived += sum(sum(a.nbytes for a in rows) for delta in self._changes
+                       for rows in (delta.before, delta.after) if rows is not None)
+        return {"columns": own, "names": names, "derived": derived, "shared": shared,
+                "total": own + names + derived,
+                "dtypes": {"name": str(self._codes.dtype), "income": str(self._income.dtype),
+                           "tax": str(self._tax.dtype)}}
@@ -0,0 +1,159 @@
+# taxdata/export.py
+# 데이터 내보내기 – CSV / Excel / Parquet / Arrow(IPC) 를 청크 단위로 파일 객체에 쓴다.
+#
+# 전체 데이터를 한 번에 문자열·워크북 객체로 만들지 않는다.
+#   - CSV: 청크별 to_csv 결과를 이어 쓴다 (엑셀 호환용 BOM 포함)
+#   - Excel: xlsxwriter(constant_memory) 가 있으면 행 단위로 바로 기록, 없으면 openpyxl write_only
+#   - Parquet / Arrow: pyarrow 로 열 단위 기록
+# tax_app.py 는 다운로드 버튼을 누를 때만 export_bytes() 를 호출하고 결과를 데이터 버전별로 캐시한다.
+# export_bytes() 는 완성된 파일 전체를 bytes 로 돌려주므로(다운로드 버튼 입력) 파일 크기만큼은 메모리에 남는다.
+# 메모리에 올리지 않고 내보내려면 write_export() 에 경로를 준다. (benchmarks/bench_export.py 는 앱 경로를 잰다)
+# Excel 셀에 쓸 수 없는 ±inf(소득 0·세금 > 0 인 세율)는 문자열 "inf"/"-inf", NaN 은 빈 셀로 쓴다.
+
+import math
+from io import BytesIO
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from .perf import timed
+
+DEFAULT_CHUNKSIZE = 100_000
+EXCEL_MAX_ROWS = 1_048_576          # 머리글 포함
+EXCEL_SHEET_NAME = "데이터"
+
+
+class ExportFormat(NamedTuple):
+    label: str
+    extension: str
+    mime: str
+
+
+EXPORT_FORMATS = {
+    "csv": ExportFormat("📄 CSV 다운로드", ".csv", "text/csv"),
+    "xlsx": ExportFormat("📊 Excel 다운로드", ".xlsx",
+                         "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "parquet": ExportFormat("🧱 Parquet 다운로드", ".parquet", "application/vnd.apache.parquet"),
+    "arrow": ExportFormat("🏹 Arrow 다운로드", ".arrow", "application/vnd.apache.arrow.file"),
+}
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError("Parquet / Arrow 파일로 저장하려면 pyarrow 가 필요합니다: pip install pyarrow") from None
+
+
+def excel_engine() -> str:
+    """사용할 Excel 엔진 – xlsxwriter 가 설치되어 있으면 우선"""
+    try:
+        import xlsxwriter  # noqa: F401
+        return "xlsxwriter"
+    except ImportError:
+        return "openpyxl"
+
+
+def _cell(value):
+    """Excel 셀에 쓸 수 없는 값 변환 – NaN → None(빈 셀), ±inf → 문자열 "inf"/"-inf" (이전 내보내기와 같음)"""
+    if pd.isna(value):
+        return None
+    if value in (math.inf, -math.inf):
+        return str(value)
+    return value
+
+
+def _iter_rows(df: pd.DataFrame, chunksize: int):
+    """행 단위 Python 값 (NaN → None, ±inf → 문자열, 범주 → 문자열)"""
+    for start in range(0, len(df), chunksize):
+        chunk = df.iloc[start:start + chunksize]
+        columns = []
+        for _, column in chunk.items():
+            values = column.tolist()
+            if column.dtype.kind == "f":
+                if not np.isfinite(column.to_numpy("float64", na_value=np.nan)).all():     # 소득 0·세금 > 0 이면 세율이 inf
+                    values = [_cell(v) for v in values]
+            elif column.hasnans:
+                values = [None if pd.isna(v) else v for v in values]
+            columns.append(values)
+        yield from zip(*columns)
+
+
+# ------------------------------
+# 형식별 기록
+# ------------------------------
+def write_csv(df: pd.DataFrame, out, chunksize: int = DEFAULT_CHUNKSIZE) -> None:
+    out.write(b"\xef\xbb\xbf")  # UTF-8 BOM (엑셀 한글 깨짐 방지)
+    out.write(df.iloc[:0].to_csv(index=False).encode("utf-8"))
+    for start in range(0, len(df), chunksize):
+        out.write(df.iloc[start:start + chunksize].to_csv(index=False, header=False).encode("utf-8"))
+
+
+def write_excel(df: pd.DataFrame, out, engine: str = None, chunksize: int = DEFAULT_CHUNKSIZE) -> None:
+    if len(df) + 1 > EXCEL_MAX_ROWS:
+        raise ValueError(f"Excel 은 최대 {EXCEL_MAX_ROWS - 1:,}행까지 저장할 수 있습니다. (현재 {len(df):,}행)")
+    engine = engine or excel_engine()
+    header = [str(c) for c in df.columns]
+    if engine == "xlsxwriter":
+        import xlsxwriter
+
+        workbook = xlsxwriter.Workbook(out, {"constant_memory": True})
+        sheet = workbook.add_worksheet(EXCEL_SHEET_NAME)
+        sheet.write_row(0, 0, header)
+        for r, row in enumerate(_iter_rows(df, chunksize), start=1):
+            sheet.write_row(r, 0, row)
+        workbook.close()
+    elif engine == "openpyxl":
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(EXCEL_SHEET_NAME)
+        sheet.append(header)
+        for row in _iter_rows(df, chunksize):
+            sheet.append(row)
+        workbook.save(out)
+    else:
+        raise ValueError(f"지원하지 않는 Excel 엔진입니다: {engine}")
+
+
+def write_parquet(df: pd.DataFrame, out, chunksize: int = DEFAULT_CHUNKSIZE) -> None:
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(table, out, row_group_size=chunksize)
+
+
+def write_arrow(df: pd.DataFrame, out, chunksize: int = DEFAULT_CHUNKSIZE) -> None:
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with ipc.new_file(out, table.schema) as writer:
+        writer.write_table(table, max_chunksize=chunksize)
+
+
+_WRITERS = {"csv": write_csv, "xlsx": write_excel, "parquet": write_parquet, "arrow": write_arrow}
+
+
+@timed("export.write")
+def write_export(df: pd.DataFrame, fmt: str, out, **kwargs) -> None:
+    """df 를 fmt 형식으로 out(바이너리 파일 객체 또는 경로)에 기록"""
+    try:
+        writer = _WRITERS[fmt]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt} (가능: {', '.join(_WRITERS)})") from None
+    if isinstance(out, (str, bytes)) or hasattr(out, "__fspath__"):
+        with open(out, "wb") as f:
+            writer(df, f, **kwargs)
+    else:
+        writer(df, out, **kwargs)
+
+
+def export_bytes(df: pd.DataFrame, fmt: str, **kwargs) -> bytes:
+    buffer = BytesIO()
+    write_export(df, fmt, buffer, **kwargs)
+    return buffer.getvalue()
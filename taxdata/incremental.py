@@ -0,0 +1,53 @@
+# taxdata/incremental.py
+# 파생 결과 증분 갱신 – 데이터셋 변경 기록(Delta)으로 이전 버전의 결과를 고쳐 새 버전 결과를 만든다.
+#
+#   derived = IncrementalCache()                                  # 세션마다 하나 (tax_app.py 는 session_state)
+#   index = derived.get("index", dataset, DatasetIndex, DatasetIndex.updated)
+#
+# 키마다 마지막으로 만든 (데이터셋, 버전, 결과) 하나만 기억한다. 같은 데이터셋의 새 버전을 요청하면
+# dataset.changes_since(그 버전) 의 변경분만 update(결과, dataset, deltas) 로 반영하고,
+# 기록이 끊겼거나(변경이 너무 큼) 다른 데이터셋이면 build(dataset) 로 새로 만든다.
+# update 는 이전 결과를 고치지 않고 새 객체를 돌려줘야 한다 – 이전 결과는 DerivedCache 를 통해
+# 같은 내용을 보는 다른 세션과 공유될 수 있다.
+
+import weakref
+from collections import OrderedDict
+from typing import Callable
+
+DEFAULT_MAX_ENTRIES = 16
+
+
+class IncrementalCache:
+    """키별 마지막 파생 결과 (데이터셋은 약한 참조 – 교체된 데이터셋을 붙잡지 않음)"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = int(max_entries)
+        self._items = OrderedDict()      # key → (weakref(dataset), version, value)
+        self.builds = 0
+        self.updates = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return f"IncrementalCache(entries={len(self)}, builds={self.builds}, updates={self.updates})"
+
+    def get(self, key, dataset, build: Callable, update: Callable):
+        """dataset 현재 버전의 결과 – 가능하면 이전 결과 + 변경분, 아니면 새로 만듦"""
+        item = self._items.get(key)
+        deltas = None
+        if item is not None and item[0]() is dataset:
+            deltas = dataset.changes_since(item[1])
+        if deltas is None:
+            value = build(dataset)
+            self.builds += 1
+        elif deltas:
+            value = update(item[2], dataset, deltas)
+            self.updates += 1
+        else:
+            value = item[2]
+        self._items[key] = (weakref.ref(dataset), dataset.version, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_entries:
+            self._items.popitem(last=False)
+        return value
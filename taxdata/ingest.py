@@ -0,0 +1,369 @@
+# taxdata/ingest.py
+# 업로드 파일 스트리밍 수집 – CSV 는 청크 단위 read_csv, Parquet / Arrow(IPC·Feather)는 레코드 배치 단위로 읽는다.
+#
+# 청크마다 스키마(name: category, income/tax: int64)를 맞추고 누적 집계(TaxStats)를 갱신하므로
+# 전체 DataFrame 을 만들지 않고도 총계·평균·최고/최저 소득자를 얻을 수 있다.
+#
+# 여러 파일(zip 안의 파일 포함)은 ingest_many 가 스레드 풀에서 동시에 읽고, 청크를 작은 큐로 받아
+# 파일 순서대로 sink 에 흘려 합친다 (파일 하나를 통째로 메모리에 올리지 않음).
+# 파일마다 스키마를 검사·변환하고 행 수·읽기 시간·오류를 FileReport 로 남긴다 (오류 파일은 건너뜀).
+
+import os
+import queue
+import threading
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, NamedTuple, Optional
+
+import pandas as pd
+
+from .perf import section, timed
+from .stats import TaxStats
+
+COLUMNS = ("name", "income", "tax")
+CSV_DTYPES = {"name": "category", "income": "int64", "tax": "int64"}
+DEFAULT_CHUNKSIZE = 200_000
+DEFAULT_PREVIEW_ROWS = 1_000
+MAX_QUEUED_CHUNKS = 2           # ingest_many: 파일마다 작업 스레드가 앞서 읽어 둘 수 있는 청크 수
+
+# 컬럼 이름 별칭 (앞뒤 공백·대소문자 무시) → 표준 이름
+COLUMN_ALIASES = {
+    "이름": "name", "성명": "name",
+    "소득": "income", "소득액": "income",
+    "세금": "tax", "세액": "tax",
+}
+
+# 확장자 → 형식
+FORMATS = {
+    ".csv": "csv", ".txt": "csv",
+    ".parquet": "parquet", ".pq": "parquet",
+    ".arrow": "arrow", ".feather": "arrow", ".ipc": "arrow",
+}
+
+
+class FileReport(NamedTuple):
+    name: str                       # 파일 이름 (zip 안이면 "묶음.zip/파일.csv")
+    rows: int
+    chunks: int
+    seconds: float                  # 읽기·검사·집계 시간 (작업 스레드 기준)
+    error: Optional[str] = None     # 오류가 있으면 메시지 (그 파일은 합치지 않음)
+
+
+class IngestResult(NamedTuple):
+    stats: TaxStats                 # 전체 데이터 누적 집계
+    preview: pd.DataFrame           # 앞부분 미리보기 (최대 preview_rows 행)
+    frame: Optional[pd.DataFrame]   # materialize=True 일 때만 전체 데이터
+    chunks: int                     # 읽은 청크 수
+    files: tuple = ()               # ingest_many: 파일별 FileReport
+
+
+def detect_format(source, fmt: Optional[str] = None) -> str:
+    """파일 이름(또는 Streamlit UploadedFile.name)의 확장자로 형식 판별"""
+    if fmt:
+        return fmt
+    name = getattr(source, "name", source if isinstance(source, (str, os.PathLike)) else "")
+    ext = os.path.splitext(str(name))[1].lower()
+    try:
+        return FORMATS[ext]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {ext or '(확장자 없음)'} – CSV, Parquet, Arrow 만 가능합니다.") from None
+
+
+def canonical_column(column) -> str:
+    """컬럼 이름 표준화 – 공백·대소문자 무시, 한글 별칭(COLUMN_ALIASES) 허용"""
+    key = str(column).strip().lower()
+    return COLUMN_ALIASES.get(key, key)
+
+
+def _source_columns(names) -> dict:
+    """원래 컬럼 이름 → 표준 이름 (필수 컬럼만, 없으면 ValueError)"""
+    mapping = {}
+    for name in names:
+        canonical = canonical_column(name)
+        if canonical in COLUMNS and canonical not in mapping.values():
+            mapping[name] = canonical
+    missing = [c for c in COLUMNS if c not in mapping.values()]
+    if missing:
+        raise ValueError(f"필수 컬럼이 없습니다: {', '.join(missing)}")
+    return mapping
+
+
+def coerce_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+    """필수 컬럼 확인 후 name / income / tax 를 표준 dtype 으로 맞춤 (정수가 아닌 금액·빈 값은 ValueError)"""
+    if any(c not in chunk.columns for c in COLUMNS):
+        chunk = chunk.rename(columns=_source_columns(chunk.columns))
+    chunk = chunk.loc[:, list(COLUMNS)]
+    if chunk["name"].isna().any():
+        raise ValueError("name 컬럼에 빈 값이 있습니다.")
+    for column in ("income", "tax"):
+        values = chunk[column]
+        if values.dtype.kind == "f" and not (values.notna().all() and (values % 1 == 0).all()):
+            raise ValueError(f"{column} 컬럼에 비어 있거나 정수가 아닌 값이 있습니다.")
+    return chunk.astype(CSV_DTYPES)
+
+
+# ------------------------------
+# 형식별 청크 읽기
+# ------------------------------
+def _iter_csv(source, chunksize: int) -> Iterator[pd.DataFrame]:
+    # 표준 이름이면 dtype 지정으로 바로 파싱, 별칭 컬럼은 coerce_chunk 에서 이름·dtype 을 맞춘다
+    reader = pd.read_csv(source, usecols=lambda c: canonical_column(c) in COLUMNS, dtype=CSV_DTYPES,
+                         thousands=",", chunksize=chunksize)
+    try:
+        with reader:
+            yield from reader
+    except ValueError as e:
+        raise ValueError(f"CSV 값을 읽을 수 없습니다 (income / tax 는 정수여야 합니다): {e}") from e
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError("Parquet / Arrow 파일을 읽으려면 pyarrow 가 필요합니다: pip install pyarrow") from None
+
+
+def _iter_parquet(source, chunksize: int) -> Iterator[pd.DataFrame]:
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    pf = pq.ParquetFile(source)
+    columns = _source_columns(pf.schema_arrow.names)
+    for batch in pf.iter_batches(batch_size=chunksize, columns=list(columns)):
+        yield batch.to_pandas().rename(columns=columns)
+
+
+def _iter_arrow(source, chunksize: int) -> Iterator[pd.DataFrame]:
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    if hasattr(source, "read") and not hasattr(source, "fileno"):
+        source = pa.BufferReader(source.read())
+    try:
+        reader = ipc.open_file(source)
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    except pa.ArrowInvalid:
+        if hasattr(source, "seek"):
+            source.seek(0)
+        batches = iter(ipc.open_stream(source))
+    for batch in batches:
+        columns = _source_columns(batch.schema.names)
+        for start in range(0, batch.num_rows, chunksize):
+            yield batch.slice(start, chunksize).select(list(columns)).to_pandas().rename(columns=columns)
+
+
+_READERS = {"csv": _iter_csv, "parquet": _iter_parquet, "arrow": _iter_arrow}
+
+
+def iter_chunks(source, fmt: Optional[str] = None, chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """스키마가 맞춰진 DataFrame 청크를 차례로 반환"""
+    for chunk in _READERS[detect_format(source, fmt)](source, chunksize):
+        yield coerce_chunk(chunk)
+
+
+# ------------------------------
+# 수집
+# ------------------------------
+def concat_chunks(chunks) -> pd.DataFrame:
+    """청크 결합 – 청크마다 다른 name 범주를 합쳐 category dtype 을 유지"""
+    chunks = list(chunks)
+    if not chunks:
+        return pd.DataFrame({c: pd.Series(dtype=CSV_DTYPES[c]) for c in COLUMNS})
+    names = pd.api.types.union_categoricals([c["name"] for c in chunks], ignore_order=True)
+    frame = pd.concat([c.drop(columns="name") for c in chunks], ignore_index=True)
+    frame.insert(0, "name", names)
+    return frame
+
+
+class _Collector:
+    """청크를 받아 sink 로 넘기고 전체 프레임(materialize) 또는 미리보기만 남김 – ingest / ingest_many 공용"""
+
+    def __init__(self, materialize: bool, preview_rows: int, sink=None):
+        self.materialize = materialize
+        self.preview_rows = preview_rows
+        self.sink = sink
+        self.kept = []
+        self.preview_left = preview_rows
+        self.chunks = 0
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        self.chunks += 1
+        if self.sink is not None:
+            with section("ingest.sink"):
+                self.sink(chunk)
+        if self.materialize:
+            self.kept.append(chunk)
+        elif self.preview_left > 0:
+            self.kept.append(chunk.iloc[:self.preview_left])
+            self.preview_left -= len(self.kept[-1])
+
+    def result(self, stats: TaxStats, files: tuple = ()) -> IngestResult:
+        with section("ingest.concat"):
+            frame = concat_chunks(self.kept)
+        if self.materialize:
+            return IngestResult(stats, frame.iloc[:self.preview_rows], frame, self.chunks, files)
+        return IngestResult(stats, frame, None, self.chunks, files)
+
+
+@timed("ingest")
+def ingest(source, fmt: Optional[str] = None, chunksize: int = DEFAULT_CHUNKSIZE,
+           materialize: bool = True, preview_rows: int = DEFAULT_PREVIEW_ROWS,
+           on_chunk=None, sink=None) -> IngestResult:
+    """
+    파일을 청크 단위로 읽으며 집계
+    materialize=False 이면 전체 데이터를 메모리에 모으지 않고 집계와 미리보기만 남긴다.
+    on_chunk(rows_so_far) 은 청크마다 호출된다 (진행 표시용).
+    sink(chunk) 를 주면 청크마다 넘긴다 (예: taxdata.store 의 StoreWriter.write 로 바로 디스크에 저장).
+    """
+    stats = TaxStats()
+    collector = _Collector(materialize, preview_rows, sink)
+    for chunk in iter_chunks(source, fmt, chunksize):
+        with section("ingest.stats"):
+            stats.update(chunk)
+        collector.add(chunk)
+        if on_chunk is not None:
+            on_chunk(stats.count)
+    return collector.result(stats)
+
+
+# ------------------------------
+# 여러 파일 / zip
+# ------------------------------
+def _is_zip(source) -> bool:
+    name = getattr(source, "name", source if isinstance(source, (str, os.PathLike)) else "")
+    return str(name).lower().endswith(".zip")
+
+
+def expand_sources(sources) -> list[tuple]:
+    """업로드 파일 목록 → (이름, 여는 함수) 목록 – zip 은 안의 파일로 펼침 (폴더·숨김 파일 제외)"""
+    entries = []
+    for source in sources:
+        name = os.path.basename(str(getattr(source, "name", source)))
+        if _is_zip(source):
+            archive = zipfile.ZipFile(source)
+            for info in archive.infolist():
+                base = os.path.basename(info.filename)
+                if info.is_dir() or not base or base.startswith(".") or info.filename.startswith("__MACOSX/"):
+                    continue
+                entries.append((f"{name}/{info.filename}", lambda archive=archive, info=info: archive.open(info)))
+        else:
+            entries.append((name, lambda source=source: _rewound(source)))
+    return entries
+
+
+def _rewound(source):
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source
+
+
+class _FileDone(NamedTuple):
+    """작업 스레드가 파일 하나를 끝냈다는 표시 – 큐의 마지막 항목"""
+    report: FileReport
+    stats: TaxStats
+
+
+def _put(out: queue.Queue, item, stop: threading.Event) -> bool:
+    """큐가 빌 때까지 기다려 넣음 – 호출 스레드가 중단(stop)하면 False"""
+    while not stop.is_set():
+        try:
+            out.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _read_file(name: str, open_source, chunksize: int, out: queue.Queue, stop: threading.Event) -> None:
+    """작업 스레드: 파일 하나를 청크 단위로 읽어 out 에 넣고, 끝나면 _FileDone – 오류는 보고서에 담음"""
+    started = time.perf_counter()
+    stats = TaxStats()
+    chunks = 0
+    error = None
+    try:
+        source = open_source()
+        fmt = detect_format(name)
+        for chunk in iter_chunks(source, fmt, chunksize):
+            stats.update(chunk)
+            if not _put(out, chunk, stop):
+                return
+            chunks += 1
+    except Exception as e:          # 파일 하나의 오류는 그 파일만 건너뛰고 보고
+        stats, error = TaxStats(), str(e) or type(e).__name__
+    report = FileReport(name, stats.count, chunks, time.perf_counter() - started, error)
+    _put(out, _FileDone(report, stats), stop)
+
+
+@timed("ingest.many")
+def ingest_many(sources, chunksize: int = DEFAULT_CHUNKSIZE, materialize: bool = True,
+                preview_rows: int = DEFAULT_PREVIEW_ROWS, on_file=None, sink=None,
+                max_workers: Optional[int] = None) -> IngestResult:
+    """
+    여러 파일(zip 포함)을 동시에 읽어 하나로 합침 – 결과 순서는 파일 순서 (zip 은 안의 순서)
+    작업 스레드가 파일을 청크 단위로 읽고 검사·집계해 파일별 큐(최대 MAX_QUEUED_CHUNKS 청크)에 넣으면,
+    호출 스레드는 앞 파일부터 순서대로 청크를 꺼내 바로 sink / 미리보기로 넘긴다.
+    작업 중인 파일은 작업 스레드 수까지이고 큐가 차면 작업 스레드가 기다리므로, 메모리에 올라가는 청크는
+    파일 크기·개수와 무관하게 작업 스레드 수 × (MAX_QUEUED_CHUNKS + 1) 개 이하다 (materialize=True 의 결과 제외).
+    오류 파일은 건너뛰고 보고서에 남긴다. 단, 이미 청크 일부를 넘긴 뒤 오류가 나면 되돌릴 수 없으므로 ValueError.
+    on_file(report, done, total) 은 파일을 합칠 때마다 호출된다 (진행 표시용).
+    """
+    entries = expand_sources(sources)
+    workers = max(1, min(len(entries), max_workers or os.cpu_count() or 1))
+    stats = TaxStats()
+    collector = _Collector(materialize, preview_rows, sink)
+    reports = []
+    remaining = iter(entries)
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingest") as pool:
+        pending = deque()           # (파일 이름, 큐) – 파일 순서
+
+        def submit_next():
+            entry = next(remaining, None)
+            if entry is not None:
+                out = queue.Queue(maxsize=MAX_QUEUED_CHUNKS)
+                pool.submit(_read_file, *entry, chunksize, out, stop)
+                pending.append((entry[0], out))
+
+        try:
+            for _ in range(workers):
+                submit_next()
+            while pending:
+                name, out = pending[0]
+                merged = 0
+                while True:
+                    item = out.get()
+                    if isinstance(item, _FileDone):
+                        break
+                    with section("ingest.merge"):
+                        collector.add(item)
+                    merged += len(item)
+                    del item
+                report, file_stats = item
+                if report.error is not None and merged:
+                    raise ValueError(f"{name} 파일을 읽다가 오류가 나 합치기를 중단했습니다 "
+                                     f"({merged:,}행은 이미 넘김): {report.error}")
+                pending.popleft()
+                submit_next()
+                stats.merge(file_stats)
+                reports.append(report)
+                if on_file is not None:
+                    on_file(report, len(reports), len(entries))
+        finally:
+            stop.set()              # 중단 시 큐를 기다리는 작업 스레드를 풀어 줌
+    return collector.result(stats, tuple(reports))
+
+
+# ------------------------------
+# 페이지 단위 미리보기
+# ------------------------------
+def page_count(n_rows: int, page_size: int) -> int:
+    return max(1, -(-n_rows // page_size))
+
+
+def paginate(df: pd.DataFrame, page: int, page_size: int) -> pd.DataFrame:
+    """1부터 시작하는 page 번째 구간만 잘라 반환 (복사 없는 iloc 슬라이스)"""
+    start = (max(page, 1) - 1) * page_size
+    return df.iloc[start:start + page_size]
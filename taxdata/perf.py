@@ -0,0 +1,348 @@
+# taxdata/perf.py
+# 구간별 실행 시간·메모리 계측 – tax_app.py "성능" 패널과 JSON-lines 로그용
+#
+#   recorder = Recorder(log_path="perf_log.jsonl")
+#   recorder.begin_run(profile=False, trace_memory=True, page="4️⃣ 통계 분석")
+#   with section("chart.build"):              # 또는 @timed("ingest") 데코레이터
+#       ...
+#   report = recorder.end_run()               # RunReport + 로그 한 줄 기록
+#   with recorder.event("export.xlsx"): …     # 실행 밖(다른 스레드)에서 일어나는 작업은 단독 이벤트로 기록
+#
+#   python -m taxdata.perf perf_log.jsonl [--page "4️⃣ 통계 분석"]   # 로그의 구간별 p50 / p95 / 최대
+#
+# section / timed 는 현재 스레드에서 begin_run 한 Recorder 에 기록한다 (contextvars).
+# 계측 중인 실행이 없으면 section() 은 미리 만든 빈 컨텍스트를, timed 는 원래 함수 호출만 하므로
+# 추가 비용은 ContextVar 조회 한 번이다.
+#
+# trace_memory=True 이면 tracemalloc 으로 구간별 순증가·최대 할당량을 함께 잰다 (추적 중에는 느려짐).
+# tracemalloc 은 프로세스 전역이므로 여러 세션이 동시에 켜면 값이 섞일 수 있다 – 진단용으로만 쓴다.
+
+import contextvars
+import cProfile
+import functools
+import argparse
+import io
+import json
+import pstats
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from typing import NamedTuple, Optional
+
+_CURRENT = contextvars.ContextVar("taxdata_perf_recorder", default=None)
+_LOG_LOCK = threading.Lock()
+PROFILE_TOP = 25
+ALLOC_TOP = 10
+RECENT_EVENTS = 20
+
+
+class _NullSection:
+    """계측이 꺼져 있을 때의 빈 컨텍스트 (모든 호출이 같은 객체를 공유)"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL = _NullSection()
+
+
+class SectionStats:
+    """구간 하나의 누적값 (같은 이름이 여러 번 실행되면 합산, 최대 할당은 최댓값)"""
+
+    __slots__ = ("name", "calls", "seconds", "alloc_bytes", "peak_bytes")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.seconds = 0.0
+        self.alloc_bytes = 0
+        self.peak_bytes = 0
+
+    def as_dict(self) -> dict:
+        return {"name": self.name, "calls": self.calls, "seconds": round(self.seconds, 6),
+                "alloc_mb": round(self.alloc_bytes / 1024 / 1024, 3),
+                "peak_mb": round(self.peak_bytes / 1024 / 1024, 3)}
+
+
+class RunReport(NamedTuple):
+    started: float                  # 시작 시각 (epoch 초)
+    seconds: float                  # 전체 실행 시간
+    sections: list                  # SectionStats.as_dict() 목록 (시간 내림차순)
+    interrupted: bool               # end_run 전에 다음 실행이 시작됨 (st.rerun 등)
+    meta: dict                      # begin_run(**meta) 로 넘긴 값 (페이지 이름 등)
+    profile: Optional[str] = None   # cProfile 누적 시간 상위 함수 (텍스트)
+    allocations: tuple = ()         # tracemalloc 할당 상위 줄
+
+    def as_record(self) -> dict:
+        record = {"ts": round(self.started, 3), "seconds": round(self.seconds, 6),
+                  "interrupted": self.interrupted, **self.meta, "sections": self.sections}
+        if self.allocations:
+            record["allocations"] = list(self.allocations)
+        return record
+
+
+class _Section:
+    """계측 중인 구간 하나 – 중첩되면 안쪽 구간의 최대 할당을 바깥 구간에도 반영"""
+
+    __slots__ = ("recorder", "name", "t0", "mem0", "child_peak")
+
+    def __init__(self, recorder: "Recorder", name: str):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        rec = self.recorder
+        self.child_peak = 0
+        self.mem0 = None
+        if rec._tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            stack = rec._stack()
+            if stack:                   # 초기화 전까지의 최댓값을 바깥 구간에 넘겨 둠
+                stack[-1].child_peak = max(stack[-1].child_peak, peak)
+            stack.append(self)
+            tracemalloc.reset_peak()
+            self.mem0 = current
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.t0
+        alloc = peak = 0
+        if self.mem0 is not None:
+            current, traced_peak = tracemalloc.get_traced_memory()
+            top = max(traced_peak, self.child_peak)
+            stack = self.recorder._stack()
+            if stack and stack[-1] is self:
+                stack.pop()
+            if stack:
+                stack[-1].child_peak = max(stack[-1].child_peak, top)
+            alloc, peak = current - self.mem0, top - self.mem0
+        self.recorder._add(self.name, elapsed, alloc, peak)
+        return False
+
+
+class Recorder:
+    """
+    세션 하나의 계측기 – begin_run / end_run 사이의 구간 시간을 모으고 실행마다 로그 한 줄을 남긴다
+    log_path 가 None 이면 로그 없이 마지막 보고서(last_report)만 유지한다.
+    """
+
+    def __init__(self, log_path: Optional[str] = None):
+        self.log_path = log_path
+        self.last_report: Optional[RunReport] = None
+        self.events = deque(maxlen=RECENT_EVENTS)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._sections: Optional[dict] = None
+        self._started = 0.0
+        self._t0 = 0.0
+        self._meta = {}
+        self._profiler = None
+        self._tracing = False
+        self._owns_tracemalloc = False
+        self._token = None
+
+    @property
+    def active(self) -> bool:
+        return self._sections is not None
+
+    # ------------------------------
+    # 실행 단위
+    # ------------------------------
+    def begin_run(self, profile: bool = False, trace_memory: bool = False, **meta) -> None:
+        """실행 시작 – 끝나지 않은 이전 실행은 interrupted 로 기록하고 현재 스레드에 연결"""
+        if self.active:
+            self.end_run(interrupted=True)
+        self._sections = {}
+        self._meta = meta
+        self._started = time.time()
+        if trace_memory:
+            self._owns_tracemalloc = not tracemalloc.is_tracing()
+            if self._owns_tracemalloc:
+                tracemalloc.start()
+            self._tracing = True
+        if profile:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self._token = _CURRENT.set(self)
+        self._t0 = time.perf_counter()
+
+    def end_run(self, interrupted: bool = False) -> Optional[RunReport]:
+        """실행 종료 – 보고서를 만들고 로그에 기록 (실행 중이 아니면 None)"""
+        if not self.active:
+            return None
+        elapsed = time.perf_counter() - self._t0
+        profile_text = None
+        if self._profiler is not None:
+            self._profiler.disable()
+            out = io.StringIO()
+            pstats.Stats(self._profiler, stream=out).sort_stats("cumulative").print_stats(PROFILE_TOP)
+            profile_text = out.getvalue()
+            self._profiler = None
+        allocations = ()
+        if self._tracing:
+            snapshot = tracemalloc.take_snapshot()
+            allocations = tuple(str(stat) for stat in snapshot.statistics("lineno")[:ALLOC_TOP])
+            if self._owns_tracemalloc:
+                tracemalloc.stop()
+            self._tracing = self._owns_tracemalloc = False
+        if self._token is not None:
+            try:
+                _CURRENT.reset(self._token)
+            except ValueError:          # 다른 스레드·컨텍스트에서 끝내는 경우 (다음 실행 시작 시 정리)
+                pass
+            self._token = None
+
+        with self._lock:
+            sections = sorted((s.as_dict() for s in self._sections.values()), key=lambda s: -s["seconds"])
+            self._sections = None
+        report = RunReport(self._started, elapsed, sections, interrupted, self._meta, profile_text, allocations)
+        self.last_report = report
+        self._write(report)
+        return report
+
+    def annotate(self, **meta) -> None:
+        """현재 실행 기록에 값 추가 (예: 실행 중에 정해지는 페이지 이름)"""
+        self._meta.update(meta)
+
+    # ------------------------------
+    # 구간 기록
+    # ------------------------------
+    def section(self, name: str):
+        return _Section(self, name) if self.active else _NULL
+
+    def record(self, name: str, seconds: float, alloc_bytes: int = 0) -> None:
+        """밖에서 잰 값을 구간으로 추가 (예: 챗봇 첫 토큰 지연)"""
+        self._add(name, seconds, alloc_bytes, max(alloc_bytes, 0))
+
+    @contextmanager
+    def event(self, name: str, **meta):
+        """실행과 무관한 작업 하나를 재서 events 와 로그에 바로 기록 (어느 스레드에서든 사용 가능)"""
+        started, t0 = time.time(), time.perf_counter()
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            record = {"ts": round(started, 3), "event": name,
+                      "seconds": round(time.perf_counter() - t0, 6), **meta}
+            if error:
+                record["error"] = error
+            self.events.append(record)
+            self._write_line(record)
+
+    def _add(self, name: str, seconds: float, alloc: int, peak: int) -> None:
+        with self._lock:
+            if self._sections is None:      # 실행이 끝난 뒤 도착한 기록 (다른 스레드)
+                return
+            stats = self._sections.get(name)
+            if stats is None:
+                stats = self._sections[name] = SectionStats(name)
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.alloc_bytes += alloc
+            stats.peak_bytes = max(stats.peak_bytes, peak)
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _write(self, report: RunReport) -> None:
+        self._write_line(report.as_record())
+
+    def _write_line(self, record: dict) -> None:
+        if not self.log_path:
+            return
+        line = json.dumps(record, ensure_ascii=False)
+        with _LOG_LOCK, open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+# ------------------------------
+# 계측 지점 (현재 스레드의 Recorder 로 전달)
+# ------------------------------
+def current() -> Optional[Recorder]:
+    return _CURRENT.get()
+
+
+def section(name: str):
+    """with section("이름"): … – 계측 중이 아니면 빈 컨텍스트"""
+    recorder = _CURRENT.get()
+    return _NULL if recorder is None else recorder.section(name)
+
+
+def timed(name: Optional[str] = None):
+    """함수 전체를 구간으로 재는 데코레이터 (이름 생략 시 모듈.함수)"""
+    def decorate(fn):
+        label = name or f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            recorder = _CURRENT.get()
+            if recorder is None or not recorder.active:
+                return fn(*args, **kwargs)
+            with _Section(recorder, label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def read_log(path: str, limit: Optional[int] = None) -> list[dict]:
+    """JSON-lines 로그 읽기 (limit 를 주면 마지막 limit 줄)"""
+    with open(path, encoding="utf-8") as f:
+        lines = f.readlines()
+    if limit is not None:
+        lines = lines[-limit:]
+    return [json.loads(line) for line in lines if line.strip()]
+
+
+def summarize(records, page: Optional[str] = None) -> list[dict]:
+    """로그 기록들의 구간·이벤트별 실행 횟수와 p50 / p95 / 최대 시간 (초), 최대 시간 내림차순"""
+    samples = {}
+    for record in records:
+        if "event" in record:
+            samples.setdefault(record["event"], []).append(record["seconds"])
+            continue
+        if page is not None and record.get("page") != page:
+            continue
+        samples.setdefault("(전체 실행)", []).append(record["seconds"])
+        for s in record.get("sections", ()):
+            samples.setdefault(s["name"], []).append(s["seconds"])
+
+    rows = []
+    for name, values in samples.items():
+        values.sort()
+        rows.append({"name": name, "runs": len(values), "p50": statistics.median(values),
+                     "p95": values[min(len(values) - 1, int(len(values) * 0.95))], "max": values[-1]})
+    return sorted(rows, key=lambda r: -r["max"])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m taxdata.perf", description="성능 로그 요약")
+    parser.add_argument("log")
+    parser.add_argument("--page", help="이 페이지의 실행만")
+    parser.add_argument("--last", type=int, help="마지막 N 줄만")
+    args = parser.parse_args(argv)
+
+    rows = summarize(read_log(args.log, args.last), args.page)
+    print(f"{'구간':<28} {'횟수':>6} {'p50 ms':>10} {'p95 ms':>10} {'최대 ms':>10}")
+    for r in rows:
+        print(f"{r['name']:<28} {r['runs']:>6} {r['p50'] * 1000:>10.1f} {r['p95'] * 1000:>10.1f} {r['max'] * 1000:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+# taxdata/query.py
+# 데이터 조회 엔진 – 정렬 인덱스(소득·세금)와 이름 해시 인덱스로 필터·정렬·순위 질의를 처리한다.
+#
+#   index = DatasetIndex(dataset)                     # 데이터 버전별 1회 O(n log n), 세션 사이 공유 가능
+#   index.count("income", lo=5000)                    # 소득 5000 이상 인원 – O(log n)
+#   index.top_k("income", 10)                         # 소득 상위 10명의 행 위치 – O(k log k)
+#   index.percentile("tax", 90)                       # 세금 90% 분위수 – O(1) (np.percentile 과 같은 선형 보간)
+#   result = index.query(Filter(income_min=5000, names=("Kim",)), sort_by="tax", descending=True)
+#   result.page(dataset, 1, 50)                       # 보이는 페이지 행만 DataFrame 으로
+#
+# 질의 결과는 행 위치 배열(또는 정렬 인덱스의 슬라이스 뷰)만 들고, 화면에는 페이지 단위로만 행을 꺼낸다.
+# 조건 하나 + 그 열로 정렬(또는 정렬 없음)이면 정렬 인덱스의 뷰라서 O(log n)이며 복사가 없다.
+# 조건이 여럿이면 가장 좁은 조건(개수는 O(log n)로 계산)으로 후보를 뽑고 나머지 조건은 후보에만 적용한다.
+#
+# 데이터가 바뀌면 index.updated(dataset, dataset.changes_since(index_version)) 로 변경 행만 반영한다
+# – 다시 정렬하지 않고 삽입·삭제 위치만 이진 탐색으로 찾는다 (배열 이동은 memmove 한 번).
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from .dataset import APPEND, DELETE, UPDATE
+from .schema import int_dtype
+
+COLUMNS = ("income", "tax")
+_FEW_ROWS = 64          # 변경 행이 이 이하이면 행마다 이진 탐색, 넘으면 전체 배열에서 한 번에 걸러냄
+
+
+class Filter(NamedTuple):
+    """조건 (None 은 제한 없음, 범위는 양 끝 포함)"""
+    income_min: Optional[int] = None
+    income_max: Optional[int] = None
+    tax_min: Optional[int] = None
+    tax_max: Optional[int] = None
+    names: tuple = ()
+
+    def ranges(self) -> dict:
+        """열 → (lo, hi) – 제한이 있는 열만"""
+        out = {}
+        for column, lo, hi in (("income", self.income_min, self.income_max), ("tax", self.tax_min, self.tax_max)):
+            if lo is not None or hi is not None:
+                out[column] = (lo, hi)
+        return out
+
+
+class QueryResult:
+    """질의 결과 – 행 위치만 보관 (range 또는 정수 배열/뷰)"""
+
+    def __init__(self, rows, total: int):
+        self.rows = rows
+        self.total = total          # 전체 행 수 (비율 표시용)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def positions(self, start: int, stop: int) -> np.ndarray:
+        return np.asarray(self.rows[start:stop], dtype=np.intp)
+
+    def page(self, dataset, page: int, page_size: int):
+        """1부터 시작하는 page 번째 구간의 행만 DataFrame 으로 (원래 행 번호를 인덱스로 유지)"""
+        start = (max(page, 1) - 1) * page_size
+        return dataset.frame().iloc[self.positions(start, start + page_size)]
+
+
+class DatasetIndex:
+    """
+    데이터셋 한 버전의 인덱스
+    정렬 인덱스: 열마다 (값 순서의 행 위치, 정렬된 값) – 동률은 행 순서 (안정 정렬)
+    이름 인덱스: 이름 → 코드 해시 표(dict), 코드 → 행 위치는 코드 순 정렬 + 구간 오프셋
+    원래 순서의 열은 데이터셋 버퍼의 뷰로 참조하므로 인덱스가 살아 있는 동안 그 버전의 버퍼도 유지된다.
+    """
+
+    def __init__(self, dataset):
+        n = len(dataset)
+        self.n = n
+        self.fingerprint = dataset.fingerprint()
+        position_dtype = int_dtype(0, n)
+        self._order = {}
+        self._sorted = {}
+        self._values = {}               # 원래 순서의 열 (데이터셋 버퍼의 뷰 – 복사 없음)
+        for column in COLUMNS:
+            values = self._values[column] = getattr(dataset, column)
+            order = np.argsort(values, kind="stable").astype(position_dtype, copy=False)
+            self._order[column] = order
+            self._sorted[column] = values[order]
+        codes = dataset.name_codes
+        self._name_rows = np.argsort(codes, kind="stable").astype(position_dtype, copy=False)
+        self._name_offsets = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=len(dataset.categories)))))
+        self._code_of = {name: code for code, name in enumerate(dataset.categories)}
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [*self._order.values(), *self._sorted.values(), self._name_rows, self._name_offsets]
+        return sum(a.nbytes for a in arrays) + 100 * len(self._code_of)
+
+    def _check(self, column: str) -> None:
+        if column not in COLUMNS:
+            raise ValueError(f"인덱스가 있는 열은 {', '.join(COLUMNS)} 입니다: {column}")
+
+    # ------------------------------
+    # O(log n) / O(1) 질의
+    # ------------------------------
+    def bounds(self, column: str, lo=None, hi=None) -> tuple[int, int]:
+        """lo ≤ 값 ≤ hi 인 구간의 정렬 인덱스 위치 [a, b)"""
+        self._check(column)
+        s = self._sorted[column]
+        a = 0 if lo is None else int(np.searchsorted(s, lo, side="left"))
+        b = self.n if hi is None else int(np.searchsorted(s, hi, side="right"))
+        return a, max(a, b)
+
+    def count(self, column: str, lo=None, hi=None) -> int:
+        """lo ≤ 값 ≤ hi 인 행 수"""
+        a, b = self.bounds(column, lo, hi)
+        return b - a
+
+    def count_below(self, column: str, value, inclusive: bool = False) -> int:
+        """값 < value (inclusive 면 ≤) 인 행 수"""
+        self._check(column)
+        return int(np.searchsorted(self._sorted[column], value, side="right" if inclusive else "left"))
+
+    def top_k(self, column: str, k: int, largest: bool = True) -> np.ndarray:
+        """값 기준 상위(또는 하위) k 행의 위치 – 동률은 앞 행 우선, O(k log k)"""
+        self._check(column)
+        k = max(0, min(int(k), self.n))
+        if k == 0:
+            return np.empty(0, dtype=np.intp)
+        if not largest:
+            return self._order[column][:k].astype(np.intp)
+        s = self._sorted[column]
+        a = int(np.searchsorted(s, s[self.n - k], side="left"))    # k 번째 값과 같은 값까지 포함
+        rows = self._order[column][a:].astype(np.intp)
+        rows = rows[np.lexsort((rows, -self._values[column][rows].astype(np.int64)))]
+        return rows[:k]
+
+    def order(self, column: str) -> np.ndarray:
+        """값 오름차순의 행 위치 (동률은 행 순서) – 인덱스 배열 그대로 (복사 없음, 고치지 말 것)"""
+        self._check(column)
+        return self._order[column]
+
+    def histogram(self, column: str, bins: int = 10) -> tuple[np.ndarray, np.ndarray]:
+        """np.histogram(값, bins) 와 같은 (개수, 경계) – 정렬된 값에서 경계 위치만 찾으므로 O(bins log n)"""
+        self._check(column)
+        s = self._sorted[column]
+        if self.n == 0:
+            return np.histogram(s, bins=bins)
+        edges = np.histogram_bin_edges(s[:0], bins=bins, range=(s[0], s[-1]))
+        positions = np.searchsorted(s, edges, side="left")
+        positions[-1] = np.searchsorted(s, edges[-1], side="right")   # 마지막 구간은 오른쪽 끝 포함
+        return np.diff(positions), edges
+
+    def percentile(self, column: str, q: float) -> float:
+        """q% 분위수 (np.percentile 의 linear 방식과 같음)"""
+        self._check(column)
+        if self.n == 0:
+            raise ValueError("빈 데이터의 분위수는 계산할 수 없습니다.")
+        s = self._sorted[column]
+        pos = min(max(float(q), 0.0), 100.0) / 100 * (self.n - 1)
+        i = int(pos)
+        j = min(i + 1, self.n - 1)
+        a, b, t = float(s[i]), float(s[j]), pos - i
+        return b - (b - a) * (1 - t) if t >= 0.5 else a + (b - a) * t    # NumPy 와 같은 보간식 (반올림까지 일치)
+
+    def percentile_rank(self, column: str, value) -> float:
+        """value 보다 작은 행의 비율 (%)"""
+        return 100 * self.count_below(column, value) / self.n if self.n else 0.0
+
+    def rows_of(self, name) -> np.ndarray:
+        """이름의 행 위치 (행 순서) – 해시 조회 O(1) + 결과 크기"""
+        code = self._code_of.get(name)
+        if code is None:
+            return self._name_rows[:0]
+        return self._name_rows[self._name_offsets[code]:self._name_offsets[code + 1]]
+
+    # ------------------------------
+    # 필터 + 정렬
+    # ------------------------------
+    def query(self, where: Filter = Filter(), sort_by: Optional[str] = None, descending: bool = False) -> QueryResult:
+        """조건에 맞는 행 – sort_by 가 없으면 행 순서, descending 은 오름차순 결과의 역순"""
+        if sort_by is not None:
+            self._check(sort_by)
+        ranges = where.ranges()
+        names = tuple(dict.fromkeys(where.names))
+
+        # 후보: 가장 좁은 조건 하나 (개수는 O(log n) / O(1))
+        candidates = {column: self.bounds(column, lo, hi) for column, (lo, hi) in ranges.items()}
+        sizes = {column: b - a for column, (a, b) in candidates.items()}
+        if names:
+            sizes["name"] = sum(len(self.rows_of(name)) for name in names)
+        if not sizes:
+            if sort_by is None:
+                rows = range(self.n)
+            else:
+                rows = self._order[sort_by]
+            return QueryResult(rows[::-1] if descending else rows, self.n)
+
+        driver = min(sizes, key=sizes.get)
+        if driver == "name":
+            rows = np.concatenate([self.rows_of(name) for name in names])
+            if len(names) > 1:
+                rows = np.sort(rows)
+            sorted_by = None                 # 행 순서
+        else:
+            a, b = candidates[driver]
+            rows = self._order[driver][a:b]
+            sorted_by = driver
+
+        # 나머지 조건은 후보에만 적용
+        rest = [(column, lo, hi) for column, (lo, hi) in ranges.items() if column != driver]
+        if rest or (names and driver != "name"):
+            keep = np.ones(len(rows), dtype=bool)
+            for column, lo, hi in rest:
+                values = self._values[column][rows]
+                if lo is not None:
+                    keep &= values >= lo
+                if hi is not None:
+                    keep &= values <= hi
+            if names and driver != "name":
+                member = np.zeros(self.n, dtype=bool)
+                for name in names:
+                    member[self.rows_of(name)] = True
+                keep &= member[rows]
+            rows = rows[keep]
+
+        # 정렬 – 후보가 이미 그 순서면 그대로
+        if sort_by != sorted_by:
+            if sort_by is None:
+                rows = np.sort(rows)
+            elif len(rows) * 8 < self.n:
+                rows = np.sort(rows)
+                rows = rows[np.argsort(self._values[sort_by][rows], kind="stable")]
+            else:
+                member = np.zeros(self.n, dtype=bool)
+                member[rows] = True
+                order = self._order[sort_by]
+                rows = order[member[order]]
+        return QueryResult(rows[::-1] if descending else rows, self.n)
+
+    # ------------------------------
+    # 변경분 반영
+    # ------------------------------
+    def updated(self, dataset, deltas) -> "DatasetIndex":
+        """
+        변경분(Delta)만 반영한 새 인덱스 – 이 인덱스는 바꾸지 않는다 (다른 세션과 공유될 수 있음)
+        추가·수정 행은 이진 탐색으로 삽입 위치를, 삭제 행은 제거 후 뒤 행 번호를 당긴다 (정렬 없음).
+        """
+        # 이어진 행 추가는 한 번에 넣음 – 배열 복사(삽입)는 변경 묶음마다 한 번
+        merged = []
+        for delta in deltas:
+            if delta.kind == APPEND and merged and merged[-1].kind == APPEND:
+                last = merged[-1]
+                merged[-1] = last._replace(rows=range(last.rows.start, delta.rows.stop),
+                                           after=tuple(np.concatenate(pair) for pair in zip(last.after, delta.after)))
+            else:
+                merged.append(delta)
+
+        # 작업 dtype: 행 위치는 늘어날 행 수까지, 값은 변경 값까지 담는 dtype (끝나고 데이터셋에 맞게 줄임)
+        grow = sum(len(d.rows) for d in merged if d.kind == APPEND)
+        position_dtype = int_dtype(0, self.n + grow)
+        value_dtypes = {c: np.result_type(self._sorted[c], *(rows[i] for d in merged for rows in (d.before, d.after)
+                                                             if rows is not None))
+                        for i, c in enumerate(COLUMNS, start=1)}
+        index = DatasetIndex.__new__(DatasetIndex)
+        index.n = self.n
+        index._order = {c: self._order[c].astype(position_dtype, copy=False) for c in COLUMNS}
+        index._sorted = {c: self._sorted[c].astype(value_dtypes[c], copy=False) for c in COLUMNS}
+        index._name_rows = self._name_rows.astype(position_dtype, copy=False)
+        index._name_offsets = self._name_offsets
+        index._code_of = dict(self._code_of)
+
+        for delta in merged:
+            if delta.kind == APPEND:
+                index._insert(np.asarray(delta.rows), delta.after, appended=True)
+            elif delta.kind == UPDATE:
+                index._remove(delta.rows, delta.before, shift=False)
+                index._insert(delta.rows, delta.after, appended=False)
+            elif delta.kind == DELETE:
+                index._remove(delta.rows, delta.before, shift=True)
+
+        n = len(dataset)
+        position_dtype = int_dtype(0, n)
+        for c in COLUMNS:
+            index._order[c] = index._order[c].astype(position_dtype, copy=False)
+            index._sorted[c] = index._sorted[c].astype(getattr(dataset, c).dtype, copy=False)
+        index._values = {c: getattr(dataset, c) for c in COLUMNS}
+        offsets = index._name_offsets
+        index._name_offsets = np.concatenate((offsets, np.repeat(offsets[-1], len(dataset.categories) + 1 - len(offsets))))
+        index._code_of.update((name, code) for code, name in enumerate(dataset.categories[len(self._code_of):],
+                                                                      start=len(self._code_of)))
+        index._name_rows = index._name_rows.astype(position_dtype, copy=False)
+        index.n = n
+        index.fingerprint = dataset.fingerprint()
+        return index
+
+    def _insert(self, rows: np.ndarray, values: tuple, appended: bool) -> None:
+        """
+        행들을 넣음 (rows 오름차순) – 정렬 인덱스는 (값, 행 번호) 순, 이름 인덱스는 (코드, 행 번호) 순을 유지
+        appended 이면 새 행이 기존 행보다 모두 뒤이므로 같은 값 구간의 끝에 넣는다.
+        """
+        codes = np.asarray(values[0], dtype=np.intp)
+        for column, v in zip(COLUMNS, values[1:]):
+            order, s = self._order[column], self._sorted[column]
+            o = np.argsort(v, kind="stable")
+            v, r = v[o], rows[o]
+            at = np.searchsorted(s, v, side="right")
+            if not appended:        # 같은 값 구간 안에서 행 번호 위치
+                lo = np.searchsorted(s, v, side="left")
+                at = np.array([a + np.searchsorted(order[a:b], row) for a, b, row in zip(lo, at, r)], dtype=np.intp)
+            self._order[column] = np.insert(order, at, r)
+            self._sorted[column] = np.insert(s, at, v)
+
+        n_codes = max(len(self._name_offsets) - 1, int(codes.max()) + 1)
+        offsets = np.concatenate((self._name_offsets,
+                                  np.repeat(self._name_offsets[-1], n_codes + 1 - len(self._name_offsets))))
+        o = np.argsort(codes, kind="stable")
+        c, r = codes[o], rows[o]
+        at = offsets[c + 1]
+        if not appended:
+            at = np.array([a + np.searchsorted(self._name_rows[a:b], row)
+                           for a, b, row in zip(offsets[c], offsets[c + 1], r)], dtype=np.intp)
+        self._name_rows = np.insert(self._name_rows, at, r)
+        offsets[1:] += np.cumsum(np.bincount(c, minlength=n_codes))
+        self._name_offsets = offsets
+        self.n += len(rows)
+
+    def _remove(self, rows: np.ndarray, values: tuple, shift: bool) -> None:
+        """행들을 뺌 (이 인덱스의 배열은 새로 만듦) – shift 면 삭제이므로 뒤 행 번호를 당긴다"""
+        codes = np.asarray(values[0], dtype=np.intp)
+        for column, v in zip(COLUMNS, values[1:]):
+            order, s = self._order[column], self._sorted[column]
+            if len(rows) <= _FEW_ROWS:      # (값, 행 번호) 위치를 이진 탐색
+                lo = np.searchsorted(s, v, side="left")
+                hi = np.searchsorted(s, v, side="right")
+                at = [a + np.searchsorted(order[a:b], row) for a, b, row in zip(lo, hi, rows)]
+                self._order[column], self._sorted[column] = np.delete(order, at), np.delete(s, at)
+            else:
+                keep = ~np.isin(order, rows)
+                self._order[column], self._sorted[column] = order[keep], s[keep]
+
+        offsets = self._name_offsets
+        if len(rows) <= _FEW_ROWS:
+            at = [a + np.searchsorted(self._name_rows[a:b], row)
+                  for a, b, row in zip(offsets[codes], offsets[codes + 1], rows)]
+            self._name_rows = np.delete(self._name_rows, at)
+        else:
+            self._name_rows = self._name_rows[~np.isin(self._name_rows, rows)]
+        self._name_offsets = offsets.copy()
+        self._name_offsets[1:] -= np.cumsum(np.bincount(codes, minlength=len(offsets) - 1))
+        self.n -= len(rows)
+        if shift:
+            for column in COLUMNS:
+                order = self._order[column]
+                self._order[column] = (order - np.searchsorted(rows, order)).astype(order.dtype)
+            self._name_rows = (self._name_rows - np.searchsorted(rows, self._name_rows)).astype(self._name_rows.dtype)
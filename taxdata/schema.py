@@ -0,0 +1,83 @@
+# taxdata/schema.py
+# 데이터셋 열 스키마 – 값 범위에 맞는 가장 작은 정수 dtype 과 세션 메모리 사용량 측정
+#
+#   int_dtype(0, 60_000_000)        # → int32
+#   code_dtype(200)                 # 범주 200개 → int16 코드 (pandas Categorical 과 같은 규칙)
+#
+# TaxDataset 버퍼는 int8 로 시작해 들어온 값이 담기지 않을 때만 넓힌다 (int8 → int16 → int32 → int64).
+# 이름 코드는 pandas 가 Categorical 코드에 쓰는 dtype 과 같게 두어 frame() 에서 코드를 복사하지 않는다.
+# 추가·삭제 후의 버퍼 dtype 은 "지금 내용을 담는 가장 작은 dtype" 이고, 같은 내용이면 같은 dtype 이다
+# (fingerprint 가 dtype 을 포함해도 세션·저장소 사이에서 일치). 행 수정은 dtype 을 넓히기만 하므로
+# 수정 뒤에는 더 넓을 수 있다 – 같은 내용이 다른 ID 로 저장될 뿐 결과는 같다.
+# 합계는 NumPy/pandas 가 int64 로 누적하므로 좁은 dtype 이어도 넘치지 않는다.
+
+import mmap
+import sys
+
+import numpy as np
+
+INT_DTYPES = tuple(np.dtype(t) for t in (np.int8, np.int16, np.int32, np.int64))
+_BOUNDS = tuple((np.iinfo(t).min, np.iinfo(t).max) for t in INT_DTYPES)
+
+
+def int_dtype(lo: int, hi: int) -> np.dtype:
+    """[lo, hi] 를 담는 가장 작은 부호 있는 정수 dtype"""
+    for dtype, (t_lo, t_hi) in zip(INT_DTYPES, _BOUNDS):
+        if t_lo <= lo and hi <= t_hi:
+            return dtype
+    raise OverflowError(f"int64 범위를 벗어난 값입니다: {lo:,} ~ {hi:,}")
+
+
+def code_dtype(n_categories: int) -> np.dtype:
+    """범주 n 개의 코드 dtype – pandas Categorical 과 같은 규칙 (n < 127 이면 int8 ...)"""
+    for dtype, (_, t_hi) in zip(INT_DTYPES, _BOUNDS):
+        if n_categories < t_hi:
+            return dtype
+    return INT_DTYPES[-1]
+
+
+def value_range(values) -> tuple[int, int]:
+    """정수 배열의 (최솟값, 최댓값) – 빈 배열은 (0, 0)"""
+    values = np.asarray(values)
+    if values.size == 0:
+        return 0, 0
+    return int(values.min()), int(values.max())
+
+
+def compact(values) -> np.ndarray:
+    """정수 배열을 값 범위에 맞는 가장 작은 dtype 으로 (이미 그렇다면 복사 없음)"""
+    values = np.asarray(values)
+    return values.astype(int_dtype(*value_range(values)), copy=False)
+
+
+# ------------------------------
+# 메모리 사용량
+# ------------------------------
+def is_shared(array) -> bool:
+    """메모리 매핑된 배열(또는 그 뷰)인지 – 저장소 파일을 여러 세션이 함께 쓰므로 세션 몫이 아님"""
+    while isinstance(array, np.ndarray):
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return isinstance(array, mmap.mmap)
+
+
+def strings_nbytes(values) -> int:
+    """문자열 목록이 차지하는 바이트 (객체 + 목록 포인터)"""
+    return sum(sys.getsizeof(v) for v in values) + 8 * len(values)
+
+
+def frame_nbytes(df) -> int:
+    """DataFrame 깊은 메모리 사용량 (문자열 포함)"""
+    if df is None:
+        return 0
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def format_bytes(n: int) -> str:
+    """사람이 읽는 크기 (B / KB / MB / GB)"""
+    for unit in ("B", "KB", "MB"):
+        if abs(n) < 1024:
+            return f"{n:,.0f} {unit}" if unit == "B" else f"{n:,.1f} {unit}"
+        n /= 1024
+    return f"{n:,.1f} GB"
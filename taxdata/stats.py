@@ -0,0 +1,254 @@
+# taxdata/stats.py
+# 세금 데이터 누적 집계 – 청크 단위로 갱신·병합 가능한 기본 통계
+#
+# TaxStats: 전체 인원·합계·최고/최저 – 행 추가는 O(1), 행 수정·삭제도 합계는 O(1)
+#           (최고/최저 소득 행이 빠지면 remove_rows() 가 알려 주고 데이터셋이 다시 구한다)
+# NameTotals: 이름별 인원·소득·세금 합계 – 막대·파이 차트의 집계, 변경분(Delta)만 더하고 빼서 갱신
+
+import math
+
+import numpy as np
+import pandas as pd
+
+MAX_PENDING_NAMES = 1_024       # NameTotals: 기준 배열에 합치기 전까지 dict 로 들고 있는 바뀐 이름 수
+
+
+class TaxStats:
+    """
+    name / income / tax 데이터의 누적 집계
+    최고·최저 소득자는 동률일 때 먼저 나온 행을 유지한다 (DataFrame.idxmax/idxmin 과 동일).
+    """
+
+    __slots__ = ("count", "income_sum", "tax_sum",
+                 "income_max", "income_max_name", "income_min", "income_min_name")
+
+    def __init__(self):
+        self.count = 0
+        self.income_sum = 0
+        self.tax_sum = 0
+        self.income_max = None
+        self.income_max_name = None
+        self.income_min = None
+        self.income_min_name = None
+
+    def __repr__(self):
+        return (f"TaxStats(count={self.count}, income_sum={self.income_sum}, tax_sum={self.tax_sum}, "
+                f"max={self.income_max}({self.income_max_name}), min={self.income_min}({self.income_min_name}))")
+
+    @classmethod
+    def from_frame(cls, df) -> "TaxStats":
+        stats = cls()
+        stats.update(df)
+        return stats
+
+    # ------------------------------
+    # 갱신
+    # ------------------------------
+    def update(self, chunk) -> "TaxStats":
+        """DataFrame 청크 하나를 반영 (열 단위 벡터 연산)"""
+        if len(chunk) == 0:
+            return self
+        income = chunk["income"].to_numpy()
+        names = chunk["name"]
+        self.count += len(chunk)
+        self.income_sum += int(income.sum())
+        self.tax_sum += int(chunk["tax"].to_numpy().sum())
+
+        i_max = int(income.argmax())
+        if self.income_max is None or income[i_max] > self.income_max:
+            self.income_max, self.income_max_name = int(income[i_max]), names.iloc[i_max]
+        i_min = int(income.argmin())
+        if self.income_min is None or income[i_min] < self.income_min:
+            self.income_min, self.income_min_name = int(income[i_min]), names.iloc[i_min]
+        return self
+
+    def add_row(self, name, income: int, tax: int) -> "TaxStats":
+        """행 하나를 반영 (O(1))"""
+        self.count += 1
+        self.income_sum += income
+        self.tax_sum += tax
+        if self.income_max is None or income > self.income_max:
+            self.income_max, self.income_max_name = income, name
+        if self.income_min is None or income < self.income_min:
+            self.income_min, self.income_min_name = income, name
+        return self
+
+    def remove_rows(self, income, tax) -> bool:
+        """
+        행들을 뺌 (O(k)) – 최고/최저 소득과 같은 값이 빠졌으면 True
+        True 이면 최고/최저 소득 행이 바뀌었을 수 있으므로 호출자가 남은 행으로 다시 구해야 한다.
+        """
+        income, tax = np.asarray(income), np.asarray(tax)
+        if income.size == 0:
+            return False
+        self.count -= int(income.size)
+        self.income_sum -= int(income.sum(dtype=np.int64))
+        self.tax_sum -= int(tax.sum(dtype=np.int64))
+        if self.count == 0:
+            self.income_max = self.income_max_name = self.income_min = self.income_min_name = None
+            return False
+        return bool((income == self.income_max).any() or (income == self.income_min).any())
+
+    def merge(self, other: "TaxStats") -> "TaxStats":
+        """뒤에 이어지는 데이터의 집계를 합침 (병렬 처리 결과 결합용)"""
+        self.count += other.count
+        self.income_sum += other.income_sum
+        self.tax_sum += other.tax_sum
+        if other.income_max is not None and (self.income_max is None or other.income_max > self.income_max):
+            self.income_max, self.income_max_name = other.income_max, other.income_max_name
+        if other.income_min is not None and (self.income_min is None or other.income_min < self.income_min):
+            self.income_min, self.income_min_name = other.income_min, other.income_min_name
+        return self
+
+    # ------------------------------
+    # 저장 (taxdata.store)
+    # ------------------------------
+    def state(self) -> dict:
+        """집계 필드 그대로 (JSON 저장용)"""
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    @classmethod
+    def from_state(cls, state: dict) -> "TaxStats":
+        stats = cls()
+        for slot in cls.__slots__:
+            setattr(stats, slot, state.get(slot, getattr(stats, slot)))
+        return stats
+
+    # ------------------------------
+    # 파생 지표
+    # ------------------------------
+    @property
+    def income_mean(self) -> float:
+        return self.income_sum / self.count if self.count else math.nan
+
+    @property
+    def tax_mean(self) -> float:
+        return self.tax_sum / self.count if self.count else math.nan
+
+    @property
+    def effective_rate(self) -> float:
+        """평균 세율 (%) = 총 세금 / 총 소득"""
+        return self.tax_sum / self.income_sum * 100 if self.income_sum else math.nan
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "income_sum": self.income_sum,
+            "tax_sum": self.tax_sum,
+            "income_mean": self.income_mean,
+            "tax_mean": self.tax_mean,
+            "income_max": self.income_max,
+            "income_max_name": self.income_max_name,
+            "income_min": self.income_min,
+            "income_min_name": self.income_min_name,
+            "effective_rate": self.effective_rate,
+        }
+
+
+class NameTotals:
+    """
+    이름(범주 코드)별 인원·소득·세금 합계 (int64)
+    코드는 이름이 처음 나온 순서로 매겨지므로 코드 순서가 groupby(sort=False) 의 그룹 순서와 같다.
+    updated() 는 이 객체를 바꾸지 않고 새 객체를 돌려준다 (이전 버전 결과는 다른 세션과 공유될 수 있음).
+    합계는 기준 배열(만든 뒤 바꾸지 않음)과, 그 뒤 바뀐 이름만 담은 dict(코드 → (인원, 소득, 세금))로 보관한다.
+    updated() 는 dict 만 복사해 고치므로 행 하나 수정이 이름 수와 무관하고, dict 가 MAX_PENDING_NAMES 를 넘거나
+    변경 행이 많으면 그때 새 기준 배열 하나에 제자리로 더해 합친다.
+    """
+
+    __slots__ = ("_base", "_pending", "_arrays")
+
+    def __init__(self, n_categories: int = 0):
+        self._base = tuple(np.zeros(n_categories, dtype=np.int64) for _ in range(3))
+        self._pending = {}
+        self._arrays = None
+
+    def __repr__(self):
+        return f"NameTotals(names={int((self.count > 0).sum())}, rows={int(self.count.sum())})"
+
+    def _totals(self) -> tuple:
+        """(인원, 소득, 세금) 배열 – 바뀐 이름이 있으면 기준 배열 복사본에 반영 (객체별 1회)"""
+        if not self._pending:
+            return self._base
+        if self._arrays is None:
+            size = max(len(self._base[0]), max(self._pending) + 1)
+            arrays = tuple(np.zeros(size, dtype=np.int64) for _ in range(3))
+            for new, old in zip(arrays, self._base):
+                new[:len(old)] = old
+            codes = np.fromiter(self._pending, dtype=np.intp, count=len(self._pending))
+            values = np.array(list(self._pending.values()), dtype=np.int64).reshape(-1, 3)
+            for i, array in enumerate(arrays):
+                array[codes] = values[:, i]
+            self._arrays = arrays
+        return self._arrays
+
+    @property
+    def count(self) -> np.ndarray:
+        return self._totals()[0]
+
+    @property
+    def income(self) -> np.ndarray:
+        return self._totals()[1]
+
+    @property
+    def tax(self) -> np.ndarray:
+        return self._totals()[2]
+
+    @property
+    def nbytes(self) -> int:
+        arrays = self._base + (self._arrays or ())
+        return sum(a.nbytes for a in arrays) + len(self._pending) * 3 * 8
+
+    @staticmethod
+    def _add(arrays, rows, sign: int) -> None:
+        """배열에 제자리로 더함 (새로 만든, 아직 내주지 않은 배열에만)"""
+        codes, income, tax = rows
+        codes = np.asarray(codes, dtype=np.intp)
+        count, income_sum, tax_sum = arrays
+        np.add.at(count, codes, sign)
+        np.add.at(income_sum, codes, sign * np.asarray(income, dtype=np.int64))
+        np.add.at(tax_sum, codes, sign * np.asarray(tax, dtype=np.int64))
+
+    @classmethod
+    def from_dataset(cls, dataset) -> "NameTotals":
+        totals = cls(len(dataset.categories))
+        cls._add(totals._base, (dataset.name_codes, dataset.income, dataset.tax), 1)
+        return totals
+
+    def updated(self, dataset, deltas) -> "NameTotals":
+        """변경분만 반영한 새 합계 – 보통 O(변경 행 수 + 바뀐 이름 수), 합칠 때만 O(이름 수)"""
+        changes = [(rows, sign) for delta in deltas
+                   for rows, sign in ((delta.before, -1), (delta.after, 1)) if rows is not None]
+        n_rows = sum(len(rows[0]) for rows, _ in changes)
+        totals = NameTotals.__new__(NameTotals)
+        totals._arrays = None
+        if len(self._pending) + n_rows > MAX_PENDING_NAMES:
+            current = self._totals()
+            base = tuple(np.zeros(max(len(dataset.categories), len(current[0])), dtype=np.int64)
+                         for _ in range(3))
+            for new, old in zip(base, current):
+                new[:len(old)] = old
+            for rows, sign in changes:
+                NameTotals._add(base, rows, sign)
+            totals._base, totals._pending = base, {}
+            return totals
+
+        base = self._base
+        pending = dict(self._pending)
+        for (codes, income, tax), sign in changes:
+            for code, i, t in zip(np.asarray(codes).tolist(), np.asarray(income).tolist(), np.asarray(tax).tolist()):
+                old = pending.get(code)
+                if old is None:
+                    old = ((int(base[0][code]), int(base[1][code]), int(base[2][code]))
+                           if code < len(base[0]) else (0, 0, 0))
+                pending[code] = (old[0] + sign, old[1] + sign * i, old[2] + sign * t)
+        totals._base, totals._pending = base, pending
+        return totals
+
+    def frame(self, categories):
+        """행이 있는 이름만 name / income / tax 합계 DataFrame 으로 (코드 순서)"""
+        codes = np.flatnonzero(self.count > 0)
+        return pd.DataFrame({
+            "name": pd.Categorical.from_codes(codes, categories=categories),
+            "income": self.income[codes],
+            "tax": self.tax[codes],
+        })
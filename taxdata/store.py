@@ -0,0 +1,317 @@
+# taxdata/store.py
+# 데이터셋 저장소 – 열별 원시 파일 + 메모리 매핑(np.memmap)으로 세션·재시작 사이에 공유되는 디스크 사본
+#
+#   store = DatasetStore("data_store")
+#   dataset_id = store.save(dataset)              # ID = 내용 해시 (dataset.fingerprint())
+#   dataset = store.load(dataset_id)              # 복사 없이 memmap 열을 감싼 TaxDataset
+#
+#   with store.writer() as writer:                # 업로드를 청크 단위로 바로 디스크에 (전체 프레임 없음)
+#       result = ingest(file, materialize=False, sink=writer.write)
+#       dataset_id = writer.commit(result.stats)
+#
+# 디렉터리 구조: <root>/<ID>/{codes.bin, income.bin, tax.bin, names.json, meta.json}
+# 열 파일은 TaxDataset 버퍼와 같은 가장 작은 정수 dtype 으로 저장하고 dtype 은 meta.json 에 기록한다.
+# 같은 내용은 한 번만 저장된다. 여러 세션이 같은 ID 를 열면 이 프로세스에서는 같은 memmap 을,
+# 프로세스 사이에서는 운영체제 페이지 캐시의 한 사본을 함께 쓴다.
+# 불러온 데이터셋에 행을 추가하면 그 세션만 메모리 버퍼로 복사되고 디스크의 원본은 바뀌지 않는다.
+
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from .dataset import TaxDataset
+from .perf import timed
+from .schema import code_dtype, int_dtype, value_range
+from .stats import TaxStats
+
+# 열 이름 → 업로드 청크를 받는 동안 쓰는 dtype (commit 때 값 범위에 맞게 줄임)
+COLUMNS = {
+    "codes": np.dtype(np.int32),
+    "income": np.dtype(np.int64),
+    "tax": np.dtype(np.int64),
+}
+DEFAULT_MAX_BYTES = 4 * 1024 ** 3
+DEFAULT_MAX_OPEN = 16
+CHUNK_ROWS = 1_000_000
+_ID_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+
+def _json_default(value):
+    if hasattr(value, "item"):          # NumPy 스칼라
+        return value.item()
+    return str(value)
+
+
+def _write_json(path: str, payload) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, default=_json_default)
+
+
+def _read_json(path: str):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _column_path(path: str, name: str) -> str:
+    return os.path.join(path, name + ".bin")
+
+
+def _union(a, b):
+    return b if a is None else (min(a[0], b[0]), max(a[1], b[1]))
+
+
+def _dir_bytes(path: str) -> int:
+    return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+
+
+class StoreWriter:
+    """청크를 받아 열 파일 끝에 이어 쓰는 저장기 – commit 하면 내용 해시 ID 로 확정"""
+
+    def __init__(self, store: "DatasetStore"):
+        self.store = store
+        self.rows = 0
+        self._tmp = tempfile.mkdtemp(prefix=".tmp-", dir=store.root)
+        self._files = {name: open(_column_path(self._tmp, name), "wb") for name in COLUMNS}
+        self._dtypes = dict(COLUMNS)
+        self._ranges = {"income": None, "tax": None}
+        self._categories = []
+        self._code_of = {}
+        self._done = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if not self._done:
+            self.abort()
+        return False
+
+    def _encode(self, names) -> np.ndarray:
+        codes, uniques = pd.factorize(pd.Series(names), use_na_sentinel=True)
+        if (codes < 0).any():
+            raise ValueError("name 컬럼에 빈 값이 있습니다.")
+        mapping = np.empty(len(uniques), dtype=np.int32)
+        for i, name in enumerate(uniques):
+            code = self._code_of.get(name)
+            if code is None:
+                code = self._code_of[name] = len(self._categories)
+                self._categories.append(name)
+            mapping[i] = code
+        return mapping[codes]
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        """name / income / tax 청크 하나를 이어 씀"""
+        if len(chunk) == 0:
+            return
+        columns = {
+            "codes": self._encode(chunk["name"]),
+            "income": chunk["income"].to_numpy(),
+            "tax": chunk["tax"].to_numpy(),
+        }
+        for name, values in columns.items():
+            if name in self._ranges:
+                self._ranges[name] = _union(self._ranges[name], value_range(values))
+            np.ascontiguousarray(values, dtype=self._dtypes[name]).tofile(self._files[name])
+        self.rows += len(chunk)
+
+    def write_columns(self, codes, income, tax, categories) -> None:
+        """이미 범주 코드로 바뀐 열을 dtype 그대로 통째로 씀 (TaxDataset 저장용, 빈 저장기에만)"""
+        if self.rows:
+            raise ValueError("write_columns 는 빈 저장기에만 쓸 수 있습니다.")
+        self._categories = list(categories)
+        self._code_of = {name: code for code, name in enumerate(self._categories)}
+        for name, values in zip(COLUMNS, (codes, income, tax)):
+            values = np.ascontiguousarray(values)
+            self._dtypes[name] = values.dtype
+            values.tofile(self._files[name])
+        self.rows = len(income)
+        self._ranges = {"income": value_range(income), "tax": value_range(tax)}
+
+    def _compact(self) -> None:
+        """열 파일을 값 범위에 맞는 가장 작은 dtype 으로 다시 씀 (TaxDataset 버퍼와 같은 dtype 이 되도록)"""
+        targets = {"codes": code_dtype(len(self._categories)),
+                   "income": int_dtype(*(self._ranges["income"] or (0, 0))),
+                   "tax": int_dtype(*(self._ranges["tax"] or (0, 0)))}
+        for name, dtype in targets.items():
+            if dtype == self._dtypes[name]:
+                continue
+            path = _column_path(self._tmp, name)
+            source = self.store._map(path, self._dtypes[name], self.rows)
+            with open(path + ".tmp", "wb") as f:
+                for start in range(0, self.rows, CHUNK_ROWS):
+                    source[start:start + CHUNK_ROWS].astype(dtype).tofile(f)
+            del source
+            os.replace(path + ".tmp", path)
+            self._dtypes[name] = dtype
+
+    def commit(self, stats: TaxStats = None, dataset_id: str = None) -> str:
+        """
+        파일을 닫고 ID(내용 해시 = TaxDataset.fingerprint)로 확정 – 같은 내용이 이미 있으면 그것을 쓴다
+        stats / dataset_id 를 모르면 저장된 열을 다시 읽어 계산한다.
+        """
+        for f in self._files.values():
+            f.close()
+        self._compact()
+        if stats is None or dataset_id is None:
+            columns = [self.store._map(_column_path(self._tmp, name), self._dtypes[name], self.rows)
+                       for name in COLUMNS]
+            if stats is None:
+                stats = TaxStats()
+                for start in range(0, self.rows, CHUNK_ROWS):
+                    codes, income, tax = (c[start:start + CHUNK_ROWS] for c in columns)
+                    stats.update(pd.DataFrame({
+                        "name": pd.Categorical.from_codes(codes, categories=self._categories),
+                        "income": income,
+                        "tax": tax,
+                    }))
+            if dataset_id is None:
+                dataset_id = TaxDataset.from_columns(*columns, self._categories, stats).fingerprint()
+            del columns
+        _write_json(os.path.join(self._tmp, "names.json"), self._categories)
+        _write_json(os.path.join(self._tmp, "meta.json"),
+                    {"rows": self.rows, "dtypes": {name: dtype.str for name, dtype in self._dtypes.items()},
+                     "stats": stats.state(), "created": time.time()})
+        self._done = True
+        return self.store._publish(self._tmp, dataset_id)
+
+    def abort(self) -> None:
+        for f in self._files.values():
+            f.close()
+        shutil.rmtree(self._tmp, ignore_errors=True)
+        self._done = True
+
+
+class DatasetStore:
+    """
+    내용 해시 ID 로 저장하는 데이터셋 저장소 (스레드 안전)
+    max_bytes 를 넘으면 가장 오래 쓰지 않은 데이터셋부터 지운다 (지금 열려 있는 것은 제외).
+    """
+
+    def __init__(self, root: str, max_bytes: int = DEFAULT_MAX_BYTES, max_open: int = DEFAULT_MAX_OPEN):
+        self.root = os.path.abspath(root)
+        self.max_bytes = int(max_bytes)
+        self.max_open = int(max_open)
+        self._open = OrderedDict()      # ID → (codes, income, tax, categories, stats_state)
+        self._lock = threading.RLock()
+        os.makedirs(self.root, exist_ok=True)
+
+    def __contains__(self, dataset_id) -> bool:
+        return self._path(dataset_id) is not None and os.path.isdir(self._path(dataset_id))
+
+    def _path(self, dataset_id):
+        if not isinstance(dataset_id, str) or not _ID_PATTERN.fullmatch(dataset_id):
+            return None
+        return os.path.join(self.root, dataset_id)
+
+    @staticmethod
+    def _map(path: str, dtype, rows: int) -> np.ndarray:
+        if rows == 0:                   # 빈 파일은 메모리 매핑할 수 없음
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r", shape=(rows,))
+
+    # ------------------------------
+    # 저장
+    # ------------------------------
+    def writer(self) -> StoreWriter:
+        return StoreWriter(self)
+
+    @timed("store.save")
+    def save(self, dataset: TaxDataset) -> str:
+        """데이터셋 저장 – 같은 내용이 이미 있으면 쓰지 않고 ID 만 반환"""
+        dataset_id = dataset.fingerprint()
+        path = self._path(dataset_id)
+        if os.path.isdir(path):
+            os.utime(path)
+            return dataset_id
+        with self.writer() as writer:
+            writer.write_columns(dataset.name_codes, dataset.income, dataset.tax, dataset.categories)
+            return writer.commit(dataset.stats, dataset_id)
+
+    def _publish(self, tmp: str, dataset_id: str) -> str:
+        path = self._path(dataset_id)
+        try:
+            os.rename(tmp, path)
+        except OSError:                 # 같은 내용을 다른 세션이 먼저 저장함
+            shutil.rmtree(tmp, ignore_errors=True)
+            if not os.path.isdir(path):
+                raise
+            os.utime(path)
+        self.prune(keep=(dataset_id,))
+        return dataset_id
+
+    # ------------------------------
+    # 불러오기
+    # ------------------------------
+    @timed("store.load")
+    def load(self, dataset_id: str) -> TaxDataset:
+        """저장된 데이터셋을 memmap 열로 연다 (없으면 KeyError)"""
+        path = self._path(dataset_id)
+        if path is None or not os.path.isdir(path):
+            raise KeyError(dataset_id)
+        with self._lock:
+            entry = self._open.get(dataset_id)
+            if entry is None:
+                meta = _read_json(os.path.join(path, "meta.json"))
+                categories = _read_json(os.path.join(path, "names.json"))
+                columns = [self._map(_column_path(path, name), np.dtype(meta["dtypes"][name]), meta["rows"])
+                           for name in COLUMNS]
+                entry = self._open[dataset_id] = (*columns, categories, meta["stats"])
+                while len(self._open) > self.max_open:
+                    self._open.popitem(last=False)
+            self._open.move_to_end(dataset_id)
+        os.utime(path)
+        codes, income, tax, categories, stats = entry
+        dataset = TaxDataset.from_columns(codes, income, tax, categories, TaxStats.from_state(stats))
+        dataset._fingerprint = dataset_id           # 저장할 때 계산한 내용 해시
+        return dataset
+
+    # ------------------------------
+    # 관리
+    # ------------------------------
+    def list(self) -> list[dict]:
+        """저장된 데이터셋 (최근 사용 순)"""
+        items = []
+        for entry in os.scandir(self.root):
+            if entry.is_dir() and _ID_PATTERN.fullmatch(entry.name):
+                try:
+                    meta = _read_json(os.path.join(entry.path, "meta.json"))
+                except (OSError, ValueError):
+                    continue
+                items.append({"id": entry.name, "rows": meta["rows"], "bytes": _dir_bytes(entry.path),
+                              "used": entry.stat().st_mtime, "created": meta.get("created")})
+        return sorted(items, key=lambda item: -item["used"])
+
+    def delete(self, dataset_id: str) -> None:
+        path = self._path(dataset_id)
+        with self._lock:
+            self._open.pop(dataset_id, None)
+        if path is not None:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def prune(self, keep=()) -> int:
+        """max_bytes 를 넘는 만큼 오래된 데이터셋 삭제 (열려 있거나 keep 에 있는 것은 제외) – 지운 개수"""
+        items = self.list()
+        total = sum(item["bytes"] for item in items)
+        removed = 0
+        for item in reversed(items):
+            if total <= self.max_bytes:
+                break
+            if item["id"] in self._open or item["id"] in keep:
+                continue
+            self.delete(item["id"])
+            total -= item["bytes"]
+            removed += 1
+        return removed
+
+    def stats(self) -> dict:
+        items = self.list()
+        return {"datasets": len(items), "bytes": sum(item["bytes"] for item in items),
+                "max_bytes": self.max_bytes, "open": len(self._open)}
@@ -0,0 +1,93 @@
+# taxdata/styling.py
+# 조건부 서식 – 소득 구간 코드를 열 단위로 한 번에 계산하고, CSS 는 코드 → 문자열 표에서 일괄 매핑한다.
+#
+# 행마다 Python 함수를 호출하던 Styler.apply(axis=1) 대신
+#   1) band_codes(): np.searchsorted 로 전체 소득 열의 구간 코드(int8) 산출 (캐시 가능)
+#   2) style_window(): 화면에 보이는 구간(페이지)만 잘라 Styler 를 만든다
+# 따라서 스타일 계산량과 브라우저로 보내는 데이터는 페이지 크기에 비례한다.
+# 데이터가 바뀌면 update_band_codes() 로 추가·수정·삭제된 행의 코드만 다시 계산한다.
+
+from typing import NamedTuple, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .dataset import APPEND, DELETE, UPDATE
+from .perf import timed
+
+
+class IncomeBand(NamedTuple):
+    label: str       # 구간 이름
+    color: str       # 배경색
+    emoji: str       # 범례 표시
+    color_name: str  # 범례 색 이름
+
+
+# 낮은 구간부터 – 경계값은 len(DEFAULT_BANDS) - 1 개
+DEFAULT_BANDS = (
+    IncomeBand("저소득자", "#ccffcc", "🟢", "초록"),
+    IncomeBand("중소득자", "#ffffcc", "🟡", "노랑"),
+    IncomeBand("고소득자", "#ffcccc", "🔴", "빨강"),
+)
+DEFAULT_THRESHOLDS = (4000, 5000)
+
+
+def check_thresholds(thresholds: Sequence[int], bands=DEFAULT_BANDS) -> tuple:
+    thresholds = tuple(int(t) for t in thresholds)
+    if len(thresholds) != len(bands) - 1:
+        raise ValueError(f"경계값은 {len(bands) - 1}개여야 합니다.")
+    if list(thresholds) != sorted(set(thresholds)):
+        raise ValueError("경계값은 서로 다르고 오름차순이어야 합니다.")
+    return thresholds
+
+
+def band_codes(income, thresholds: Sequence[int] = DEFAULT_THRESHOLDS) -> np.ndarray:
+    """소득 구간 코드 (0 = 가장 낮은 구간) – income ≥ 경계값이면 윗 구간"""
+    edges = np.asarray(check_thresholds(thresholds), dtype=np.int64)
+    return np.searchsorted(edges, np.asarray(income), side="right").astype(np.int8)
+
+
+def update_band_codes(codes, deltas, thresholds: Sequence[int] = DEFAULT_THRESHOLDS) -> np.ndarray:
+    """변경분(Delta)만 반영한 구간 코드 – 새 배열 (이전 배열은 다른 세션과 공유될 수 있으므로 고치지 않음)"""
+    codes = np.array(codes)
+    for delta in deltas:
+        if delta.kind == APPEND:
+            codes = np.concatenate((codes, band_codes(delta.after[1], thresholds)))
+        elif delta.kind == UPDATE:
+            codes[delta.rows] = band_codes(delta.after[1], thresholds)
+        elif delta.kind == DELETE:
+            codes = np.delete(codes, delta.rows)
+    return codes
+
+
+def band_legend(thresholds: Sequence[int] = DEFAULT_THRESHOLDS, bands=DEFAULT_BANDS) -> list[str]:
+    """범례 문구 (높은 구간부터) – 예: '🔴 고소득자 (≥5000): 빨강'"""
+    thresholds = check_thresholds(thresholds, bands)
+    lines = []
+    for i in reversed(range(len(bands))):
+        lo = thresholds[i - 1] if i > 0 else None
+        hi = thresholds[i] if i < len(thresholds) else None
+        if hi is None:
+            rng = f"≥{lo}"
+        elif lo is None:
+            rng = f"<{hi}"
+        else:
+            rng = f"{lo}~{hi - 1}"
+        lines.append(f"{bands[i].emoji} {bands[i].label} ({rng}): {bands[i].color_name}")
+    return lines
+
+
+def css_frame(df: pd.DataFrame, codes: np.ndarray, bands=DEFAULT_BANDS) -> pd.DataFrame:
+    """구간 코드를 행 전체 배경색 CSS 로 일괄 매핑 (df 와 같은 모양)"""
+    css = np.array([f"background-color: {b.color}" for b in bands], dtype=object)
+    per_row = css[codes]
+    return pd.DataFrame(np.repeat(per_row[:, None], df.shape[1], axis=1),
+                        index=df.index, columns=df.columns)
+
+
+@timed("styling.style_window")
+def style_window(df: pd.DataFrame, codes: np.ndarray, start: int, stop: int, bands=DEFAULT_BANDS):
+    """df.iloc[start:stop] 구간만 서식을 적용한 Styler (전체 codes 는 미리 계산된 것)"""
+    window = df.iloc[start:stop]
+    css = css_frame(window, codes[start:stop], bands)
+    return window.style.apply(lambda _: css, axis=None)
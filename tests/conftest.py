@@ -0,0 +1,9 @@
+# tests/conftest.py
+# 저장소 루트에서 taxcore / taxdata 를 import 할 수 있도록 경로 추가 (패키지 설치 없이 python -m pytest)
+
+import sys
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
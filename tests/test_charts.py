@@ -0,0 +1,41 @@
+# tests/test_charts.py
+# 6️⃣ 차트 – 행이 많을 때 줄인 차트가 원본 행을 그대로 쓰는지
+
+import numpy as np
+import pandas as pd
+
+from taxdata import charts
+
+
+def _frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    income = rng.integers(1_000_000, 200_000_000, rows)
+    return pd.DataFrame({"name": [f"사람{i % 50}" for i in range(rows)],      # 이름 중복
+                         "income": income, "tax": income // rng.integers(5, 20, rows)})
+
+
+def test_lttb_keeps_endpoints_and_order():
+    y = np.random.default_rng(1).normal(size=10_000)
+    rows = charts.lttb_indices(y, 500)
+    assert len(rows) == 500 and rows[0] == 0 and rows[-1] == len(y) - 1
+    assert (np.diff(rows) > 0).all()
+    both = charts.lttb_indices(np.column_stack([y, y * 1e6]), 500)
+    assert np.array_equal(both, rows)          # 계열마다 범위로 정규화 – 같은 모양이면 같은 행
+
+
+def test_line_chart_traces_share_rows():
+    df = _frame(20_000)
+    fig = charts.line_chart(df, max_points=1_000)
+    income, tax = fig.data
+    assert len(income.x) == len(tax.x) == 1_000
+    assert np.array_equal(income.x, tax.x)
+    rows = np.asarray(income.x)
+    assert np.array_equal(income.y, df["income"].to_numpy()[rows])
+    assert np.array_equal(tax.y, df["tax"].to_numpy()[rows])
+    assert list(income.text) == df["name"].iloc[rows].tolist()
+
+
+def test_line_chart_small_frame_unchanged():
+    df = _frame(100)
+    income, tax = charts.line_chart(df).data
+    assert list(income.x) == df["name"].tolist() and list(tax.y) == df["tax"].tolist()
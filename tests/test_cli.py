@@ -0,0 +1,61 @@
+# tests/test_cli.py
+# 일괄 계산 CLI – 샤드·작업자 수와 무관하게 같은 출력 (따옴표 안 줄바꿈, 샤드마다 전부 null 인 컬럼 포함)
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from taxcore.cli import csv_shards, run
+from taxcore.eitc import HOUSEHOLD_TYPES
+
+ROWS = 3_000
+SHARD_MB = 4096 / 2 ** 20       # 샤드 수십 개
+
+
+@pytest.fixture
+def households():
+    rng = np.random.default_rng(0)
+    notes = np.array(["", "a,b", 'say "hi"\nnext line', "x\n\ny"], dtype=object)
+    return pd.DataFrame({
+        "income": rng.integers(0, 60_000_000, ROWS),
+        "household_type": np.array(HOUSEHOLD_TYPES)[rng.integers(0, 3, ROWS)],
+        "note": notes[rng.integers(0, len(notes), ROWS)],
+        "late_filing": rng.random(ROWS) < 0.1,
+        "memo": pd.array([None] * (ROWS // 2) + [1] * (ROWS - ROWS // 2), dtype="Int64"),
+    })
+
+
+def test_csv_shards_end_on_record_boundaries(tmp_path, households):
+    path = tmp_path / "in.csv"
+    households.to_csv(path, index=False)
+    shards = csv_shards(str(path), 4096)
+    assert len(shards) > 10
+    data = path.read_bytes()
+    for shard in shards:
+        assert data[:shard.start].count(b'"') % 2 == 0 and data[shard.stop - 1:shard.stop] == b"\n"
+
+
+@pytest.mark.parametrize("in_fmt", ["csv", "parquet"])
+@pytest.mark.parametrize("out_fmt", ["csv", "parquet"])
+def test_output_does_not_depend_on_workers(tmp_path, households, in_fmt, out_fmt):
+    pytest.importorskip("pyarrow")
+    source = tmp_path / f"in.{in_fmt}"
+    if in_fmt == "csv":
+        households.to_csv(source, index=False)
+    else:
+        households.to_parquet(source, row_group_size=200)
+
+    outputs = []
+    for workers in (1, 3):
+        out = tmp_path / f"out{workers}.{out_fmt}"
+        run(str(source), str(out), workers=workers, shard_mb=SHARD_MB, progress=False)
+        outputs.append(out.read_bytes() if out_fmt == "csv" else pd.read_parquet(out))
+    if out_fmt == "csv":
+        assert outputs[0] == outputs[1]
+        result = pd.read_csv(tmp_path / "out1.csv", keep_default_na=False, dtype={"note": str})
+    else:
+        pd.testing.assert_frame_equal(outputs[0], outputs[1])
+        result = outputs[0]
+    assert len(result) == ROWS
+    assert result["note"].fillna("").astype(str).tolist() == households["note"].tolist()
+    assert result["income"].tolist() == households["income"].tolist()
@@ -0,0 +1,98 @@
+# tests/test_eitc.py
+# 근로장려금 – 일괄 계산·스윕·조회표가 스칼라 산정식(app.py / work1.py / earned_income_credit_2025.py)과 같은지
+
+import numpy as np
+import pytest
+
+from taxcore import eitc, eitc_age
+from taxcore.batch import calc_eitc_batch
+from taxcore.eitc import HOUSEHOLD_TYPES, PARAMS
+from taxcore.eitc_2025 import get_eitc_amount
+from taxcore.lookup import EitcLookupTable, get_lookup_table
+from taxcore.params import get_schedule
+from taxcore.sweep import income_grid, sweep
+
+MAN_WON = 10_000
+
+
+def _scalar(income, household_type, prop, late):
+    """app.py 의 계산 순서 – 기본 산정액 → 재산 조정 → 기한후신고 조정 → 지급 판정"""
+    base = eitc.calc_eitc(income, PARAMS[household_type])
+    adjusted, prop_note = eitc.apply_property_adjustment(base, prop)
+    final, late_note = eitc.apply_late_filing_adjustment(adjusted, late)
+    return base, adjusted, final, eitc.payment_status(final, prop_note, late_note)
+
+
+def test_batch_matches_scalar():
+    rng = np.random.default_rng(0)
+    n = 20_000
+    income = rng.integers(0, 50_000_000, n)
+    codes = rng.integers(0, 3, n)
+    prop = rng.choice([0, eitc.PROPERTY_REDUCE_LIMIT, eitc.PROPERTY_REDUCE_LIMIT + 1,
+                       eitc.PROPERTY_EXCLUDE_LIMIT, eitc.PROPERTY_EXCLUDE_LIMIT + 1], n)
+    late = rng.random(n) < 0.3
+    r = calc_eitc_batch(income, codes, prop, late)
+    for i in range(n):
+        expected = _scalar(int(income[i]), HOUSEHOLD_TYPES[codes[i]], int(prop[i]), bool(late[i]))
+        got = (r.base_amount[i], r.prop_adjusted[i], r.final_amount[i], r.status[i])
+        assert got == expected, (income[i], codes[i], prop[i], late[i])
+
+
+def test_batch_accepts_names_and_rejects_unknown():
+    names = np.array(["단독", "맞벌이", "홑벌이"])
+    by_name = calc_eitc_batch([10_000_000] * 3, names)
+    by_code = calc_eitc_batch([10_000_000] * 3, [0, 2, 1])
+    assert np.array_equal(by_name.final_amount, by_code.final_amount)
+    with pytest.raises(ValueError):
+        calc_eitc_batch([1], ["없음"])
+    with pytest.raises(ValueError):
+        calc_eitc_batch([1], [3])
+
+
+def test_sweep_standard_matches_scalar():
+    incomes = income_grid(50_000_000, step=50_000)
+    r = sweep(incomes, property_values=(0, 200_000_000, 300_000_000), late_filing=True)
+    for h, t in enumerate(HOUSEHOLD_TYPES):
+        for p, prop in enumerate((0, 200_000_000, 300_000_000)):
+            expected = [_scalar(x, t, prop, True)[2] for x in incomes.tolist()]
+            assert r.eitc[h, p].tolist() == expected, (t, prop)
+
+
+@pytest.mark.parametrize("age", [None, 40, 70])
+def test_sweep_age_bonus_matches_calc_eitc(age):
+    incomes = np.arange(0, 5_001) * MAN_WON
+    r = sweep(incomes, year=2025, schedule="age_bonus", age=age)
+    for h, t in enumerate(HOUSEHOLD_TYPES):
+        expected = [eitc_age.calc_eitc(x // MAN_WON, t, 0 if age is None else age) for x in incomes.tolist()]
+        assert r.eitc[h, 0].tolist() == expected, t
+
+
+@pytest.mark.parametrize("age", [None, 40, 70])
+def test_lookup_age_bonus_matches_calc_eitc(age):
+    table = get_lookup_table(2025, "age_bonus")
+    incomes = np.arange(0, 5_001) * MAN_WON
+    for t in HOUSEHOLD_TYPES:
+        expected = [eitc_age.calc_eitc(x // MAN_WON, t, 0 if age is None else age) for x in incomes.tolist()]
+        assert [table.amount(x, t, age) for x in incomes.tolist()] == expected, t
+        ages = None if age is None else np.full(len(incomes), age)
+        codes = np.full(len(incomes), table.row(t) // table.n_steps)
+        assert table.amount_batch(incomes, codes, ages).tolist() == expected, t
+
+
+def test_lookup_2025_matches_get_eitc_amount():
+    table = get_lookup_table(2025)
+    for t in HOUSEHOLD_TYPES:
+        for income in range(0, 5_001):
+            assert table.amount(income * MAN_WON, t) == get_eitc_amount(income, t), (t, income)
+
+
+def test_lookup_save_load_roundtrip(tmp_path):
+    table = EitcLookupTable.build(get_schedule(2024))
+    path = tmp_path / "eitc.lut"
+    table.save(path)
+    loaded = EitcLookupTable.load(path)
+    try:
+        assert np.array_equal(loaded.as_numpy(), table.as_numpy())
+        assert loaded.households == table.households
+    finally:
+        loaded.close()
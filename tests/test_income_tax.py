@@ -0,0 +1,61 @@
+# tests/test_income_tax.py
+# 종합소득세 세율표 – 공개 형식(tax_brackets)과 컴파일된 BracketTable, 스칼라와 일괄 계산의 일치
+
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from taxcore.income_tax import (
+    INCOME_TAX_2025, calculate_income_tax, calculate_income_tax_batch, tax_brackets,
+)
+
+
+def test_public_brackets_shape():
+    limits = [limit for limit, _, _ in tax_brackets]
+    assert limits == sorted(limits) and limits[-1] == float("inf")
+    assert all(isinstance(rate, float) and 0 < rate < 1 for _, rate, _ in tax_brackets)
+    assert INCOME_TAX_2025.limits == tuple(int(limit) for limit in limits[:-1])
+    assert INCOME_TAX_2025.percents == tuple(round(rate * 100) for _, rate, _ in tax_brackets)
+    assert INCOME_TAX_2025.deductions == tuple(ded for _, _, ded in tax_brackets)
+
+
+@pytest.mark.parametrize("income, rate", [
+    (0, 0.06), (12_000_000, 0.06), (12_000_000.7, 0.15), (12_000_001, 0.15),
+    (46_000_000, 0.15), (1_000_000_000, 0.42), (1_000_000_001, 0.45),
+])
+def test_bracket_boundaries(income, rate):
+    assert calculate_income_tax(income)[0] == rate
+
+
+def _reference(income: int):
+    """공개 세율표를 그대로 훑어 income * rate - deduction 을 정확한 유리수로 계산해 오사오입"""
+    for limit, rate, deduction in tax_brackets:
+        if income <= limit:
+            return rate, deduction, max(0, round(income * Fraction(str(rate)) - deduction))
+
+
+def test_scalar_matches_exact_formula():
+    rng = np.random.default_rng(0)
+    incomes = rng.integers(0, 2_000_000_000, 5_000).tolist() + [89_315_850, 12_000_000, 0]
+    for income in incomes:
+        assert calculate_income_tax(income) == _reference(income), income
+
+
+def test_batch_matches_scalar():
+    rng = np.random.default_rng(1)
+    incomes = np.concatenate([rng.integers(0, 2_000_000_000, 20_000),
+                              np.array(INCOME_TAX_2025.limits), np.array(INCOME_TAX_2025.limits) + 1])
+    r = calculate_income_tax_batch(incomes)
+    for i, income in enumerate(incomes.tolist()):
+        rate, deduction, tax = calculate_income_tax(income)
+        local = INCOME_TAX_2025.local_tax(tax)
+        assert (r.rate[i], r.deduction[i], r.tax[i], r.local_tax[i], r.total_tax[i]) \
+            == (rate, deduction, tax, local, tax + local), income
+
+
+def test_batch_fractional_income_matches_scalar():
+    incomes = np.array([12_000_000.7, 12_000_000.0, 88_000_000.25, 0.5])
+    r = calculate_income_tax_batch(incomes)
+    assert r.tax.tolist() == [calculate_income_tax(x)[2] for x in incomes.tolist()]
+    assert r.rate.tolist() == [calculate_income_tax(x)[0] for x in incomes.tolist()]
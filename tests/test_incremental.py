@@ -0,0 +1,106 @@
+# tests/test_incremental.py
+# 데이터셋 편집 – 변경 기록(changes_since)으로 갱신한 인덱스·이름별 합계가 새로 만든 것과 같은지, 내준 배열은 바뀌지 않는지
+
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from taxdata import dataset as dataset_module
+from taxdata.dataset import TaxDataset
+from taxdata.query import DatasetIndex
+from taxdata.stats import NameTotals, TaxStats
+
+
+def _small():
+    return TaxDataset.from_frame(pd.DataFrame({"name": list("abcde"), "income": [5, 3, 7, 1, 2],
+                                               "tax": [1, 1, 1, 0, 0]}))
+
+
+def _edit(ds, rng, step):
+    """무작위 편집 한 번 – 추가 / 여러 행 추가 / 수정 / 삭제"""
+    op = rng.random()
+    if op < 0.4 or len(ds) < 3:
+        ds.append(rng.choice("abcdefgh"), rng.randint(1, 10 ** rng.randint(1, 6)), rng.randint(0, 100))
+    elif op < 0.5:
+        k = rng.randint(1, 300)
+        ds.extend(pd.DataFrame({"name": [rng.choice("xyzab") + str(rng.randint(0, 3)) for _ in range(k)],
+                                "income": [rng.randint(1, 30) for _ in range(k)],
+                                "tax": [rng.randint(0, 50) for _ in range(k)]}))
+    elif op < 0.8:
+        ds.update(rng.randrange(len(ds)), name=rng.choice([None, "a", f"q{step % 5}"]),
+                  income=rng.choice([None, rng.randint(0, 12), 10 ** 7]), tax=rng.choice([None, 3]))
+    else:
+        ds.delete(rng.sample(range(len(ds)), rng.randint(1, min(5, len(ds) - 1))))
+
+
+def _assert_same_index(a, b):
+    assert a.n == b.n and a.fingerprint == b.fingerprint
+    for column in ("income", "tax"):
+        assert np.array_equal(a.order(column), b.order(column)), column
+        assert a.count(column, 3, 20) == b.count(column, 3, 20)
+        assert np.array_equal(a.top_k(column, 5), b.top_k(column, 5))
+        for x, y in zip(a.histogram(column), b.histogram(column)):
+            assert np.array_equal(x, y), column
+    for name in ("a", "b", "q0", "x1"):
+        assert np.array_equal(a.rows_of(name), b.rows_of(name)), name
+
+
+def test_index_and_totals_follow_edits():
+    rng = random.Random(2)
+    ds = _small()
+    index, totals, version = DatasetIndex(ds), NameTotals.from_dataset(ds), ds.version
+    for step in range(600):
+        _edit(ds, rng, step)
+        if step % rng.randint(1, 9) == 0:
+            deltas = ds.changes_since(version)
+            index, totals, version = index.updated(ds, deltas), totals.updated(ds, deltas), ds.version
+            _assert_same_index(index, DatasetIndex(ds))
+            fresh = NameTotals.from_dataset(ds)
+            for field in ("count", "income", "tax"):
+                assert np.array_equal(getattr(totals, field), getattr(fresh, field)), field
+
+
+def test_stats_and_fingerprint_follow_edits(monkeypatch):
+    monkeypatch.setattr(dataset_module, "BLOCK_ROWS", 64)     # 블록 경계를 자주 넘도록
+    rng = random.Random(1)
+    ds = _small()
+    ds.enable_tax_rate()
+    for step in range(800):
+        _edit(ds, rng, step)
+        if step % 25 == 0:
+            df = pd.DataFrame({"name": [ds.categories[c] for c in ds.name_codes],
+                               "income": ds.income.astype(np.int64), "tax": ds.tax.astype(np.int64)})
+            assert ds.stats.state() == TaxStats.from_frame(df).state()
+            fresh = TaxDataset.from_columns(ds.name_codes.copy(), ds.income.copy(), ds.tax.copy(),
+                                            ds.categories, ds.stats)
+            assert fresh.fingerprint() == ds.fingerprint()
+            with np.errstate(all="ignore"):
+                rates = np.round(df["tax"] / df["income"] * 100, 2).to_numpy()
+            assert np.array_equal(ds.tax_rate(), rates, equal_nan=True)
+
+
+def test_changes_since_unknown_version_means_rebuild():
+    ds = _small()
+    assert ds.changes_since(ds.version) == []
+    assert ds.changes_since(ds.version + 1) is None
+
+
+def test_exported_arrays_are_copy_on_write():
+    ds = _small()
+    ds.enable_tax_rate()
+    frame, income = ds.frame(), ds.income
+    snapshot = frame.copy(deep=True)
+    ds.update(1, income=100)
+    ds.update(2, tax=9)
+    ds.update(0, name="z")
+    assert frame.equals(snapshot)
+    assert income.tolist() == [5, 3, 7, 1, 2]
+
+    buffer = ds._income
+    ds.update(3, income=50)                 # 내준 배열을 한 번 복사한 뒤로는 제자리 수정
+    assert ds._income is buffer
+    assert ds.frame()["income"].tolist() == [5, 100, 7, 50, 2]
+    assert ds.frame()["tax"].tolist() == [1, 1, 9, 0, 0]
+    assert list(ds.frame()["name"].astype(str)) == list("zbcde")
@@ -0,0 +1,96 @@
+# tests/test_service.py
+# 계산 서비스 – 입력 검증(400), 예상하지 못한 오류(500), 마이크로배치에서 한 행의 실패가 다른 요청에 번지지 않는지
+
+import asyncio
+import json
+
+import pytest
+
+from taxcore import service
+from taxcore.service import MAX_AMOUNT, CalcService, MicroBatcher, RequestError, _int_field
+
+
+def call(app, method, path, body=None):
+    """ASGI 앱을 한 번 호출해 (상태 코드, JSON 본문) 반환"""
+    raw = json.dumps(body).encode() if not isinstance(body, bytes) else body
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": raw, "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    async def run():
+        await app({"type": "http", "method": method, "path": path}, receive, send)
+        for batcher in app.batchers.values():
+            await batcher.close()
+
+    asyncio.run(run())
+    return sent[0]["status"], json.loads(sent[1]["body"])
+
+
+@pytest.mark.parametrize("value", [
+    -1, 1.5, "100", True, None, float("inf"), float("nan"), 1e30, 10 ** 19, MAX_AMOUNT + 1,
+])
+def test_int_field_rejects(value):
+    with pytest.raises(RequestError) as e:
+        _int_field({"income": value}, "income")
+    assert e.value.status == 400
+
+
+@pytest.mark.parametrize("value, expected", [(0, 0), (12_000_000, 12_000_000), (3.0, 3), (MAX_AMOUNT, MAX_AMOUNT)])
+def test_int_field_accepts(value, expected):
+    assert _int_field({"income": value}, "income") == expected
+
+
+@pytest.mark.parametrize("batching", [True, False])
+def test_single_request(batching):
+    status, body = call(CalcService(batching=batching), "POST", "/v1/income-tax", {"income": 50_000_000})
+    assert status == 200 and body["tax"] == 6_780_000
+
+
+@pytest.mark.parametrize("path, body, status", [
+    ("/v1/income-tax", {"income": 1e30}, 400),
+    ("/v1/income-tax", {"income": -5}, 400),
+    ("/v1/eitc", {"income": 1, "household_type": "없음"}, 400),
+    ("/v1/eitc-2025", {"income": MAX_AMOUNT, "household_type": "단독"}, 400),
+    ("/v1/income-tax", b"{", 400),
+    ("/v1/nothing", {}, 404),
+])
+def test_bad_requests(path, body, status):
+    code, payload = call(CalcService(), "POST", path, body)
+    assert code == status and "error" in payload
+
+
+def test_bulk_reports_failing_item():
+    items = [{"income": 1}, {"income": "x"}]
+    status, body = call(CalcService(), "POST", "/v1/income-tax/bulk", {"items": items})
+    assert status == 400 and body["error"].startswith("items[1]:")
+
+
+def test_unexpected_error_is_500(monkeypatch):
+    def broken(rows):
+        raise ZeroDivisionError
+
+    monkeypatch.setitem(service.ENDPOINTS, "income-tax", (service.parse_income_tax, broken))
+    status, body = call(CalcService(batching=False), "POST", "/v1/income-tax", {"income": 1})
+    assert status == 500 and "ZeroDivisionError" in body["error"]
+
+
+def test_micro_batch_isolates_failing_row():
+    def compute(rows):
+        if any(row == "bad" for row in rows):
+            raise ValueError("bad row")
+        return [row * 2 for row in rows]
+
+    async def run():
+        batcher = MicroBatcher(compute, max_delay=0.01)
+        results = await asyncio.gather(*(batcher.submit(row) for row in (1, "bad", 3)),
+                                       return_exceptions=True)
+        await batcher.close()
+        return batcher, results
+
+    batcher, results = asyncio.run(run())
+    assert batcher.batches == 1
+    assert results[0] == 2 and results[2] == 6 and isinstance(results[1], ValueError)
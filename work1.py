@@ -1,45 +1,8 @@
 import streamlit as st
+import plotly.graph_objects as go
 
-# -----------------------------
-# 근로장려금 계산 함수
-# -----------------------------
-def calc_eitc(income: int, household_type: str, age: int) -> int:
-    """
-    소득구간별 근로장려금 계산
-    """
-
-    eitc_table = {
-        '단독':  {'max': 1500000, 'max_start': 0, 'max_end': 400, 'reduce_start': 900, 'reduce_end': 2200},
-        '홑벌이': {'max': 2600000, 'max_start': 0, 'max_end': 700, 'reduce_start': 1700, 'reduce_end': 3600},
-        '맞벌이': {'max': 3000000, 'max_start': 0, 'max_end': 800, 'reduce_start': 2000, 'reduce_end': 4000}
-    }
-
-    if household_type not in eitc_table:
-        raise ValueError("household_type은 '단독', '홑벌이', '맞벌이' 중 하나여야 합니다.")
-
-    info = eitc_table[household_type]
-
-    # 소득 단위 (만원 → 원)
-    income_m = income
-
-    # 구간별 계산
-    if income_m <= info['max_end']:
-        amount = info['max']
-    elif income_m <= info['reduce_start']:
-        amount = info['max']
-    elif income_m <= info['reduce_end']:
-        # 선형 감액
-        ratio = 1 - (income_m - info['reduce_start']) / (info['reduce_end'] - info['reduce_start'])
-        amount = int(info['max'] * ratio)
-    else:
-        amount = 0
-
-    # 65세 이상 추가 10%
-    if age >= 65:
-        amount = int(amount * 1.1)
-
-    return max(amount, 0)
-
+from taxcore.eitc_age import MAN_WON, calc_eitc
+from taxcore.sweep import income_grid, sweep
 
 # -----------------------------
 # Streamlit UI
@@ -68,5 +31,20 @@ if st.button("계산하기"):
     else:
         st.warning("소득이 감액 종료구간을 초과하여 근로장려금을 받을 수 없습니다.")
 
+# 소득별 지급액 곡선 (나이별 1회 계산 후 캐시 – 소득을 바꿔도 재계산 없음)
+@st.cache_data
+def eitc_curves(age):
+    return sweep(income_grid(5000 * MAN_WON, 10 * MAN_WON), age=age, year=2025, schedule="age_bonus")
+
+with st.expander("📈 소득별 근로장려금 곡선", expanded=False):
+    curve = eitc_curves(age).curve(household)
+    point = calc_eitc(income, household, age)
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=curve["income"] // MAN_WON, y=curve["eitc"], name="근로장려금", mode="lines"))
+    fig.add_trace(go.Scatter(x=[income], y=[point], name="현재 입력", mode="markers",
+                             marker=dict(size=12, color="red")))
+    fig.update_layout(xaxis_title="연소득 (만원)", yaxis_title="근로장려금 (원)", legend=dict(orientation="h"))
+    st.plotly_chart(fig, use_container_width=True)
+
 st.divider()
 st.caption("※ 본 계산기는 참고용입니다. 실제 지급액은 국세청 심사 결과에 따라 달라질 수 있습니다.")